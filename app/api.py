@@ -5,6 +5,7 @@ This module defines the API routes and handlers.
 import logging
 from typing import Optional, Dict, Any, List, Union
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 from starlette.status import HTTP_400_BAD_REQUEST, HTTP_500_INTERNAL_SERVER_ERROR
 from starlette.responses import JSONResponse
 
@@ -26,7 +27,7 @@ router = APIRouter()
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    db_connections = test_db_connections()
+    db_connections = await run_in_threadpool(test_db_connections)
     return {
         "status": "success" if any(db_connections.values()) else "error",
         "message": "API is operational",
@@ -51,7 +52,8 @@ async def agent_query(
             )
 
         # Execute the translated SQL
-        result = await execute_parameterized_query(
+        result = await run_in_threadpool(
+            execute_parameterized_query,
             db="postgres",
             query=translation["sql"],
             params=translation.get("parameters", {}),
@@ -128,8 +130,11 @@ async def run_sql_query(
                 params = extracted_params
                 logger.info(f"Extracted {len(params)} parameters from query")
         
-        # Execute the query
-        result = execute_parameterized_query(
+        # Execute the query in a worker thread; the database drivers block,
+        # and calling them directly would stall every other request on the
+        # event loop until the query finished
+        result = await run_in_threadpool(
+            execute_parameterized_query,
             db=db,
             query=query,
             params=params,
@@ -234,7 +239,8 @@ async def run_parameterized_query(
             logger.info(f"Using PostgreSQL-optimized executor for qmark style with {len(param_list)} parameters")
             
             # Use our specialized executor that handles the parameter conversion properly
-            result = execute_query_with_explicit_params(
+            result = await run_in_threadpool(
+                execute_query_with_explicit_params,
                 db=db,
                 query=query,
                 params=param_list,
@@ -248,7 +254,8 @@ async def run_parameterized_query(
             if db.lower() == "postgres":
                 logger.info(f"Using PostgreSQL-optimized executor for named style")
                 # PostgreSQL requires special handling for named parameters
-                result = execute_query_with_explicit_params(
+                result = await run_in_threadpool(
+                    execute_query_with_explicit_params,
                     db=db,
                     query=query,
                     params=params,
@@ -257,7 +264,8 @@ async def run_parameterized_query(
                 )
             else:
                 # For other databases, use the regular handler
-                result = execute_parameterized_query(
+                result = await run_in_threadpool(
+                    execute_parameterized_query,
                     db=db,
                     query=query,
                     params=params,
@@ -267,7 +275,8 @@ async def run_parameterized_query(
         else:
             # For other styles, pass as list
             param_list = list(params.values()) if isinstance(params, dict) else params
-            result = execute_parameterized_query(
+            result = await run_in_threadpool(
+                execute_parameterized_query,
                 db=db,
                 query=query,
                 params=param_list,
@@ -18,11 +18,41 @@ from flask import Blueprint, jsonify, request
 from app_setup import app, db
 from models import Account, PropertyImage, Property, Parcel
 from property_statistics import generate_all_statistics
-from sqlalchemy import func
+from sqlalchemy import String, event, func
+from app.cache import cache, invalidate_cache
 
 # Create blueprint
 statistics_api = Blueprint('statistics_api', __name__)
 
+# How long the filter option lists are reused before being queried again
+FILTER_OPTIONS_TTL = 300  # seconds
+
+@cache(ttl_seconds=FILTER_OPTIONS_TTL)
+def _distinct_account_values(column_name):
+    """
+    Get the distinct non-empty values of an Account column.
+    
+    Args:
+        column_name: Name of the Account column
+        
+    Returns:
+        Tuple of distinct values, so the cached result can't be modified
+    """
+    column = getattr(Account, column_name)
+    conditions = [column.isnot(None)]
+    # Only text columns can hold empty strings; comparing an integer column
+    # such as assessment_year with '' is an error on PostgreSQL
+    if isinstance(column.type, String):
+        conditions.append(column != '')
+    rows = db.session.query(column).filter(*conditions).distinct().all()
+    return tuple(value for (value,) in rows)
+
+@event.listens_for(db.session, 'after_flush')
+def _invalidate_filter_options(session, flush_context):
+    """Drop the cached filter options when accounts are written through the ORM."""
+    if any(isinstance(obj, Account) for obj in (*session.new, *session.dirty, *session.deleted)):
+        invalidate_cache('_distinct_account_values')
+
 @statistics_api.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """
@@ -69,16 +99,11 @@ def get_property_types():
     try:
         with app.app_context():
             # Query distinct property types
-            property_types = db.session.query(Account.property_type).filter(
-                Account.property_type.isnot(None)
-            ).distinct().all()
-            
-            # Extract values from result tuples
-            property_types = [pt[0] for pt in property_types if pt[0]]
+            property_types = _distinct_account_values('property_type')
             
             return jsonify({
                 'status': 'success',
-                'property_types': property_types
+                'property_types': list(property_types)
             })
             
     except Exception as e:
@@ -99,16 +124,11 @@ def get_cities():
     try:
         with app.app_context():
             # Query distinct cities
-            cities = db.session.query(Account.property_city).filter(
-                Account.property_city.isnot(None)
-            ).distinct().all()
-            
-            # Extract values from result tuples
-            cities = [c[0] for c in cities if c[0]]
+            cities = _distinct_account_values('property_city')
             
             return jsonify({
                 'status': 'success',
-                'cities': cities
+                'cities': list(cities)
             })
             
     except Exception as e:
@@ -129,16 +149,11 @@ def get_assessment_years():
     try:
         with app.app_context():
             # Query distinct assessment years
-            years = db.session.query(Account.assessment_year).filter(
-                Account.assessment_year.isnot(None)
-            ).distinct().all()
-            
-            # Extract values from result tuples
-            years = [y[0] for y in years if y[0]]
+            years = _distinct_account_values('assessment_year')
             
             return jsonify({
                 'status': 'success',
-                'years': years
+                'years': list(years)
             })
             
     except Exception as e:
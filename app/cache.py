@@ -2,11 +2,14 @@
 This module provides caching utilities for the API.
 """
 
+import hashlib
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, cast
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -16,8 +19,48 @@ logger = logging.getLogger(__name__)
 F = TypeVar('F', bound=Callable[..., Any])
 
 # Global cache storage
-# Structure: {key: (value, expiry_timestamp)}
-_cache: Dict[str, Tuple[Any, float]] = {}
+# Structure: {key: (value, expiry_timestamp)}, least recently used first
+_cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Most entries kept per process; the least recently used are evicted first,
+# so keys that are never read again can't grow the cache without bound
+MAX_CACHE_ENTRIES = 1024
+
+def _cache_get(cache_key: str) -> Optional[Tuple[Any, float]]:
+    """
+    Look up an unexpired cache entry, marking it as recently used.
+    
+    Args:
+        cache_key: Key of the entry
+        
+    Returns:
+        (value, expiry) tuple, or None if the key is missing or expired
+    """
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+        if entry is None:
+            return None
+        if time.time() >= entry[1]:
+            del _cache[cache_key]
+            return None
+        _cache.move_to_end(cache_key)
+        return entry
+
+def _cache_set(cache_key: str, value: Any, expiry: float):
+    """
+    Store a cache entry, evicting the least recently used beyond the limit.
+    
+    Args:
+        cache_key: Key of the entry
+        value: Value to store
+        expiry: Time at which the entry expires
+    """
+    with _cache_lock:
+        _cache[cache_key] = (value, expiry)
+        _cache.move_to_end(cache_key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
 
 def cache(ttl_seconds: int = 300):
     """
@@ -39,25 +82,108 @@ def cache(ttl_seconds: int = 300):
             cache_key = ":".join(key_parts)
             
             # Check if result is in cache and not expired
-            if cache_key in _cache:
-                value, expiry = _cache[cache_key]
-                if time.time() < expiry:
-                    logger.debug(f"Cache hit for {cache_key}")
-                    return value
-                else:
-                    # Remove expired cache entry
-                    logger.debug(f"Cache expired for {cache_key}")
-                    del _cache[cache_key]
+            entry = _cache_get(cache_key)
+            if entry is not None:
+                logger.debug(f"Cache hit for {cache_key}")
+                return entry[0]
             
             # Execute function and cache result
             result = func(*args, **kwargs)
-            _cache[cache_key] = (result, time.time() + ttl_seconds)
+            _cache_set(cache_key, result, time.time() + ttl_seconds)
             logger.debug(f"Cached result for {cache_key} with TTL {ttl_seconds}s")
             
             return result
         return cast(F, wrapper)
     return decorator
 
+# Extra seconds a client may keep showing a stale response while it revalidates
+STALE_WHILE_REVALIDATE = 60
+
+def _set_cache_control(response, expiry: float, private: bool = False):
+    """
+    Set Cache-Control so clients expire a response when the server cache does.
+    
+    Args:
+        response: Flask response to update
+        expiry: Time at which the server-side cache entry expires
+        private: Whether the response depends on the caller's API key
+    """
+    if private:
+        response.cache_control.private = True
+    else:
+        response.cache_control.public = True
+    response.cache_control.max_age = max(round(expiry - time.time()), 0)
+    response.cache_control.stale_while_revalidate = STALE_WHILE_REVALIDATE
+    response.vary.add('X-API-Key')
+
+def cached_response(ttl_seconds: int = 300, query_args: Sequence[str] = ()):
+    """
+    Cache decorator for idempotent Flask GET views.
+    
+    Responses are keyed on the request path, the query arguments the view
+    reads and a hash of the caller's X-API-Key header; other arguments are
+    ignored, so they can't be used to create unlimited entries. Only
+    successful, non-streamed GET responses are stored; every response
+    carries an X-Cache header of "hit" or "miss".
+    Cached responses also carry an ETag, and a matching If-None-Match gets
+    a 304 Not Modified without a body. Cache-Control lets browsers and
+    proxies reuse the response for the rest of its time in this cache.
+    
+    Args:
+        ttl_seconds: Time to live in seconds for cached responses
+        query_args: Names of the query arguments that change the response
+        
+    Returns:
+        Decorated view function
+    """
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            from flask import make_response, request
+            
+            if request.method != 'GET':
+                return func(*args, **kwargs)
+            
+            api_key = request.headers.get('X-API-Key', '')
+            key_parts = [
+                "response",
+                request.path,
+                "&".join(f"{name}={value}" for name in query_args for value in request.args.getlist(name)),
+                hashlib.sha1(api_key.encode('utf-8')).hexdigest() if api_key else ""
+            ]
+            cache_key = ":".join(key_parts)
+            
+            entry = _cache_get(cache_key)
+            if entry is not None:
+                (body, status, headers), expiry = entry
+                logger.debug(f"Response cache hit for {cache_key}")
+                response = make_response(body, status)
+                response.headers.update(headers)
+                response.headers['X-Cache'] = 'hit'
+                _set_cache_control(response, expiry, private=bool(api_key))
+                return response.make_conditional(request)
+            
+            response = make_response(func(*args, **kwargs))
+            # Buffering a streamed body to store it would defeat the streaming
+            if response.status_code != 200 or response.is_streamed:
+                response.headers['X-Cache'] = 'miss'
+                return response
+            
+            body = response.get_data()
+            response.set_etag(hashlib.md5(body).hexdigest())
+            headers = {
+                name: response.headers[name]
+                for name in ('Content-Type', 'Content-Encoding', 'ETag')
+                if name in response.headers
+            }
+            expiry = time.time() + ttl_seconds
+            _cache_set(cache_key, (body, response.status_code, headers), expiry)
+            response.headers['X-Cache'] = 'miss'
+            _set_cache_control(response, expiry, private=bool(api_key))
+            return response.make_conditional(request)
+        return cast(F, wrapper)
+    return decorator
+
 def invalidate_cache(prefix: Optional[str] = None):
     """
     Invalidate cache entries with the given prefix or all if prefix is None.
@@ -65,16 +191,17 @@ def invalidate_cache(prefix: Optional[str] = None):
     Args:
         prefix: Optional prefix to match cache keys
     """
-    global _cache
     if prefix:
         # Remove cache entries that start with the prefix
-        keys_to_remove = [k for k in _cache.keys() if k.startswith(prefix)]
-        for k in keys_to_remove:
-            del _cache[k]
+        with _cache_lock:
+            keys_to_remove = [k for k in _cache.keys() if k.startswith(prefix)]
+            for k in keys_to_remove:
+                del _cache[k]
         logger.info(f"Invalidated {len(keys_to_remove)} cache entries with prefix '{prefix}'")
     else:
         # Clear the entire cache
-        _cache.clear()
+        with _cache_lock:
+            _cache.clear()
         logger.info("Invalidated all cache entries")
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -85,12 +212,14 @@ def get_cache_stats() -> Dict[str, Any]:
         Dictionary with cache statistics
     """
     current_time = time.time()
-    total_entries = len(_cache)
-    valid_entries = sum(1 for _, expiry in _cache.values() if current_time < expiry)
+    with _cache_lock:
+        entries = list(_cache.values())
+    total_entries = len(entries)
+    valid_entries = sum(1 for _, expiry in entries if current_time < expiry)
     expired_entries = total_entries - valid_entries
     
     # Calculate memory usage (rough estimate)
-    memory_usage = sum(len(str(value)) + 8 for value, _ in _cache.values())  # 8 bytes for timestamp
+    memory_usage = sum(len(str(value)) + 8 for value, _ in entries)  # 8 bytes for timestamp
     
     return {
         "total_entries": total_entries,
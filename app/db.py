@@ -4,20 +4,25 @@ It handles parameter extraction, query validation, and secure execution against
 PostgreSQL and MSSQL databases.
 """
 
+import hashlib
 import logging
 import re
+import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.extensions
+import psycopg2.pool
 from flask import current_app
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
+from app.settings import settings
 from app.validators import (DANGEROUS_KEYWORDS, SQL_INJECTION_PATTERNS,
                            validate_query, validate_query_parameters)
 
@@ -61,9 +66,38 @@ def get_connection_string(db: str = "postgres") -> str:
         raise ValueError(f"Unsupported database type: {db}")
 
 
+# Engines and psycopg2 pools by connection string, created on first use.
+# Queries run concurrently in the API's worker threads, so each reuses a
+# pooled connection instead of connecting per query. Size DB_POOL_SIZE to the
+# number of queries expected in flight at once
+_engines = {}
+_postgres_pools = {}
+_pool_lock = threading.Lock()
+
+# (pool, slots) each checked-out psycopg2 connection came from, by id()
+_checked_out = {}
+
+# Most server-side prepared statements kept on one pooled connection
+MAX_PREPARED_STATEMENTS = 100
+
+# psycopg2 placeholders, renumbered as $1, $2, ... in PREPARE templates
+_FORMAT_PLACEHOLDER_RE = re.compile(r"%s")
+
+
+class PreparedStatementConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers the statements prepared on it."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
 def create_db_engine(db: str = "postgres"):
     """
-    Create SQLAlchemy engine for the specified database.
+    Get the SQLAlchemy engine for the specified database.
+    
+    The engine, and its connection pool, is created once per connection
+    string and shared by later calls.
     
     Args:
         db: The database type ('postgres' or 'mssql')
@@ -72,14 +106,139 @@ def create_db_engine(db: str = "postgres"):
         Engine: SQLAlchemy engine object
     """
     conn_string = get_connection_string(db)
-    engine = create_engine(
-        conn_string,
-        pool_pre_ping=True,
-        pool_recycle=300
-    )
+    with _pool_lock:
+        engine = _engines.get(conn_string)
+        if engine is None:
+            engine = create_engine(
+                conn_string,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=0,
+                pool_pre_ping=True,
+                pool_recycle=settings.DB_POOL_RECYCLE
+            )
+            _engines[conn_string] = engine
     return engine
 
 
+def get_postgres_connection():
+    """
+    Check out a psycopg2 connection from the PostgreSQL pool.
+    
+    Blocks while all DB_POOL_SIZE connections are in use. Hand the connection
+    back with release_postgres_connection().
+    
+    Returns:
+        connection: psycopg2 connection object
+    """
+    conn_string = get_connection_string("postgres")
+    
+    # Strip sqlalchemy prefix if present
+    if conn_string.startswith('postgresql://'):
+        conn_string = conn_string.replace('postgresql://', '')
+    elif conn_string.startswith('postgresql+psycopg2://'):
+        conn_string = conn_string.replace('postgresql+psycopg2://', '')
+    
+    with _pool_lock:
+        if conn_string not in _postgres_pools:
+            # ThreadedConnectionPool raises instead of waiting when it is
+            # exhausted, so callers queue on a semaphore for a free slot
+            _postgres_pools[conn_string] = (
+                psycopg2.pool.ThreadedConnectionPool(
+                    1, settings.DB_POOL_SIZE, conn_string,
+                    connection_factory=PreparedStatementConnection
+                ),
+                threading.BoundedSemaphore(settings.DB_POOL_SIZE)
+            )
+        pool, slots = _postgres_pools[conn_string]
+    
+    slots.acquire()
+    try:
+        conn = pool.getconn()
+    except Exception:
+        slots.release()
+        raise
+    with _pool_lock:
+        _checked_out[id(conn)] = (pool, slots)
+    return conn
+
+
+def execute_prepared(cursor, query: str, params: Optional[Union[List[Any], Tuple[Any, ...]]] = None):
+    """
+    Execute a query with positional %s parameters as a prepared statement.
+    
+    The statement is prepared on the cursor's connection the first time its
+    text is seen, under a name derived from a hash of the text, and later
+    calls with the same shape but different values skip parsing and
+    planning. Queries without positional parameters, with other '%'
+    characters, or beyond the connection's MAX_PREPARED_STATEMENTS run as
+    plain statements.
+    
+    Args:
+        cursor: Cursor on a connection from get_postgres_connection()
+        query: SQL query with %s placeholders
+        params: Values for the placeholders
+    """
+    conn = cursor.connection
+    prepared = getattr(conn, "prepared_statements", None)
+    if (prepared is None or not isinstance(params, (list, tuple)) or not params
+            or query.count("%s") != len(params) or query.count("%") != len(params)):
+        cursor.execute(query, params or None)
+        return
+    
+    name = "ps_" + hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+    if name not in prepared:
+        if len(prepared) >= MAX_PREPARED_STATEMENTS:
+            cursor.execute(query, params)
+            return
+        placeholders = iter(range(1, len(params) + 1))
+        template = _FORMAT_PLACEHOLDER_RE.sub(lambda match: f"${next(placeholders)}", query)
+        try:
+            cursor.execute(f"PREPARE {name} AS {template}")
+        except psycopg2.Error as e:
+            # The server couldn't prepare it (e.g. a parameter type it can't
+            # infer) and the error aborted the connection's transaction, so
+            # roll back and run the query as a plain statement. Queries on
+            # these connections are never committed (release_postgres_connection
+            # rolls back), so the rollback can't discard earlier work
+            logger.debug(f"Could not prepare statement, executing directly: {str(e)}")
+            conn.rollback()
+            cursor.execute(query, params)
+            return
+        prepared.add(name)
+    
+    cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
+
+def release_postgres_connection(conn):
+    """
+    Return a connection from get_postgres_connection() to its pool.
+    
+    Any open transaction is rolled back first; connections that have been
+    closed or broken are discarded instead of reused.
+    
+    Args:
+        conn: psycopg2 connection to release
+    """
+    with _pool_lock:
+        pool, slots = _checked_out.pop(id(conn))
+    broken = bool(conn.closed)
+    if not broken:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+    pool.putconn(conn, close=broken)
+    slots.release()
+
+
+# Literal patterns for parse_for_parameters, compiled once at import since
+# it runs on every query the API executes
+_STRING_LITERAL_RE = re.compile(r"'([^'\\]*(\\.[^'\\]*)*)'")  # String literals with proper escape handling
+_NUMERIC_PATTERN = r"\b(\d+\.?\d*)\b"  # Numeric literals
+_CONDITION_KEYWORDS = r"\b(WHERE|AND|OR|IN|=|>|<|>=|<=|!=|<>|BETWEEN)\b"
+_CONDITION_NUMBER_RE = re.compile(rf"{_CONDITION_KEYWORDS}\s+{_NUMERIC_PATTERN}", re.IGNORECASE)
+
+
 def parse_for_parameters(sql_query: str) -> Tuple[str, List[Any]]:
     """
     Extract parameters from a SQL query and replace them with placeholders.
@@ -92,27 +251,16 @@ def parse_for_parameters(sql_query: str) -> Tuple[str, List[Any]]:
             - The SQL query with string literals replaced by placeholders
             - List of extracted parameter values
     """
-    # Regular expressions for different types of literals
-    string_pattern = r"'([^'\\]*(\\.[^'\\]*)*)'"  # Matches string literals with proper escape handling
-    numeric_pattern = r"\b(\d+\.?\d*)\b"  # Matches numeric literals
-    
-    # Extract and replace string literals
-    string_params = re.findall(string_pattern, sql_query)
-    string_values = [match[0] for match in string_params]  # Extract the matched string values
-    
-    # Replace string literals with placeholders
-    modified_query = sql_query
-    for value in string_values:
-        escaped_value = value.replace('\\', '\\\\').replace('.', '\\.').replace('+', '\\+')
-        modified_query = re.sub(f"'{escaped_value}'", "%s", modified_query, 1)
+    # Extract the string literals and replace each with a placeholder
+    string_values = [match.group(1) for match in _STRING_LITERAL_RE.finditer(sql_query)]
+    modified_query = _STRING_LITERAL_RE.sub("%s", sql_query)
     
     # Extract and replace numeric literals after WHERE, AND, OR, IN, etc.
     # This is a heuristic to avoid replacing table names, column references, etc.
-    condition_keywords = r"\b(WHERE|AND|OR|IN|=|>|<|>=|<=|!=|<>|BETWEEN)\b"
     potential_params = []
     
     # Match all numbers following a condition keyword, allowing for whitespace
-    number_matches = re.finditer(rf"{condition_keywords}\s+{numeric_pattern}", modified_query, re.IGNORECASE)
+    number_matches = _CONDITION_NUMBER_RE.finditer(modified_query)
     
     for match in number_matches:
         keyword_end = match.start(2)  # End of the keyword
@@ -259,16 +407,7 @@ def execute_query_with_explicit_params(db: str, query: str, params: Union[List[A
         # Handle different database types
         if db.lower() == "postgres":
             # Get a PostgreSQL connection
-            conn_string = get_connection_string(db)
-            
-            # Strip sqlalchemy prefix if present
-            if conn_string.startswith('postgresql://'):
-                conn_string = conn_string.replace('postgresql://', '')
-            elif conn_string.startswith('postgresql+psycopg2://'):
-                conn_string = conn_string.replace('postgresql+psycopg2://', '')
-                
-            # Create connection
-            conn = psycopg2.connect(conn_string)
+            conn = get_postgres_connection()
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
             try:
@@ -349,7 +488,7 @@ def execute_query_with_explicit_params(db: str, query: str, params: Union[List[A
                 
             finally:
                 cursor.close()
-                conn.close()
+                release_postgres_connection(conn)
                 
         elif db.lower() == "mssql":
             # Use SQLAlchemy for MSSQL
@@ -567,6 +706,7 @@ def execute_parameterized_query(db: str, query: str, params: Optional[Union[List
         # Add pagination if page_size is specified
         original_query = query
         count_query = None
+        query_params = params
         
         if page_size:
             # For PostgreSQL
@@ -574,9 +714,19 @@ def execute_parameterized_query(db: str, query: str, params: Optional[Union[List
                 # Create a count query to get total records
                 count_query = f"SELECT COUNT(*) AS total_count FROM ({original_query}) AS count_subquery"
                 
-                # Add pagination to the original query
+                # Add pagination to the original query. The page bounds are
+                # bound parameters rather than inlined, so every page of a
+                # query runs the same prepared statement
                 offset = (page - 1) * page_size
-                query = f"{original_query} LIMIT {page_size} OFFSET {offset}"
+                if isinstance(params, dict):
+                    query = f"{original_query} LIMIT %(page_limit)s OFFSET %(page_offset)s"
+                    query_params = {**params, "page_limit": page_size, "page_offset": offset}
+                else:
+                    # Without parameters of its own, the query's literal '%'
+                    # characters must now be escaped
+                    base_query = original_query if params else original_query.replace("%", "%%")
+                    query = f"{base_query} LIMIT %s OFFSET %s"
+                    query_params = [*(params or []), page_size, offset]
             
             # For MSSQL (using SQL Server 2012+ pagination)
             elif db == "mssql":
@@ -595,22 +745,14 @@ def execute_parameterized_query(db: str, query: str, params: Optional[Union[List
         # Execute query using the appropriate database driver
         if db == "postgres":
             # Prepare connection
-            conn_string = get_connection_string(db)
-            
-            # Strip sqlalchemy prefix if present
-            if conn_string.startswith('postgresql://'):
-                conn_string = conn_string.replace('postgresql://', '')
-            elif conn_string.startswith('postgresql+psycopg2://'):
-                conn_string = conn_string.replace('postgresql+psycopg2://', '')
-                
-            # Create connection
-            conn = psycopg2.connect(conn_string)
+            conn = get_postgres_connection()
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
             
-            # Execute the query
+            # Execute the query, reusing the connection's prepared statement
+            # for queries of the same shape
             try:
-                if params:
-                    cursor.execute(query, params)
+                if query_params:
+                    execute_prepared(cursor, query, query_params)
                 else:
                     cursor.execute(query)
                 
@@ -625,14 +767,14 @@ def execute_parameterized_query(db: str, query: str, params: Optional[Union[List
                 total_pages = None
                 
                 if count_query:
-                    cursor.execute(count_query, params)
+                    execute_prepared(cursor, count_query, params)
                     count_result = cursor.fetchone()
                     total_records = count_result["total_count"]
                     total_pages = (total_records + page_size - 1) // page_size
                 
             finally:
                 cursor.close()
-                conn.close()
+                release_postgres_connection(conn)
             
         elif db == "mssql":
             # Use SQLAlchemy for MSSQL
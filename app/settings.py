@@ -63,7 +63,11 @@ class Settings(BaseSettings):
     DB_POSTGRES_URL: str = os.environ.get("DATABASE_URL", "")
     DB_MSSQL_URL: Optional[str] = os.environ.get("MSSQL_URL", None)
     DB_CONNECTION_TIMEOUT: int = 10  # Seconds to wait for DB connection
-    DB_POOL_SIZE: int = 10  # Maximum number of connections in pool
+    # Connections per API worker process. The FASTAPI_DB_CONNECTIONS budget
+    # (default 40, leaving the rest of PostgreSQL's 100 to the Flask service)
+    # is split between the uvicorn workers, counted as in process_utils
+    DB_POOL_SIZE: int = max(2, int(os.environ.get("FASTAPI_DB_CONNECTIONS", "40"))
+                            // int(os.environ.get("FASTAPI_WORKERS", max(2, os.cpu_count() or 2))))
     DB_POOL_RECYCLE: int = 300  # Recycle connections after 5 minutes
     
     # Performance settings
@@ -4,32 +4,108 @@ This module sets up the Flask application and database connection.
 
 import os
 import logging
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Try to import orjson if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.info("orjson package not installed. Using the standard library JSON encoder.")
+
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
     pass
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes with orjson.
+    
+    Output matches Flask's default provider: keys are sorted, dates are
+    passed through to Flask's HTTP-date formatting, and Decimal and other
+    extra types go through the same default() hook. numpy scalars and
+    arrays left in pandas results are encoded natively. Anything
+    orjson cannot encode falls back to the standard library encoder.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Create SQLAlchemy instance
 db = SQLAlchemy(model_class=Base)
 
 # Create Flask application
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 # Configure database connection
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
+# Pre-ping costs a round trip on every connection checkout. It guards against
+# the hosted database dropping idle connections; where connections are stable,
+# set DB_POOL_PRE_PING=false and rely on pool_recycle (DB_POOL_RECYCLE seconds)
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
+    "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "300")),
+    "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
 }
 
+# Threads that run dashboard queries beside the request threads, each in its
+# own application context and so on its own connection
+# (routes._query_executor and property_statistics._statistics_executor)
+DASHBOARD_QUERY_THREADS = 4
+STATISTICS_QUERY_THREADS = 3
+
+# Size the pool for gunicorn's threaded workers. A request runs its queries in
+# sequence on one session, so the pool holds one connection per worker thread
+# (GUNICORN_THREADS, as in gunicorn.conf.py) plus one per query executor
+# thread. A streamed export reads on a second connection of its own while the
+# body is sent, which the overflow of one per worker thread covers.
+# gunicorn.conf.py caps the worker count so that every worker's pool and
+# overflow fit within FLASK_DB_CONNECTIONS. The FLASK_ prefix keeps these
+# apart from the FastAPI service's DB_POOL_SIZE (app/settings.py).
+# SQLite uses its own single-connection pools that reject these options.
+if not (app.config["SQLALCHEMY_DATABASE_URI"] or "").startswith("sqlite"):
+    _request_threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        "pool_size": int(os.environ.get(
+            "FLASK_DB_POOL_SIZE",
+            _request_threads + DASHBOARD_QUERY_THREADS + STATISTICS_QUERY_THREADS
+        )),
+        "max_overflow": int(os.environ.get("FLASK_DB_MAX_OVERFLOW", _request_threads)),
+        "pool_timeout": int(os.environ.get("FLASK_DB_POOL_TIMEOUT", "30")),
+    })
+
+# With psycopg2, batch every executemany(): INSERTs are sent as multi-row
+# VALUES pages of DB_INSERT_PAGE_SIZE rows, and other statements through
+# execute_batch, instead of one round trip per row
+if app.config["SQLALCHEMY_DATABASE_URI"] and make_url(app.config["SQLALCHEMY_DATABASE_URI"]).get_driver_name() == "psycopg2":
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"].update({
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": int(os.environ.get("DB_INSERT_PAGE_SIZE", "1000")),
+    })
+
 # Initialize SQLAlchemy with Flask app
 db.init_app(app)
 
@@ -38,4 +114,46 @@ def create_tables():
     logger.info("Creating database tables if they don't exist")
     with app.app_context():
         db.create_all()
-    logger.info("Database tables initialized")
\ No newline at end of file
+        create_indexes()
+        create_trigram_indexes()
+    logger.info("Database tables initialized")
+
+def create_indexes():
+    """
+    Create any model indexes missing from existing tables.
+    
+    create_all() skips tables that already exist, so indexes added to the
+    models later would otherwise never reach a deployed database.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+# Trigram indexes let ILIKE '%term%' searches use an index on PostgreSQL
+# instead of scanning the whole table; name -> (table, column)
+TRIGRAM_INDEXES = {
+    "idx_account_owner_trgm": ("accounts", "owner_name"),
+    "idx_property_image_property_id_trgm": ("property_images", "property_id"),
+    "idx_parcel_parcel_id_trgm": ("parcels", "parcel_id"),
+}
+
+def create_trigram_indexes():
+    """
+    Create the pg_trgm extension and trigram indexes on PostgreSQL.
+    
+    Other databases have no equivalent, so this is a no-op there. Failures
+    (e.g. no permission to create the extension) are logged, not raised,
+    since searches still work without the indexes.
+    """
+    if db.engine.dialect.name != "postgresql":
+        return
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for index_name, (table_name, column_name) in TRIGRAM_INDEXES.items():
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} "
+                    f"ON {table_name} USING gin ({column_name} gin_trgm_ops)"
+                ))
+    except Exception as e:
+        logger.warning(f"Could not create trigram indexes: {str(e)}")
@@ -11,6 +11,7 @@ import logging
 import threading
 import subprocess
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_http_ready
 
 # Configure logging
 logging.basicConfig(
@@ -33,9 +34,8 @@ flask_process = None
 
 def log_output(process, service_name):
     """Monitor and log process output."""
-    for line in iter(process.stdout.readline, ""):
-        if line:
-            logger.info(f"{service_name}: {line.strip()}")
+    for line in process.stdout:
+        logger.info(f"{service_name}: {line.rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI application."""
@@ -50,10 +50,12 @@ def start_fastapi():
         
         # Run FastAPI with uvicorn
         fastapi_process = subprocess.Popen(
-            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000", "--reload"],
+            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -61,7 +63,8 @@ def start_fastapi():
         threading.Thread(target=log_output, args=(fastapi_process, "FastAPI"), daemon=True).start()
         
         # Wait for FastAPI to initialize
-        time.sleep(5)
+        if not wait_for_http_ready(f"{os.environ['FASTAPI_URL']}/health", process=fastapi_process):
+            logger.warning("FastAPI did not pass its health check in time")
         
         logger.info("FastAPI service started")
         return True
@@ -77,10 +80,12 @@ def start_flask():
     try:
         # Start Flask with gunicorn
         flask_process = subprocess.Popen(
-            ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"],
+            ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -4,28 +4,179 @@ This module provides the Flask routes for the MCP Assessor Agent API database in
 
 import datetime
 import json
-import os
 import logging
+import threading
+from functools import wraps
 import requests
-from flask import render_template, request, jsonify, Blueprint, current_app
+from flask import render_template, request, jsonify, Blueprint, current_app, Response
 from sqlalchemy import text
 
+from app.cache import cached_response
+from app.rate_limit import is_rate_limited, record_request, get_retry_after
+from fastapi_client import (
+    FASTAPI_URL, UPSTREAM_TIMEOUT, NL_TO_SQL_TIMEOUT, HEALTH_TIMEOUT, SESSION,
+    API_PREFIX, API_KEY, CircuitOpenError, FASTAPI_BREAKER, upstream_call
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Define a constant for the FastAPI URL if it's not in the environment
-FASTAPI_URL = os.environ.get("FASTAPI_URL", "http://localhost:8000")
+# Constant part of the headers sent with proxied JSON bodies
+_JSON_HEADERS = {'Content-Type': 'application/json'}
 
-# Import or define API settings with fallbacks
-try:
-    from app.settings import settings as fastapi_settings
-    API_PREFIX = fastapi_settings.API_PREFIX
-    API_KEY = fastapi_settings.API_KEY
-except (ImportError, AttributeError):
-    logger.warning("Could not import FastAPI settings, using defaults")
-    API_PREFIX = "/api"
-    API_KEY = os.environ.get("API_KEY", "b6212a0ff43102f608553e842293eba0ec013ff6926459f96fba31d0fabacd2e")
+def _stream_upstream(response: requests.Response) -> Response:
+    """Relay a streamed FastAPI response to the client without re-parsing the JSON body."""
+    def generate():
+        try:
+            # Pass the bytes through as received so compressed bodies stay compressed
+            for chunk in response.raw.stream(65536, decode_content=False):
+                yield chunk
+        finally:
+            response.close()
+    
+    headers = {}
+    if response.headers.get('Content-Encoding'):
+        headers['Content-Encoding'] = response.headers['Content-Encoding']
+    
+    return Response(
+        generate(),
+        status=response.status_code,
+        content_type=response.headers.get('Content-Type', 'application/json'),
+        headers=headers
+    )
+
+def _buffer_upstream(response: requests.Response) -> Response:
+    """Relay a FastAPI response that was read in full, so the response cache can store it."""
+    return Response(
+        response.content,
+        status=response.status_code,
+        content_type=response.headers.get('Content-Type', 'application/json')
+    )
+
+# The run-query and NL to SQL proxies forward expensive SQL / language model
+# work, so cap how often each client may call them and how many may be in
+# flight at once; a burst then gets 429s instead of tying up every worker
+EXPENSIVE_PROXY_RATE_LIMIT = 30  # requests per client per window
+EXPENSIVE_PROXY_RATE_WINDOW = 60  # seconds
+EXPENSIVE_PROXY_CONCURRENCY = 20
+_expensive_proxy_bulkhead = threading.BoundedSemaphore(EXPENSIVE_PROXY_CONCURRENCY)
+
+def limit_expensive_proxy(func):
+    """
+    Rate limit and bulkhead decorator for proxies that trigger expensive upstream work.
+    
+    Clients are keyed by their X-API-Key header, falling back to the remote
+    address. The concurrency slot is held until the upstream has answered.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        client_key = request.headers.get('X-API-Key') or request.remote_addr or "unknown"
+        endpoint = request.path
+        
+        if is_rate_limited(client_key, endpoint, EXPENSIVE_PROXY_RATE_LIMIT, EXPENSIVE_PROXY_RATE_WINDOW):
+            retry_after = get_retry_after(client_key, endpoint, EXPENSIVE_PROXY_RATE_LIMIT, EXPENSIVE_PROXY_RATE_WINDOW)
+            logger.warning(f"Rate limit exceeded for {endpoint}")
+            return jsonify({
+                "status": "error",
+                "message": f"Rate limit exceeded. Try again in {retry_after} seconds."
+            }), 429, {"Retry-After": str(retry_after)}
+        record_request(client_key, endpoint)
+        
+        if not _expensive_proxy_bulkhead.acquire(blocking=False):
+            logger.warning(f"Rejecting {endpoint}: {EXPENSIVE_PROXY_CONCURRENCY} requests already in flight")
+            return jsonify({
+                "status": "error",
+                "message": "Too many queries are being processed. Please try again shortly."
+            }), 429, {"Retry-After": "1"}
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _expensive_proxy_bulkhead.release()
+    return wrapper
+
+def _circuit_open_response():
+    """Response returned immediately while the FastAPI circuit breaker is open."""
+    return jsonify({
+        "status": "error",
+        "message": "The FastAPI service is temporarily unavailable. Please try again shortly."
+    }), 503
+
+def _proxy_to_fastapi(method: str, path: str, timeout=UPSTREAM_TIMEOUT,
+                      timeout_message: str = "Request to FastAPI service timed out",
+                      buffered: bool = False):
+    """
+    Forward the current request to a FastAPI endpoint and relay its response.
+    
+    POST requests forward the JSON body and GET requests forward the query
+    string. The caller's X-API-Key is passed through, falling back to the
+    configured key.
+    
+    Args:
+        method: HTTP method to use upstream ("GET" or "POST")
+        path: Endpoint path below the FastAPI API prefix, e.g. "/run-query"
+        timeout: (connect, read) timeout for the upstream call
+        timeout_message: Error message returned when the upstream times out
+        buffered: Read the whole body instead of streaming it, for small
+            responses that the response cache should store
+        
+    Returns:
+        Flask response relaying the FastAPI response, or a JSON error
+    """
+    endpoint_name = path.lstrip('/')
+    try:
+        # Forward the request to FastAPI
+        upstream_kwargs = {}
+        if method == "POST":
+            headers = {**_JSON_HEADERS, 'X-API-Key': request.headers.get('X-API-Key') or API_KEY}
+            # Make sure we have valid JSON data
+            upstream_kwargs['json'] = request.json if request.is_json else {}
+        else:
+            headers = {'X-API-Key': request.headers.get('X-API-Key') or API_KEY}
+            upstream_kwargs['params'] = request.args
+        
+        # Log the request
+        logger.info(f"Proxying request to FastAPI {endpoint_name}: {FASTAPI_URL}{API_PREFIX}{path}")
+        
+        # Try to connect to FastAPI service
+        try:
+            response = upstream_call(
+                method,
+                path,
+                headers=headers,
+                timeout=timeout,
+                stream=not buffered,
+                **upstream_kwargs
+            )
+            
+            # Relay the response from FastAPI as-is
+            if buffered:
+                return _buffer_upstream(response)
+            return _stream_upstream(response)
+            
+        except CircuitOpenError:
+            return _circuit_open_response()
+            
+        except requests.exceptions.ConnectionError:
+            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
+            return jsonify({
+                "status": "error",
+                "message": "Could not connect to the FastAPI service. Please check if it's running."
+            }), 503  # Service Unavailable
+            
+        except requests.exceptions.Timeout:
+            logger.error("Timeout connecting to FastAPI service")
+            return jsonify({
+                "status": "error",
+                "message": timeout_message
+            }), 504  # Gateway Timeout
+            
+    except Exception as e:
+        logger.error(f"Error proxying {endpoint_name}: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to proxy request: {str(e)}"
+        }), 500
 
 # Get db instance from app_setup
 from app_setup import db, app
@@ -52,6 +203,7 @@ def api_docs():
                          title="API Documentation")
 
 @database_bp.route('/openapi.json')
+@cached_response(ttl_seconds=300)
 def openapi_schema():
     """Proxy to FastAPI OpenAPI schema."""
     try:
@@ -63,8 +215,13 @@ def openapi_schema():
         # So we need to include the API_PREFIX in the URL
         openapi_url = f"{FASTAPI_URL}{fastapi_settings.API_PREFIX}/openapi.json"
         
-        response = requests.get(openapi_url)
-        return jsonify(response.json())
+        response = FASTAPI_BREAKER.call(SESSION.get, openapi_url, timeout=UPSTREAM_TIMEOUT)
+        return _buffer_upstream(response)
+    except CircuitOpenError:
+        return _circuit_open_response()
+    except requests.exceptions.Timeout:
+        logger.error("Timeout fetching OpenAPI schema from FastAPI service")
+        return jsonify({"error": "Request to FastAPI service timed out"}), 504
     except Exception as e:
         logger.error(f"Error fetching OpenAPI schema: {str(e)}")
         return jsonify({"error": f"Failed to fetch OpenAPI schema: {str(e)}"}), 500
@@ -81,11 +238,11 @@ def health_check():
         # Try both paths to ensure we can connect
         try:
             # First try with API_PREFIX
-            response = requests.get(f"{FASTAPI_URL}{fastapi_settings.API_PREFIX}/health")
+            response = SESSION.get(f"{FASTAPI_URL}{fastapi_settings.API_PREFIX}/health", timeout=HEALTH_TIMEOUT)
             api_health = response.json()
         except Exception:
             # If that fails, try the root health endpoint
-            response = requests.get(f"{FASTAPI_URL}/health")
+            response = SESSION.get(f"{FASTAPI_URL}/health", timeout=HEALTH_TIMEOUT)
             api_health = response.json()
         
         # Check database connection through SQLAlchemy
@@ -329,238 +486,37 @@ def get_schema():
 
 # Proxy routes for FastAPI endpoints
 @database_bp.route('/api/run-query', methods=['POST'])
+@limit_expensive_proxy
 def proxy_run_query():
     """Proxy for the FastAPI run-query endpoint."""
-    try:
-        # Forward the request to FastAPI
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': request.headers.get('X-API-Key', API_KEY)
-        }
-        
-        # Make sure we have valid JSON data
-        data = request.json if request.is_json else {}
-        
-        # Log the request
-        logger.info(f"Proxying request to FastAPI run-query: {FASTAPI_URL}{API_PREFIX}/run-query")
-        
-        # Try to connect to FastAPI service
-        try:
-            response = requests.post(
-                f"{FASTAPI_URL}{API_PREFIX}/run-query",
-                json=data,
-                headers=headers,
-                timeout=30  # Add timeout to prevent hanging
-            )
-            
-            # Return the response from FastAPI
-            return jsonify(response.json()), response.status_code
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
-            return jsonify({
-                "status": "error",
-                "message": "Could not connect to the FastAPI service. Please check if it's running."
-            }), 503  # Service Unavailable
-            
-        except requests.exceptions.Timeout:
-            logger.error("Timeout connecting to FastAPI service")
-            return jsonify({
-                "status": "error",
-                "message": "Request to FastAPI service timed out"
-            }), 504  # Gateway Timeout
-            
-    except Exception as e:
-        logger.error(f"Error proxying run-query: {str(e)}")
-        return jsonify({
-            "status": "error",
-            "message": f"Failed to proxy request: {str(e)}"
-        }), 500
+    return _proxy_to_fastapi("POST", "/run-query")
 
 @database_bp.route('/api/nl-to-sql', methods=['POST'])
+@limit_expensive_proxy
 def proxy_nl_to_sql():
     """Proxy for the FastAPI natural language to SQL endpoint."""
-    try:
-        # Forward the request to FastAPI
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': request.headers.get('X-API-Key', API_KEY)
-        }
-        
-        # Make sure we have valid JSON data
-        data = request.json if request.is_json else {}
-        
-        # Log the request
-        logger.info(f"Proxying request to FastAPI nl-to-sql: {FASTAPI_URL}{API_PREFIX}/nl-to-sql")
-        
-        # Try to connect to FastAPI service
-        try:
-            response = requests.post(
-                f"{FASTAPI_URL}{API_PREFIX}/nl-to-sql",
-                json=data,
-                headers=headers,
-                timeout=60  # Longer timeout because language model processing takes time
-            )
-            
-            # Return the response from FastAPI
-            return jsonify(response.json()), response.status_code
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
-            return jsonify({
-                "status": "error",
-                "message": "Could not connect to the FastAPI service. Please check if it's running."
-            }), 503  # Service Unavailable
-            
-        except requests.exceptions.Timeout:
-            logger.error("Timeout connecting to FastAPI service")
-            return jsonify({
-                "status": "error",
-                "message": "Request to FastAPI service timed out. NL to SQL conversion may take longer than expected."
-            }), 504  # Gateway Timeout
-            
-    except Exception as e:
-        logger.error(f"Error proxying nl-to-sql: {str(e)}")
-        return jsonify({
-            "status": "error",
-            "message": f"Failed to proxy request: {str(e)}"
-        }), 500
+    return _proxy_to_fastapi(
+        "POST",
+        "/nl-to-sql",
+        timeout=NL_TO_SQL_TIMEOUT,
+        timeout_message="Request to FastAPI service timed out. NL to SQL conversion may take longer than expected."
+    )
 
+# The schema proxies return small documents that only change with the
+# database schema, so they are read in full and cached instead of streamed
 @database_bp.route('/api/discover-schema')
+@cached_response(ttl_seconds=300, query_args=('db',))
 def proxy_discover_schema():
     """Proxy for the FastAPI schema discovery endpoint."""
-    try:
-        # Forward the request to FastAPI
-        headers = {
-            'X-API-Key': request.headers.get('X-API-Key', API_KEY)
-        }
-        
-        # Log the request
-        logger.info(f"Proxying request to FastAPI discover-schema: {FASTAPI_URL}{API_PREFIX}/discover-schema")
-        
-        # Try to connect to FastAPI service
-        try:
-            response = requests.get(
-                f"{FASTAPI_URL}{API_PREFIX}/discover-schema",
-                params=request.args,
-                headers=headers,
-                timeout=30
-            )
-            
-            # Return the response from FastAPI
-            return jsonify(response.json()), response.status_code
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
-            return jsonify({
-                "status": "error",
-                "message": "Could not connect to the FastAPI service. Please check if it's running."
-            }), 503  # Service Unavailable
-            
-        except requests.exceptions.Timeout:
-            logger.error("Timeout connecting to FastAPI service")
-            return jsonify({
-                "status": "error",
-                "message": "Request to FastAPI service timed out"
-            }), 504  # Gateway Timeout
-            
-    except Exception as e:
-        logger.error(f"Error proxying discover-schema: {str(e)}")
-        return jsonify({
-            "status": "error",
-            "message": f"Failed to proxy request: {str(e)}"
-        }), 500
+    return _proxy_to_fastapi("GET", "/discover-schema", buffered=True)
 
 @database_bp.route('/api/schema-summary')
+@cached_response(ttl_seconds=300, query_args=('db', 'prefix'))
 def proxy_schema_summary():
     """Proxy for the FastAPI schema summary endpoint."""
-    try:
-        # Forward the request to FastAPI
-        headers = {
-            'X-API-Key': request.headers.get('X-API-Key', API_KEY)
-        }
-        
-        # Log the request
-        logger.info(f"Proxying request to FastAPI schema-summary: {FASTAPI_URL}{API_PREFIX}/schema-summary")
-        
-        # Try to connect to FastAPI service
-        try:
-            response = requests.get(
-                f"{FASTAPI_URL}{API_PREFIX}/schema-summary",
-                params=request.args,
-                headers=headers,
-                timeout=30
-            )
-            
-            # Return the response from FastAPI
-            return jsonify(response.json()), response.status_code
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
-            return jsonify({
-                "status": "error", 
-                "message": "Could not connect to the FastAPI service. Please check if it's running."
-            }), 503  # Service Unavailable
-            
-        except requests.exceptions.Timeout:
-            logger.error("Timeout connecting to FastAPI service")
-            return jsonify({
-                "status": "error",
-                "message": "Request to FastAPI service timed out"
-            }), 504  # Gateway Timeout
-            
-    except Exception as e:
-        logger.error(f"Error proxying schema-summary: {str(e)}")
-        return jsonify({
-            "status": "error",
-            "message": f"Failed to proxy request: {str(e)}"
-        }), 500
+    return _proxy_to_fastapi("GET", "/schema-summary", buffered=True)
 
 @database_bp.route('/api/parameterized-query', methods=['POST'])
 def proxy_parameterized_query():
     """Proxy for the FastAPI parameterized query endpoint."""
-    try:
-        # Forward the request to FastAPI
-        headers = {
-            'Content-Type': 'application/json',
-            'X-API-Key': request.headers.get('X-API-Key', API_KEY)
-        }
-        
-        # Make sure we have valid JSON data
-        data = request.json if request.is_json else {}
-        
-        # Log the request
-        logger.info(f"Proxying request to FastAPI parameterized-query: {FASTAPI_URL}{API_PREFIX}/parameterized-query")
-        
-        # Try to connect to FastAPI service
-        try:
-            response = requests.post(
-                f"{FASTAPI_URL}{API_PREFIX}/parameterized-query",
-                json=data,
-                headers=headers,
-                timeout=30
-            )
-            
-            # Return the response from FastAPI
-            return jsonify(response.json()), response.status_code
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error to FastAPI service at {FASTAPI_URL}")
-            return jsonify({
-                "status": "error",
-                "message": "Could not connect to the FastAPI service. Please check if it's running."
-            }), 503  # Service Unavailable
-            
-        except requests.exceptions.Timeout:
-            logger.error("Timeout connecting to FastAPI service")
-            return jsonify({
-                "status": "error",
-                "message": "Request to FastAPI service timed out"
-            }), 504  # Gateway Timeout
-            
-    except Exception as e:
-        logger.error(f"Error proxying parameterized-query: {str(e)}")
-        return jsonify({
-            "status": "error",
-            "message": f"Failed to proxy request: {str(e)}"
-        }), 500
\ No newline at end of file
+    return _proxy_to_fastapi("POST", "/parameterized-query")
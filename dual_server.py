@@ -36,7 +36,7 @@ if not api_key:
 # Import models and app for the Flask component
 from app_setup import app as flask_app, db
 import models
-from database import *  # Import all routes
+import database  # noqa: F401 - loads the database routes module
 
 # Check and ensure database tables are created
 with flask_app.app_context():
@@ -65,14 +65,17 @@ def start_fastapi():
         
         # Import FastAPI app
         from app import app as fastapi_app
+        from process_utils import FASTAPI_ACCESS_LOG
         import uvicorn
         
-        # Configure and start uvicorn server
+        # Configure and start uvicorn server. The default "auto" loop and
+        # HTTP settings use uvloop and httptools when they are installed
         config = uvicorn.Config(
             app=fastapi_app,
             host="0.0.0.0",
             port=8000,
-            log_level="info"
+            log_level="info",
+            access_log=FASTAPI_ACCESS_LOG
         )
         server = uvicorn.Server(config)
         server.run()
@@ -0,0 +1,147 @@
+"""
+Shared client for calls from the Flask service to the FastAPI service.
+
+Every module that talks to FastAPI uses the session, timeouts, retry policy
+and circuit breaker defined here, so they share one pool of keep-alive
+connections and one view of whether FastAPI is up.
+"""
+
+import os
+import logging
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# URL of the FastAPI service
+FASTAPI_URL = os.environ.get("FASTAPI_URL", "http://localhost:8000")
+
+# (connect, read) timeouts for calls to FastAPI so a slow upstream cannot
+# hold a worker indefinitely; NL to SQL gets a longer read window because
+# language model processing takes time
+UPSTREAM_TIMEOUT = (3.05, 30)
+NL_TO_SQL_TIMEOUT = (3.05, 60)
+HEALTH_TIMEOUT = (1, 2)
+
+# Retry transient upstream failures with jittered exponential backoff.
+# Gateway errors are only retried for idempotent GETs; connection failures
+# happen before the request is sent, so those are retried for POSTs too.
+UPSTREAM_RETRY = Retry(
+    total=3,
+    connect=2,
+    backoff_factor=0.3,
+    backoff_jitter=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Shared HTTP session so proxy calls reuse keep-alive connections to FastAPI
+# instead of paying a new TCP handshake on every request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=UPSTREAM_RETRY)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+class CircuitOpenError(Exception):
+    """Raised when the FastAPI circuit breaker is open and calls are rejected."""
+    pass
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker for calls to the FastAPI service.
+    
+    After ``fail_max`` consecutive failures the circuit opens and calls are
+    rejected immediately for ``reset_timeout`` seconds. The next call after
+    that is let through as a trial: success closes the circuit, failure
+    opens it again.
+    
+    Only connection errors, timeouts and 502/503/504 responses count as
+    failures. Any other exception says nothing about whether FastAPI is up,
+    so it leaves the failure count alone; if it ended a trial call, the
+    next call is let through as a new trial.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
+    
+    def call(self, func, *args, **kwargs):
+        """Invoke ``func`` through the breaker, tracking upstream failures."""
+        trial = False
+        with self._lock:
+            if self._opened_at is not None:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    raise CircuitOpenError("FastAPI circuit breaker is open")
+                # Half-open: let this call through and hold other callers off
+                self._opened_at = time.monotonic()
+                trial = True
+        
+        try:
+            response = func(*args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self._record_failure()
+            raise
+        except Exception:
+            if trial:
+                self._release_trial()
+            raise
+        
+        if response.status_code in (502, 503, 504):
+            self._record_failure()
+        else:
+            self._record_success()
+        return response
+    
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning(f"Opening FastAPI circuit breaker after {self._failures} failures")
+                self._opened_at = time.monotonic()
+    
+    def _release_trial(self):
+        with self._lock:
+            if self._opened_at is not None:
+                self._opened_at = time.monotonic() - self.reset_timeout
+    
+    def _record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Closing FastAPI circuit breaker")
+            self._failures = 0
+            self._opened_at = None
+
+FASTAPI_BREAKER = CircuitBreaker(fail_max=5, reset_timeout=30)
+
+# Import or define API settings with fallbacks
+try:
+    from app.settings import settings as fastapi_settings
+    API_PREFIX = fastapi_settings.API_PREFIX
+    API_KEY = fastapi_settings.API_KEY
+except (ImportError, AttributeError):
+    logger.warning("Could not import FastAPI settings, using defaults")
+    API_PREFIX = "/api"
+    API_KEY = os.environ.get("API_KEY", "b6212a0ff43102f608553e842293eba0ec013ff6926459f96fba31d0fabacd2e")
+
+def upstream_call(method: str, path: str, **kwargs) -> requests.Response:
+    """Send a request to the FastAPI service through the shared session and circuit breaker."""
+    return FASTAPI_BREAKER.call(SESSION.request, method, f"{FASTAPI_URL}{API_PREFIX}{path}", **kwargs)
@@ -16,7 +16,7 @@ def run_fastapi():
     """Run the FastAPI application."""
     print("Starting FastAPI application on port 8000...")
     cmd = ["gunicorn", "-k", "uvicorn.workers.UvicornWorker", 
-           "--bind", "0.0.0.0:8000", "--reload", "asgi:app"]
+           "--bind", "0.0.0.0:8000", "asgi:app"]
     
     global fastapi_proc
     fastapi_proc = subprocess.Popen(cmd)
@@ -0,0 +1,74 @@
+"""
+Gunicorn configuration for the Flask application.
+
+Gunicorn loads this file automatically from the working directory, so every
+`gunicorn ... main:app` command in the start scripts picks it up.
+"""
+
+import os
+import sys
+
+# The proxy endpoints spend nearly all their time waiting on the FastAPI
+# service; threaded workers let one process serve many of those at once
+# instead of blocking a whole sync worker per request
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Connections the Flask service may hold open on PostgreSQL, by default half
+# of its default max_connections of 100; the FastAPI service has its own
+# share (FASTAPI_DB_CONNECTIONS in app/settings.py)
+FLASK_DB_CONNECTIONS = int(os.environ.get("FLASK_DB_CONNECTIONS", "50"))
+
+# Most connections one worker can open (app_setup.py): one per thread, one
+# per dashboard and statistics query executor thread (4 + 3), and an overflow
+# of one per thread for streamed exports
+connections_per_worker = 2 * threads + 4 + 3
+
+# Threads share one interpreter lock, so CPU-bound work (templating, JSON
+# encoding) needs several processes to use every core. The count is capped so
+# that every worker's connections fit within FLASK_DB_CONNECTIONS
+workers = int(os.environ.get(
+    "GUNICORN_WORKERS",
+    min((os.cpu_count() or 1) * 2 + 1, max(1, FLASK_DB_CONNECTIONS // connections_per_worker))
+))
+
+# Restarting workers on code changes is for development only (DEV=1 or
+# WORKFLOW_MODE=dev, as in process_utils)
+reload = (os.environ.get("DEV") == "1"
+          or os.environ.get("WORKFLOW_MODE", "").lower() == "dev"
+          or os.environ.get("GUNICORN_RELOAD", "false").lower() in ("1", "true", "yes"))
+
+# Import the app once in the master and fork the workers from it, so they
+# share its memory copy-on-write instead of each importing main.py again.
+# Code reloading re-imports the app in the workers, so it turns this off
+preload_app = not reload
+
+# Upstream calls time out well before this, so a hung worker is a real fault
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "90"))
+keepalive = 5
+
+
+def post_fork(server, worker):
+    """
+    Give each worker its own database connections.
+    
+    Pooled connections the master opened while preloading the app would
+    otherwise be shared by every forked worker. They are dropped without
+    being closed, which would end the session for the master's copy too.
+    
+    Args:
+        server: Gunicorn arbiter
+        worker: Worker that was just forked
+    """
+    app_setup = sys.modules.get("app_setup")
+    if app_setup is not None:
+        with app_setup.app.app_context():
+            for engine in app_setup.db.engines.values():
+                engine.dispose(close=False)
+    
+    app_db = sys.modules.get("app.db")
+    if app_db is not None:
+        for engine in app_db._engines.values():
+            engine.dispose(close=False)
+        # Forget the psycopg2 pools too; the worker creates its own on first use
+        app_db._postgres_pools.clear()
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the FastAPI application (run_api.py).
+
+gunicorn.conf.py is loaded automatically from the working directory and is
+tuned for the Flask app's threaded workers, so run_api.py passes this file
+explicitly in its place.
+"""
+
+import os
+
+# A single uvicorn process serves every request on one event loop, so
+# CPU-heavy handlers queue behind each other on one core. Several uvicorn
+# workers spread requests across cores
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("API_WORKERS", os.environ.get("FASTAPI_WORKERS", max(2, os.cpu_count() or 2))))
+# app/settings.py splits the API's database connection budget between this
+# many workers
+os.environ["FASTAPI_WORKERS"] = str(workers)
+bind = f"0.0.0.0:{int(os.environ.get('API_PORT', 8000))}"
+
+# Restarting workers on code changes is for development only (DEV=1 or
+# WORKFLOW_MODE=dev, as in process_utils)
+reload = (os.environ.get("DEV") == "1"
+          or os.environ.get("WORKFLOW_MODE", "").lower() == "dev"
+          or os.environ.get("FASTAPI_RELOAD", "false").lower() in ("1", "true", "yes"))
+
+keepalive = 5
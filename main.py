@@ -14,12 +14,10 @@ import signal
 import logging
 import threading
 import subprocess
-import time
 import json
 import datetime
 import re
 from sqlalchemy import func, text
-import requests
 from urllib.parse import urlparse
 from flask import jsonify, request, Blueprint, render_template
 from app.api.realtime import realtime_api
@@ -32,6 +30,7 @@ from app.db import execute_parameterized_query, parse_for_parameters, get_connec
 from app.nl_processing import sql_to_natural_language, extract_query_intent
 from sqlalchemy import create_engine, inspect
 from app.validators import validate_query
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_http_ready
 
 # Import authentication modules
 try:
@@ -151,7 +150,7 @@ def start_fastapi():
             "asgi:app", 
             "--host", "0.0.0.0", 
             "--port", str(FASTAPI_PORT),
-            "--reload"
+            *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS
         ]
         fastapi_process = subprocess.Popen(
             cmd,
@@ -177,15 +176,9 @@ def start_fastapi():
     
     # Wait for FastAPI to start
     logger.info("Waiting for FastAPI to start...")
-    for i in range(60):  # Wait up to 60 seconds
-        try:
-            response = requests.get(f"http://localhost:{FASTAPI_PORT}/health")
-            if response.status_code == 200:
-                logger.info("FastAPI started successfully")
-                return fastapi_process
-        except requests.exceptions.ConnectionError as e:
-            logger.info(f"Waiting for FastAPI to start (attempt {i+1}/60): {str(e)}")
-            time.sleep(1)
+    if wait_for_http_ready(f"http://localhost:{FASTAPI_PORT}/health", timeout=60):
+        logger.info("FastAPI started successfully")
+        return fastapi_process
     
     logger.warning("Timed out waiting for FastAPI to start")
     logger.error("Failed to start FastAPI")
@@ -409,22 +402,12 @@ def get_imported_improvements():
             
             # Apply filters
             if property_id:
-                # Filter by matching parcel ID
-                parcel = db.session.query(Parcel).filter(Parcel.parcel_id.ilike(f'%{property_id}%')).first()
-                if parcel:
-                    query = query.filter(Property.parcel_id == parcel.id)
-                else:
-                    # No matching parcel, return empty result
-                    return jsonify({
-                        'status': 'success',
-                        'total': 0,
-                        'improvements': [],
-                        'pagination': {
-                            'offset': offset,
-                            'limit': limit,
-                            'total': 0
-                        }
-                    })
+                # Filter by matching parcel ID in the same statement rather
+                # than looking the parcel up first
+                parcel_ids = db.session.query(Parcel.id).filter(
+                    Parcel.parcel_id.ilike(f'%{property_id}%')
+                ).scalar_subquery()
+                query = query.filter(Property.parcel_id.in_(parcel_ids))
             
             # Get total count
             total_count = query.count()
@@ -29,6 +29,43 @@ MAP_DATA_CACHE: Dict[str, Any] = {}
 CACHE_TIMESTAMP: Optional[datetime] = None
 CACHE_LIFETIME = timedelta(minutes=10)
 
+def parse_bbox(value: Optional[str]) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Parse a "min_lng,min_lat,max_lng,max_lat" bounding box query parameter.
+    
+    Args:
+        value: Raw bbox parameter value
+        
+    Returns:
+        Tuple of (min_lng, min_lat, max_lng, max_lat), or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(part) for part in value.split(','))
+    except ValueError:
+        return None
+    return min_lng, min_lat, max_lng, max_lat
+
+def filter_to_bbox(query, bbox: Optional[Tuple[float, float, float, float]]):
+    """
+    Restrict an Account query to the given bounding box.
+    
+    Args:
+        query: SQLAlchemy query over Account
+        bbox: Tuple of (min_lng, min_lat, max_lng, max_lat), or None for no restriction
+        
+    Returns:
+        Filtered query
+    """
+    if bbox is None:
+        return query
+    min_lng, min_lat, max_lng, max_lat = bbox
+    return query.filter(
+        Account.latitude.between(min_lat, max_lat),
+        Account.longitude.between(min_lng, max_lng)
+    )
+
 def get_property_bounds(properties: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     Calculate the bounding box for a set of properties.
@@ -91,12 +128,28 @@ def get_property_bounds(properties: List[Dict[str, Any]]) -> Dict[str, float]:
     
     return bounds
 
+# Account columns used to build map features; selecting just these avoids
+# loading and hydrating the full account rows
+MAP_FEATURE_COLUMNS = (
+    Account.id,
+    Account.latitude,
+    Account.longitude,
+    Account.property_type,
+    Account.property_address,
+    Account.property_city,
+    Account.owner_name,
+    Account.legal_description,
+    Account.assessed_value,
+    Account.tax_amount,
+    Account.tax_status,
+)
+
 def property_to_geojson(account: Account) -> Dict[str, Any]:
     """
     Convert an Account object to a GeoJSON feature.
     
     Args:
-        account: Account database object
+        account: Account database object or row with the MAP_FEATURE_COLUMNS
         
     Returns:
         GeoJSON feature dictionary
@@ -105,6 +158,11 @@ def property_to_geojson(account: Account) -> Dict[str, Any]:
     if not account.latitude or not account.longitude:
         return None
     
+    # Numeric columns load as Decimal; convert them once here so the JSON
+    # encoder emits plain numbers instead of calling its fallback per value
+    assessed_value = float(account.assessed_value) if account.assessed_value is not None else None
+    tax_amount = float(account.tax_amount) if account.tax_amount is not None else None
+    
     # Create GeoJSON feature
     feature = {
         "type": "Feature",
@@ -119,8 +177,8 @@ def property_to_geojson(account: Account) -> Dict[str, Any]:
             "property_city": account.property_city,
             "owner_name": account.owner_name,
             "legal_description": account.legal_description,
-            "assessed_value": account.assessed_value,
-            "tax_amount": account.tax_amount,
+            "assessed_value": assessed_value,
+            "tax_amount": tax_amount,
             "tax_status": account.tax_status,
         }
     }
@@ -150,6 +208,9 @@ def get_map_data(limit: int = 500, use_cache: bool = True) -> Dict[str, Any]:
     min_value = request.args.get('min_value', None)
     max_value = request.args.get('max_value', None)
     
+    # Only load properties inside the visible map area if one was given
+    bbox = parse_bbox(request.args.get('bbox'))
+    
     if min_value:
         try:
             min_value = float(min_value)
@@ -163,7 +224,7 @@ def get_map_data(limit: int = 500, use_cache: bool = True) -> Dict[str, Any]:
             max_value = None
     
     # Build cache key based on filter parameters
-    cache_key = f"{property_type}_{city}_{min_value}_{max_value}_{visualization_mode}"
+    cache_key = f"{property_type}_{city}_{min_value}_{max_value}_{visualization_mode}_{bbox}"
     
     # Check cache if enabled
     if use_cache and CACHE_TIMESTAMP and datetime.now() - CACHE_TIMESTAMP < CACHE_LIFETIME:
@@ -173,7 +234,7 @@ def get_map_data(limit: int = 500, use_cache: bool = True) -> Dict[str, Any]:
     
     try:
         # Build query for accounts with coordinates
-        query = Account.query.filter(
+        query = db.session.query(*MAP_FEATURE_COLUMNS).filter(
             Account.latitude.isnot(None),
             Account.longitude.isnot(None)
         )
@@ -193,6 +254,9 @@ def get_map_data(limit: int = 500, use_cache: bool = True) -> Dict[str, Any]:
         if max_value is not None:
             query = query.filter(Account.assessed_value <= max_value)
         
+        # Apply bounding box filter
+        query = filter_to_bbox(query, bbox)
+        
         # Get filtered accounts
         accounts = query.limit(limit).all()
         
@@ -265,10 +329,63 @@ def clear_cache() -> None:
     CACHE_TIMESTAMP = None
     logger.info("Map data cache cleared")
 
+def get_cluster_grid_size(zoom: int) -> float:
+    """
+    Get the clustering grid cell size for a map zoom level.
+    
+    Args:
+        zoom: Web map zoom level (0 shows the whole world)
+        
+    Returns:
+        Grid cell size in degrees, roughly a quarter of a map tile
+    """
+    zoom = min(max(zoom, 0), 20)
+    return 360.0 / (2 ** zoom) / 4
+
 def get_map_clusters():
-    """Get property clusters for the map."""
-    from flask import jsonify
-    return jsonify({"clusters": []})
+    """
+    Get property clusters for the map.
+    
+    Properties are grouped into grid cells in SQL, so a zoomed-out map gets a
+    few hundred cluster rows instead of every property. Accepts the optional
+    bbox ("min_lng,min_lat,max_lng,max_lat") and zoom query parameters.
+    """
+    from flask import jsonify, request
+    
+    bbox = parse_bbox(request.args.get('bbox'))
+    zoom = request.args.get('zoom', 10, type=int)
+    grid_size = get_cluster_grid_size(zoom)
+    
+    try:
+        lat_cell = sa.cast(Account.latitude / grid_size, sa.Integer)
+        lng_cell = sa.cast(Account.longitude / grid_size, sa.Integer)
+        
+        query = db.session.query(
+            sa.func.count(Account.id),
+            sa.func.avg(Account.latitude),
+            sa.func.avg(Account.longitude),
+            sa.func.avg(Account.assessed_value),
+            sa.func.sum(Account.assessed_value)
+        ).filter(
+            Account.latitude.isnot(None),
+            Account.longitude.isnot(None)
+        )
+        query = filter_to_bbox(query, bbox).group_by(lat_cell, lng_cell)
+        
+        clusters = [
+            {
+                "position": [avg_lat, avg_lng],
+                "count": count,
+                "average_value": float(avg_value or 0),
+                "total_value": float(total_value or 0)
+            }
+            for count, avg_lat, avg_lng, avg_value, total_value in query.all()
+        ]
+        
+        return jsonify({"clusters": clusters, "grid_size": grid_size})
+    except Exception as e:
+        logger.error(f"Error generating map clusters: {str(e)}")
+        return jsonify({"clusters": [], "error": str(e)})
 
 def get_property_types():
     """Get available property types."""
@@ -278,11 +395,12 @@ def get_property_types():
         try:
             # Get distinct property types
             types = db.session.query(Account.property_type).filter(
-                Account.property_type.isnot(None)
+                Account.property_type.isnot(None),
+                Account.property_type != ''
             ).distinct().all()
             
             return jsonify({
-                "property_types": [t[0] for t in types if t[0]]
+                "property_types": [t for (t,) in types]
             })
         except Exception as e:
             logger.error(f"Error fetching property types: {str(e)}")
@@ -298,11 +416,12 @@ def get_cities():
         try:
             # Get distinct cities
             cities = db.session.query(Account.property_city).filter(
-                Account.property_city.isnot(None)
+                Account.property_city.isnot(None),
+                Account.property_city != ''
             ).distinct().all()
             
             return jsonify({
-                "cities": [c[0] for c in cities if c[0]]
+                "cities": [c for (c,) in cities]
             })
         except Exception as e:
             logger.error(f"Error fetching cities: {str(e)}")
@@ -16,6 +16,8 @@ from sqlalchemy import text, func, desc, or_, and_
 from sqlalchemy.exc import SQLAlchemyError
 from flask import jsonify, request, current_app, Response
 
+from app.cache import cache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,6 +30,43 @@ DEFAULT_BOUNDS = {
     "west": -119.3487
 }
 
+# Static SQL statements, built once at import instead of on every call
+CITIES_QUERY = text("""
+    SELECT DISTINCT property_city 
+    FROM accounts 
+    WHERE property_city IS NOT NULL AND property_city != ''
+    ORDER BY property_city
+""")
+
+PROPERTY_TYPES_QUERY = text("""
+    SELECT DISTINCT property_type 
+    FROM accounts 
+    WHERE property_type IS NOT NULL AND property_type != ''
+    ORDER BY property_type
+""")
+
+PROPERTY_IMAGES_QUERY = text("""
+    SELECT 
+        id,
+        account_id,
+        image_url,
+        image_path,
+        image_type,
+        image_date,
+        file_format
+    FROM property_images
+    WHERE account_id = :account_id
+""")
+
+VALUE_RANGES_QUERY = text("""
+    SELECT 
+        MIN(assessed_value) as min_value,
+        MAX(assessed_value) as max_value,
+        AVG(assessed_value) as avg_value
+    FROM accounts 
+    WHERE assessed_value IS NOT NULL AND assessed_value > 0
+""")
+
 # Cache for property data with 30-minute expiration
 PROPERTY_CACHE = {
     'data': None,
@@ -51,14 +90,7 @@ def get_cities_list() -> List[str]:
         db_session = get_db_connection()
         
         # Query distinct cities from accounts table
-        query = text("""
-            SELECT DISTINCT property_city 
-            FROM accounts 
-            WHERE property_city IS NOT NULL AND property_city != ''
-            ORDER BY property_city
-        """)
-        
-        result = db_session.execute(query)
+        result = db_session.execute(CITIES_QUERY)
         cities = [row[0] for row in result]
         return cities
     except SQLAlchemyError as e:
@@ -93,6 +125,40 @@ def get_property_data(
         - Map boundaries dictionary
         - List of property data dictionaries with coordinates for mapping
     """
+    if not use_cache:
+        return _load_property_data(data_source, value_filter, city, property_types, use_cache, limit)
+    return _get_filtered_property_data(
+        data_source,
+        value_filter,
+        city,
+        tuple(property_types) if property_types else None,
+        limit
+    )
+
+# Fully built results are cached per filter combination for a short time, so
+# identical map panels across users share one result
+@cache(ttl_seconds=60)
+def _get_filtered_property_data(
+    data_source: str,
+    value_filter: str,
+    city: Optional[str],
+    property_types: Optional[Tuple[str, ...]],
+    limit: int
+) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+    """Load property data for one filter combination, through the result cache."""
+    return _load_property_data(
+        data_source, value_filter, city, list(property_types) if property_types else None, True, limit
+    )
+
+def _load_property_data(
+    data_source: str,
+    value_filter: str,
+    city: Optional[str],
+    property_types: Optional[List[str]],
+    use_cache: bool,
+    limit: int
+) -> Tuple[Dict[str, Any], Dict[str, Any], List[Dict[str, Any]]]:
+    """Load property data from the shared property cache or the database."""
     # Check cache first if enabled
     if use_cache and PROPERTY_CACHE['data'] is not None and PROPERTY_CACHE['timestamp'] is not None:
         current_time = datetime.now()
@@ -269,20 +335,7 @@ def get_property_images(account_id: str) -> List[Dict[str, Any]]:
     try:
         db_session = get_db_connection()
         
-        query = text("""
-            SELECT 
-                id,
-                account_id,
-                image_url,
-                image_path,
-                image_type,
-                image_date,
-                file_format
-            FROM property_images
-            WHERE account_id = :account_id
-        """)
-        
-        result = db_session.execute(query, {'account_id': account_id})
+        result = db_session.execute(PROPERTY_IMAGES_QUERY, {'account_id': account_id})
         
         images = []
         for row in result:
@@ -512,9 +565,11 @@ def calculate_property_statistics(property_values: List[float]) -> Dict[str, Any
     if not property_values:
         return stats
     
-    # Calculate statistics
-    stats['count'] = len(property_values)
-    stats['average'] = sum(property_values) / len(property_values)
+    # Calculate statistics directly on the unsorted values; min/max/sum are
+    # linear scans and statistics.median does its own ordering
+    count = len(property_values)
+    stats['count'] = count
+    stats['average'] = sum(property_values) / count
     stats['median'] = statistics.median(property_values)
     stats['min'] = min(property_values)
     stats['max'] = max(property_values)
@@ -657,14 +712,7 @@ def get_property_types():
         db_session = get_db_connection()
         
         # Query distinct property types from accounts table
-        query = text("""
-            SELECT DISTINCT property_type 
-            FROM accounts 
-            WHERE property_type IS NOT NULL AND property_type != ''
-            ORDER BY property_type
-        """)
-        
-        result = db_session.execute(query)
+        result = db_session.execute(PROPERTY_TYPES_QUERY)
         property_types = [row[0] for row in result]
         
         return jsonify({
@@ -698,16 +746,7 @@ def get_value_ranges():
         db_session = get_db_connection()
         
         # Query min and max property values
-        query = text("""
-            SELECT 
-                MIN(assessed_value) as min_value,
-                MAX(assessed_value) as max_value,
-                AVG(assessed_value) as avg_value
-            FROM accounts 
-            WHERE assessed_value IS NOT NULL AND assessed_value > 0
-        """)
-        
-        result = db_session.execute(query).fetchone()
+        result = db_session.execute(VALUE_RANGES_QUERY).fetchone()
         
         # Define value ranges based on actual data
         min_value = float(result.min_value) if result.min_value else 0
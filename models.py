@@ -10,19 +10,22 @@ from app_setup import db
 class Parcel(db.Model):
     """Real estate parcel information (main assessment record)."""
     __tablename__ = 'parcels'
+    __table_args__ = (
+        db.Index('idx_parcel_latlon', 'latitude', 'longitude'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.String(50), unique=True, nullable=False, index=True)
     address = db.Column(db.String(255), nullable=False)
-    city = db.Column(db.String(100), nullable=False)
+    city = db.Column(db.String(100), nullable=False, index=True)
     state = db.Column(db.String(50), nullable=False)
     zip_code = db.Column(db.String(20), nullable=False)
 
     # Assessment values
     land_value = db.Column(db.Numeric(12, 2), nullable=False, default=0)
     improvement_value = db.Column(db.Numeric(12, 2), nullable=False, default=0)
-    total_value = db.Column(db.Numeric(12, 2), nullable=False, default=0)
-    assessment_year = db.Column(db.Integer, nullable=False)
+    total_value = db.Column(db.Numeric(12, 2), nullable=False, default=0, index=True)
+    assessment_year = db.Column(db.Integer, nullable=False, index=True)
 
     # Geographic coordinates
     latitude = db.Column(db.Float, nullable=True)
@@ -43,6 +46,9 @@ class Parcel(db.Model):
 class Property(db.Model):
     """Physical property characteristics."""
     __tablename__ = 'properties'
+    __table_args__ = (
+        db.Index('idx_property_parcel_type', 'parcel_id', 'property_type'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcels.id'), nullable=False)
@@ -79,7 +85,7 @@ class Sale(db.Model):
     parcel_id = db.Column(db.Integer, db.ForeignKey('parcels.id'), nullable=False)
 
     # Sale details
-    sale_date = db.Column(db.Date, nullable=False)
+    sale_date = db.Column(db.Date, nullable=False, index=True)
     sale_price = db.Column(db.Numeric(12, 2), nullable=False)
     sale_type = db.Column(db.String(50), nullable=True)
     transaction_id = db.Column(db.String(50), nullable=True)
@@ -102,19 +108,30 @@ class Sale(db.Model):
 class Account(db.Model):
     """Property assessment account information."""
     __tablename__ = 'accounts'
+    __table_args__ = (
+        db.Index('idx_account_latlon', 'latitude', 'longitude'),
+        # Covers the map cluster query (coordinates and values of mapped
+        # accounts) so PostgreSQL can answer it with an index-only scan
+        db.Index(
+            'idx_account_geo',
+            'id',
+            postgresql_include=['latitude', 'longitude', 'property_type', 'property_city', 'assessed_value'],
+            postgresql_where=db.text('latitude IS NOT NULL AND longitude IS NOT NULL')
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     account_id = db.Column(db.String(50), unique=True, nullable=False, index=True)
     owner_name = db.Column(db.String(255), nullable=True)
     mailing_address = db.Column(db.String(255), nullable=True)
-    mailing_city = db.Column(db.String(100), nullable=True)
+    mailing_city = db.Column(db.String(100), nullable=True, index=True)
     mailing_state = db.Column(db.String(50), nullable=True)
     mailing_zip = db.Column(db.String(20), nullable=True)
     
     # Property details
     property_address = db.Column(db.String(255), nullable=True)
-    property_city = db.Column(db.String(100), nullable=True)
-    property_type = db.Column(db.String(50), nullable=True)
+    property_city = db.Column(db.String(100), nullable=True, index=True)
+    property_type = db.Column(db.String(50), nullable=True, index=True)
     legal_description = db.Column(db.Text, nullable=True)
     
     # Geographic coordinates
@@ -123,7 +140,7 @@ class Account(db.Model):
     
     # Assessment details
     assessment_year = db.Column(db.Integer, nullable=True)
-    assessed_value = db.Column(db.Numeric(12, 2), nullable=True)
+    assessed_value = db.Column(db.Numeric(12, 2), nullable=True, index=True)
     tax_amount = db.Column(db.Numeric(12, 2), nullable=True)
     tax_status = db.Column(db.String(50), nullable=True)
     
@@ -138,6 +155,9 @@ class Account(db.Model):
 class PropertyImage(db.Model):
     """Property images and associated metadata."""
     __tablename__ = 'property_images'
+    __table_args__ = (
+        db.Index('idx_property_images_type_id', 'image_type', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     property_id = db.Column(db.String(50), nullable=False, index=True)
@@ -160,4 +180,23 @@ class PropertyImage(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     
     def __repr__(self):
-        return f"<PropertyImage {self.id} for Property {self.property_id}, Type: {self.image_type}>"
\ No newline at end of file
+        return f"<PropertyImage {self.id} for Property {self.property_id}, Type: {self.image_type}>"
+
+class SummaryStatsDaily(db.Model):
+    """Daily snapshot of the dashboard summary totals, used to compute period-over-period changes."""
+    __tablename__ = 'summary_stats_daily'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    snapshot_date = db.Column(db.Date, nullable=False, unique=True, index=True)
+    
+    # Summary totals across all accounts
+    total_properties = db.Column(db.Integer, nullable=False)
+    avg_value = db.Column(db.Numeric(14, 2), nullable=True)
+    total_value = db.Column(db.Numeric(16, 2), nullable=True)
+    sales_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<SummaryStatsDaily {self.snapshot_date}: {self.total_properties} properties>"
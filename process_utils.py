@@ -0,0 +1,165 @@
+"""
+Process supervision helpers shared by the service launcher scripts.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+import requests
+
+# Launch profile for the services, "dev" or "prod" (DEV=1 is shorthand for
+# dev). Development mode turns on auto-reloading and the access log; the
+# reloader watches every source file and adds a supervisor process, so both
+# are off in production. gunicorn.conf.py applies the same switch to Flask
+WORKFLOW_MODE = os.environ.get("WORKFLOW_MODE", "dev" if os.environ.get("DEV") == "1" else "prod").lower()
+DEV_MODE = WORKFLOW_MODE == "dev"
+
+# ASGI application the FastAPI launchers serve
+FASTAPI_APP = os.environ.get("FASTAPI_APP", "app:app")
+
+# uvicorn worker processes for the FastAPI service, one per core (at least
+# two) so CPU-bound request handling isn't serialized on one interpreter. The
+# auto-reloader runs a single worker, so it is only used in development mode
+# or when FASTAPI_RELOAD is set
+FASTAPI_WORKERS = int(os.environ.get("FASTAPI_WORKERS", max(2, os.cpu_count() or 2)))
+FASTAPI_RELOAD = DEV_MODE or os.environ.get("FASTAPI_RELOAD", "false").lower() in ("1", "true", "yes")
+
+# Reload option for launchers that build their own uvicorn command line
+UVICORN_RELOAD_ARGS = ["--reload"] if FASTAPI_RELOAD else []
+
+# uvicorn writes a log record for every request it serves, which costs a
+# formatted write per call on the hot query endpoints, so it is only on in
+# development mode unless FASTAPI_ACCESS_LOG says otherwise
+FASTAPI_ACCESS_LOG = (os.environ.get("FASTAPI_ACCESS_LOG", "true" if DEV_MODE else "false").lower()
+                      in ("1", "true", "yes"))
+
+# Access log option for launchers that build their own uvicorn command line
+UVICORN_ACCESS_LOG_ARGS = [] if FASTAPI_ACCESS_LOG else ["--no-access-log"]
+
+def uvicorn_command(app=FASTAPI_APP, host="0.0.0.0", port=8000):
+    """
+    Build the command line that starts the FastAPI service under uvicorn.
+    
+    Several worker processes serve requests on all cores unless reloading is
+    enabled for development, and the per-request access log is only written
+    in development mode or when FASTAPI_ACCESS_LOG is set. uvicorn's default loop and HTTP settings
+    already pick uvloop and httptools when they are installed.
+    
+    Args:
+        app: ASGI application import path
+        host: Interface to bind
+        port: Port to listen on
+        
+    Returns:
+        Command as a list of arguments
+    """
+    cmd = [sys.executable, "-m", "uvicorn", app, "--host", host, "--port", str(port)]
+    if FASTAPI_RELOAD:
+        cmd.append("--reload")
+    else:
+        cmd.extend(["--workers", str(FASTAPI_WORKERS)])
+    cmd.extend(UVICORN_ACCESS_LOG_ARGS)
+    return cmd
+
+# Readiness checks poll a started service this often, each with a short
+# timeout, so a launcher continues as soon as the service answers
+READINESS_POLL_INTERVAL = 0.1  # seconds
+READINESS_REQUEST_TIMEOUT = 0.25  # seconds
+
+# One session for every readiness check in the process, so a launcher that
+# waits on several services keeps reusing its keep-alive connections
+_readiness_session = requests.Session()
+atexit.register(_readiness_session.close)
+
+def wait_for_http_ready(url, timeout=30, process=None):
+    """
+    Wait until a freshly started service answers a health check.
+    
+    Launchers call this in place of a fixed sleep, so they continue as soon
+    as the service is up and still wait long enough on a slow start. The
+    checks share one keep-alive session across calls.
+    
+    Args:
+        url: Health check URL that returns 200 once the service is ready
+        timeout: Seconds to keep trying
+        process: Popen of the service; waiting stops early if it exits
+        
+    Returns:
+        True if the service answered in time, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            if _readiness_session.get(url, timeout=READINESS_REQUEST_TIMEOUT).status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(READINESS_POLL_INTERVAL)
+    return False
+
+def configure_queued_logging(log_file, fmt, level=logging.INFO):
+    """
+    Configure root logging to write to stderr and a file from a background thread.
+    
+    Logging calls only put the record on a queue; a QueueListener thread
+    formats it and does the console and file I/O. Threads relaying child
+    output therefore go straight back to reading instead of blocking on
+    the writes. The listener is stopped, flushing what's queued, at exit.
+    
+    Args:
+        log_file: Path of the log file
+        fmt: Log record format for the console and file handlers
+        level: Root logger level
+    """
+    formatter = logging.Formatter(fmt)
+    handlers = [logging.StreamHandler(), logging.FileHandler(log_file)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only merges the message arguments; the listener's
+    # handlers apply the full format
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+
+def wait_for_child_exit(processes=None, fallback_interval=1):
+    """
+    Block until a child process exits.
+
+    The exited child is left unreaped (WNOWAIT), so the caller's
+    Popen.poll() still sees its real return code. Launchers call this in
+    place of a sleep-and-poll loop, so they sleep in the kernel instead of
+    waking up every second.
+
+    Args:
+        processes: Popen objects to watch; other children that exit (such as
+            output logging helpers) are reaped and waiting continues.
+            Returns on any child exit if not given.
+        fallback_interval: Seconds to sleep instead if there are no children
+    """
+    watched = {process.pid for process in processes if process} if processes else None
+    while True:
+        try:
+            info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+        except ChildProcessError:
+            # No children to wait for (e.g. a service failed to start)
+            time.sleep(fallback_interval)
+            return
+        if watched is None or info.si_pid in watched:
+            return
+        # Reap the unrelated child so it doesn't wake us again
+        os.waitpid(info.si_pid, 0)
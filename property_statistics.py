@@ -9,28 +9,58 @@ import logging
 import statistics
 from decimal import Decimal
 from collections import defaultdict
-from app_setup import app, db
+from concurrent.futures import ThreadPoolExecutor
+from app_setup import app, db, STATISTICS_QUERY_THREADS
 from models import Account, PropertyImage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def calculate_property_type_statistics():
+# Worker pool for the independent statistics queries; each worker runs in its
+# own application context, so each query gets its own session and connection
+_statistics_executor = ThreadPoolExecutor(max_workers=STATISTICS_QUERY_THREADS, thread_name_prefix="statistics-query")
+
+def _load_valued_accounts_in_context():
+    """Load the valued accounts in a fresh application context."""
+    with app.app_context():
+        return load_valued_accounts()
+
+def load_valued_accounts():
+    """
+    Load the columns the property type and city statistics are built from.
+    
+    Only the three columns used are selected, and one query serves both
+    calculations so the accounts table is read once per statistics package.
+    
+    Returns:
+        List of (property_type, property_city, assessed_value) rows
+    """
+    return db.session.query(
+        Account.property_type,
+        Account.property_city,
+        Account.assessed_value
+    ).filter(
+        Account.assessed_value.isnot(None),
+        db.or_(Account.property_type.isnot(None), Account.property_city.isnot(None))
+    ).all()
+
+def calculate_property_type_statistics(accounts=None):
     """
     Calculate summary statistics for each property type including count, 
     average value, median value, and value ranges.
     
+    Args:
+        accounts: Rows from load_valued_accounts(), loaded if not given
+    
     Returns:
         Dictionary with property type statistics
     """
     with app.app_context():
         try:
             # Get all accounts with property type and assessed value
-            accounts = Account.query.filter(
-                Account.property_type.isnot(None),
-                Account.assessed_value.isnot(None)
-            ).all()
+            if accounts is None:
+                accounts = load_valued_accounts()
             
             if not accounts:
                 logger.warning("No accounts found with property type and assessed value")
@@ -69,21 +99,22 @@ def calculate_property_type_statistics():
             logger.error(f"Error calculating property type statistics: {str(e)}")
             return {}
 
-def calculate_city_statistics():
+def calculate_city_statistics(accounts=None):
     """
     Calculate property statistics for each city including count, average value,
     median value, and property type distribution.
     
+    Args:
+        accounts: Rows from load_valued_accounts(), loaded if not given
+    
     Returns:
         Dictionary with city statistics
     """
     with app.app_context():
         try:
             # Get all accounts with city and assessed value
-            accounts = Account.query.filter(
-                Account.property_city.isnot(None),
-                Account.assessed_value.isnot(None)
-            ).all()
+            if accounts is None:
+                accounts = load_valued_accounts()
             
             if not accounts:
                 logger.warning("No accounts found with property city and assessed value")
@@ -158,25 +189,24 @@ def calculate_value_distribution():
                 "Over $1M"
             ]
             
-            # Get all accounts with assessed value
-            accounts = Account.query.filter(
-                Account.assessed_value.isnot(None)
-            ).all()
+            # Bucket the assessed values in SQL and count each bucket in a
+            # single grouped query instead of loading every account
+            bucket = db.case(
+                *[(Account.assessed_value < max_val, i) for i, (_, max_val) in enumerate(ranges[:-1])],
+                else_=len(ranges) - 1
+            ).label('bucket')
+            bucket_counts = db.session.query(bucket, db.func.count(Account.id)).filter(
+                Account.assessed_value > 0
+            ).group_by(bucket).all()
             
-            if not accounts:
+            if not bucket_counts:
                 logger.warning("No accounts found with assessed value")
                 return {}
             
             # Count properties in each value range
             range_counts = [0] * len(ranges)
-            
-            for account in accounts:
-                if account.assessed_value:
-                    value = float(account.assessed_value)
-                    for i, (min_val, max_val) in enumerate(ranges):
-                        if min_val <= value < max_val or (i == len(ranges) - 1 and value >= min_val):
-                            range_counts[i] += 1
-                            break
+            for index, count in bucket_counts:
+                range_counts[index] = count
             
             # Create distribution dictionary
             distribution = {}
@@ -200,11 +230,13 @@ def get_image_statistics():
     """
     with app.app_context():
         try:
-            # Get count of properties with images
-            image_query = db.session.query(PropertyImage.account_id.distinct()).count()
-            
-            # Get total count of properties
-            account_count = Account.query.count()
+            # Get the count of properties with images, the total count of
+            # properties and the total count of images in one round trip
+            image_query, account_count, total_images = db.session.query(
+                db.session.query(db.func.count(PropertyImage.account_id.distinct())).scalar_subquery(),
+                db.session.query(db.func.count(Account.id)).scalar_subquery(),
+                db.session.query(db.func.count(PropertyImage.id)).scalar_subquery()
+            ).one()
             
             # Calculate percentage of properties with images
             image_percentage = (image_query / account_count * 100) if account_count > 0 else 0
@@ -220,9 +252,6 @@ def get_image_statistics():
             # Convert to dictionary
             images_by_type = {prop_type: count for prop_type, count in accounts_with_images}
             
-            # Get total images count
-            total_images = PropertyImage.query.count()
-            
             image_stats = {
                 'total_properties': account_count,
                 'properties_with_images': image_query,
@@ -247,10 +276,17 @@ def generate_all_statistics():
     """
     with app.app_context():
         try:
-            property_type_stats = calculate_property_type_statistics()
-            city_stats = calculate_city_statistics()
-            value_distribution = calculate_value_distribution()
-            image_stats = get_image_statistics()
+            # The three queries don't depend on each other, so they run
+            # concurrently and the package costs one round trip instead of three
+            accounts_future = _statistics_executor.submit(_load_valued_accounts_in_context)
+            distribution_future = _statistics_executor.submit(calculate_value_distribution)
+            image_stats_future = _statistics_executor.submit(get_image_statistics)
+            
+            accounts = accounts_future.result()
+            property_type_stats = calculate_property_type_statistics(accounts)
+            city_stats = calculate_city_statistics(accounts)
+            value_distribution = distribution_future.result()
+            image_stats = image_stats_future.result()
             
             all_stats = {
                 'property_type_statistics': property_type_stats,
@@ -258,7 +294,7 @@ def generate_all_statistics():
                 'value_distribution': value_distribution,
                 'image_statistics': image_stats,
                 'data_summary': {
-                    'total_properties': Account.query.count(),
+                    'total_properties': image_stats.get('total_properties', 0),
                     'cities_count': len(city_stats),
                     'property_types_count': len(property_type_stats)
                 }
@@ -0,0 +1,50 @@
+"""
+Record Summary Snapshot
+
+This script records today's dashboard summary totals in summary_stats_daily.
+The visualization summary endpoint compares the current totals with the
+snapshot from SUMMARY_CHANGE_PERIOD_DAYS ago and never writes one itself, so
+run this once a day from a scheduler (e.g. cron). Running it again on the
+same day updates that day's snapshot.
+"""
+
+import datetime
+import logging
+from app_setup import app, db
+from models import SummaryStatsDaily
+from routes import summary_totals
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def record_summary_snapshot(snapshot_date=None):
+    """
+    Write the unfiltered summary totals as the snapshot for a day.
+
+    Args:
+        snapshot_date: Day to record (defaults to today)
+
+    Returns:
+        The SummaryStatsDaily row that was written
+    """
+    snapshot_date = snapshot_date or datetime.date.today()
+    total_properties, avg_value, total_value, sales_count = summary_totals()
+
+    snapshot = SummaryStatsDaily.query.filter_by(snapshot_date=snapshot_date).first()
+    if snapshot is None:
+        snapshot = SummaryStatsDaily(snapshot_date=snapshot_date)
+        db.session.add(snapshot)
+    snapshot.total_properties = total_properties
+    snapshot.avg_value = avg_value
+    snapshot.total_value = total_value
+    snapshot.sales_count = sales_count
+    db.session.commit()
+    return snapshot
+
+if __name__ == "__main__":
+    with app.app_context():
+        SummaryStatsDaily.__table__.create(db.engine, checkfirst=True)
+        snapshot = record_summary_snapshot()
+        logger.info(f"Recorded summary snapshot for {snapshot.snapshot_date}: "
+                    f"{snapshot.total_properties} properties, {snapshot.sales_count} recent sales")
@@ -3,48 +3,274 @@ This module provides Flask routes for the MCP Assessor Agent API.
 """
 
 import os
+import re
 import logging
+import threading
+import time
 import requests
+import base64
+import random
 import datetime
-from flask import render_template, jsonify, request, Blueprint, make_response, send_file
-from models import Parcel, Property, Sale, Account, PropertyImage
-from sqlalchemy import func
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from flask import render_template, jsonify, request, Blueprint, make_response, send_file, current_app, Response
+from app_setup import db, DASHBOARD_QUERY_THREADS
+from models import Parcel, Property, Sale, Account, PropertyImage, SummaryStatsDaily
+from sqlalchemy import Float, and_, bindparam, cast, func, select, text
 from app.api.statistics import get_property_statistics
+from app.cache import cache, cached_response, invalidate_cache
 import map_module
+from fastapi_client import FASTAPI_URL, UPSTREAM_TIMEOUT, SESSION, FASTAPI_BREAKER, CircuitOpenError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Define a constant for the FastAPI URL
-FASTAPI_URL = os.environ.get("FASTAPI_URL", "http://localhost:8000")
+# API key required by admin endpoints (unset disables the check)
+ADMIN_API_KEY = os.environ.get("API_KEY")
 
 # Create Blueprint for API routes
 api_routes = Blueprint('api_routes', __name__)
 
+# Worker pool for independent dashboard queries that can run concurrently
+_query_executor = ThreadPoolExecutor(max_workers=DASHBOARD_QUERY_THREADS, thread_name_prefix="dashboard-query")
+
+def _run_in_app_context(query_func):
+    """Run a query function in its own application context and session."""
+    from app_setup import app
+    with app.app_context():
+        return query_func()
+
+def _estimated_row_count(model):
+    """
+    Return the row count of an unfiltered table.
+    
+    On PostgreSQL this reads the planner's estimate from pg_class instead of
+    scanning the whole table. Other databases, and tables that have not been
+    analyzed yet, fall back to an exact count.
+    
+    Args:
+        model: SQLAlchemy model whose table should be counted
+        
+    Returns:
+        Approximate (PostgreSQL) or exact number of rows
+    """
+    if db.engine.dialect.name == 'postgresql':
+        estimate = db.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": model.__tablename__}
+        ).scalar()
+        if estimate and estimate > 0:
+            return estimate
+    return db.session.query(model).count()
+
+# Schemas (FastAPI OpenAPI, database layout) change rarely, so keep them in
+# process and refresh them in the background once they are older than the TTL
+SCHEMA_CACHE_TTL = 300  # seconds
+_schema_cache = {}  # name -> (schema, fetched_at)
+_schema_refreshing = set()
+_schema_cache_lock = threading.Lock()
+
+def _get_cached_schema(name, loader):
+    """
+    Return a cached schema, loading it on first use.
+    
+    Stale entries are served immediately while a single background task
+    reloads them, so page loads never wait on a refresh.
+    """
+    with _schema_cache_lock:
+        entry = _schema_cache.get(name)
+        if entry is not None:
+            schema, fetched_at = entry
+            if time.monotonic() - fetched_at >= SCHEMA_CACHE_TTL and name not in _schema_refreshing:
+                _schema_refreshing.add(name)
+                _query_executor.submit(_refresh_schema, name, loader)
+            return schema
+    
+    schema = loader()
+    with _schema_cache_lock:
+        _schema_cache[name] = (schema, time.monotonic())
+    return schema
+
+def _refresh_schema(name, loader):
+    """Reload a cached schema in the background, keeping the old one on failure."""
+    try:
+        schema = _run_in_app_context(loader)
+        with _schema_cache_lock:
+            _schema_cache[name] = (schema, time.monotonic())
+    except Exception as e:
+        logger.warning(f"Failed to refresh cached {name} schema: {str(e)}")
+    finally:
+        with _schema_cache_lock:
+            _schema_refreshing.discard(name)
+
+def _load_openapi_schema():
+    """Fetch the OpenAPI schema from the FastAPI service."""
+    response = FASTAPI_BREAKER.call(SESSION.get, f"{FASTAPI_URL}/openapi.json", timeout=UPSTREAM_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+# Results of read-only SQL sent to run-query and run-batch, keyed on the
+# statement with its whitespace normalized. Clients re-send the same queries,
+# so a hit skips the database; the least recently used entries are evicted
+# first. Only single SELECT statements are cached, and any statement that may
+# change data clears the cache. The cache is per process: a write handled by
+# another worker is only seen here once the entries expire, so the TTL bounds
+# how stale a result can be
+QUERY_RESULT_CACHE_TTL = 60  # seconds
+QUERY_RESULT_CACHE_SIZE = 1024  # entries
+_query_result_cache = OrderedDict()  # normalized SQL -> (columns, rows, cached_at)
+_query_result_cache_lock = threading.Lock()
+
+# SELECTs that write: SELECT INTO creates a table, and these functions change
+# sequences, settings or other sessions
+_WRITING_SELECT_RE = re.compile(
+    r"\b(into|nextval|setval|set_config|pg_notify|dblink_exec|lo_import|lo_unlink)\b",
+    re.IGNORECASE,
+)
+
+# SELECTs that must run every time: row locks, and functions whose result
+# changes from call to call or that take locks
+_VOLATILE_SELECT_RE = re.compile(
+    r"\bfor\s+(update|no\s+key\s+update|share|key\s+share)\b"
+    r"|\b(now|random|currval|lastval|clock_timestamp|statement_timestamp|transaction_timestamp"
+    r"|timeofday|current_timestamp|current_date|current_time|localtime|localtimestamp"
+    r"|gen_random_uuid|uuid_generate_\w+|txid_current\w*|pg_sleep\w*|pg_(try_)?advisory\w*)\b",
+    re.IGNORECASE,
+)
+
+def _normalize_query(sql_query):
+    """Collapse whitespace and drop a trailing semicolon from a SQL statement."""
+    return " ".join(sql_query.split()).rstrip(";").rstrip()
+
+def _is_select(normalized_query):
+    """Return True if a normalized SQL statement is a SELECT."""
+    return normalized_query[:6].lower() == "select"
+
+def _is_single_statement(normalized_query):
+    """
+    Return True if normalized SQL holds one statement.
+    
+    Any ';' left after normalization counts as a statement separator, even
+    inside a string literal or comment, so the check errs towards "several".
+    """
+    return ";" not in normalized_query
+
+def _may_write(normalized_query):
+    """Return True unless normalized SQL is a single SELECT that doesn't write."""
+    return (
+        not _is_select(normalized_query)
+        or not _is_single_statement(normalized_query)
+        or _WRITING_SELECT_RE.search(normalized_query) is not None
+    )
+
+def _is_cacheable(normalized_query):
+    """Return True if the result of normalized SQL can be reused for the cache TTL."""
+    return not _may_write(normalized_query) and _VOLATILE_SELECT_RE.search(normalized_query) is None
+
+def _execute_cached_query(sql_query):
+    """
+    Execute a custom SQL query, serving repeated SELECTs from the result cache.
+    
+    Multi-statement text, SELECTs that write and SELECTs that lock rows or
+    call volatile functions always run. Once the current session has run a
+    statement that may write, its later SELECTs can see changes that are
+    never committed, so they neither read nor fill the cache for the rest of
+    the session.
+    
+    Args:
+        sql_query: SQL statement to execute
+        
+    Returns:
+        Tuple of (column names, rows as dictionaries)
+    """
+    cache_key = _normalize_query(sql_query)
+    may_write = _may_write(cache_key)
+    if may_write:
+        db.session.info["query_cache_bypass"] = True
+    read_only = _is_cacheable(cache_key) and not db.session.info.get("query_cache_bypass")
+    
+    with _query_result_cache_lock:
+        if may_write:
+            _query_result_cache.clear()
+        elif read_only:
+            entry = _query_result_cache.get(cache_key)
+            if entry is not None and time.monotonic() - entry[2] < QUERY_RESULT_CACHE_TTL:
+                _query_result_cache.move_to_end(cache_key)
+                return entry[0], entry[1]
+    
+    result = db.session.execute(text(sql_query))
+    columns = list(result.keys())
+    rows = [dict(zip(columns, row)) for row in result.fetchall()]
+    
+    if read_only:
+        with _query_result_cache_lock:
+            _query_result_cache[cache_key] = (columns, rows, time.monotonic())
+            _query_result_cache.move_to_end(cache_key)
+            while len(_query_result_cache) > QUERY_RESULT_CACHE_SIZE:
+                _query_result_cache.popitem(last=False)
+    return columns, rows
+
+# Pages whose templates have no per-request data are rendered once per
+# process and served with an ETag so browsers can revalidate with a 304
+STATIC_PAGE_MAX_AGE = 3600  # seconds
+_static_page_cache = {}  # (template, context) -> (html, etag)
+
+def _render_static_page(template_name, max_age=STATIC_PAGE_MAX_AGE, **context):
+    """
+    Render a template that does not depend on the request, with HTTP caching.
+    
+    Args:
+        template_name: Template to render
+        max_age: Seconds browsers may reuse the page without revalidating
+        **context: Template variables (must be the same for every request)
+        
+    Returns:
+        Response with Cache-Control and ETag headers, or a 304 if the
+        client's If-None-Match matches
+    """
+    cache_key = (template_name, tuple(sorted(context.items())))
+    cached = _static_page_cache.get(cache_key)
+    if cached is None or current_app.debug:
+        html = render_template(template_name, **context)
+        cached = (html, hashlib.md5(html.encode('utf-8')).hexdigest())
+        _static_page_cache[cache_key] = cached
+    
+    html, etag = cached
+    response = make_response(html)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
 @api_routes.route('/')
 def index():
     """Render the index page with minimalist design."""
-    return render_template('index_minimal.html', title="Benton County Assessor")
+    return _render_static_page('index_minimal.html', title="Benton County Assessor")
 
 @api_routes.route('/export-data')
 def export_data_page():
     """Render the data export page."""
-    return render_template('export_data.html', title="Export Property Data")
+    return _render_static_page('export_data.html', title="Export Property Data")
 
 @api_routes.route('/api-docs')
 def api_docs():
     """Proxy to FastAPI OpenAPI documentation."""
-    return render_template('api_docs.html', 
-                         fastapi_url=FASTAPI_URL,
-                         title="API Documentation")
+    return _render_static_page('api_docs.html', 
+                               fastapi_url=FASTAPI_URL,
+                               title="API Documentation")
 
 @api_routes.route('/openapi.json')
 def openapi_schema():
     """Proxy to FastAPI OpenAPI schema."""
     try:
-        response = requests.get(f"{FASTAPI_URL}/openapi.json")
-        return jsonify(response.json())
+        return jsonify(_get_cached_schema('openapi', _load_openapi_schema))
+    except CircuitOpenError:
+        return jsonify({"error": "The FastAPI service is temporarily unavailable"}), 503
+    except requests.exceptions.Timeout:
+        logger.error("Timeout fetching OpenAPI schema from FastAPI service")
+        return jsonify({"error": "Request to FastAPI service timed out"}), 504
     except Exception as e:
         logger.error(f"Error fetching OpenAPI schema: {str(e)}")
         return jsonify({"error": "Failed to fetch OpenAPI schema"}), 500
@@ -55,8 +281,6 @@ def health_check():
     try:
         # Check database connection
         try:
-            from app_setup import db
-            from sqlalchemy import text
             db.session.execute(text("SELECT 1")).first()
             db_status = "healthy"
         except Exception as e:
@@ -65,11 +289,10 @@ def health_check():
         
         # Check for imported data
         try:
-            from app_setup import db
             from models import Account, PropertyImage
             
-            accounts_count = db.session.query(Account).count()
-            images_count = db.session.query(PropertyImage).count()
+            accounts_count = _estimated_row_count(Account)
+            images_count = _estimated_row_count(PropertyImage)
             
             data_status = "active" if accounts_count > 0 or images_count > 0 else "empty"
             data_details = {
@@ -103,9 +326,6 @@ def health_check():
 def run_query():
     """Execute a custom SQL query against the database."""
     try:
-        from app_setup import db
-        from sqlalchemy import text
-        
         # Get the query from the request
         data = request.json
         sql_query = data.get('query')
@@ -116,12 +336,8 @@ def run_query():
                 "message": "No query provided"
             }), 400
         
-        # Execute the query directly using SQLAlchemy
-        result = db.session.execute(text(sql_query))
-        
-        # Format the result
-        columns = list(result.keys())
-        rows = [dict(zip(columns, row)) for row in result.fetchall()]
+        # Execute the query directly using SQLAlchemy, or reuse a cached result
+        columns, rows = _execute_cached_query(sql_query)
         
         return jsonify({
             "status": "success",
@@ -135,12 +351,76 @@ def run_query():
             "message": f"Failed to execute query: {str(e)}"
         }), 500
         
+# Most queries accepted by a single run-batch request
+MAX_BATCH_QUERIES = 50
+
+@api_routes.route('/api/run-batch', methods=['POST'])
+def run_batch():
+    """
+    Execute several custom SQL queries against the database in one request.
+    
+    The queries run in order in one session and transaction, so a client that
+    would send a run-query request per query makes a single round trip.
+    Each result has the same columns and rows as a run-query response.
+    
+    Batches are read-only: every query must be a single SELECT that doesn't
+    write, PostgreSQL runs the batch in a READ ONLY transaction, and the
+    transaction is rolled back afterwards rather than committed.
+    """
+    try:
+        data = request.json
+        queries = data.get('queries')
+        
+        if not queries or not isinstance(queries, list):
+            return jsonify({
+                "status": "error",
+                "message": "No queries provided"
+            }), 400
+        if len(queries) > MAX_BATCH_QUERIES:
+            return jsonify({
+                "status": "error",
+                "message": f"A batch may contain at most {MAX_BATCH_QUERIES} queries"
+            }), 400
+        for index, sql_query in enumerate(queries):
+            if not isinstance(sql_query, str) or not sql_query.strip():
+                return jsonify({
+                    "status": "error",
+                    "message": f"Query {index} must be a non-empty string"
+                }), 400
+            if _may_write(_normalize_query(sql_query)):
+                return jsonify({
+                    "status": "error",
+                    "message": f"Query {index} must be a single SELECT statement; batches are read-only"
+                }), 400
+        
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text("SET TRANSACTION READ ONLY"))
+        
+        results = []
+        for sql_query in queries:
+            columns, rows = _execute_cached_query(sql_query)
+            results.append({
+                "columns": columns,
+                "rows": rows
+            })
+        db.session.rollback()
+        
+        return jsonify({
+            "status": "success",
+            "results": results
+        })
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error executing query batch: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to execute query batch: {str(e)}"
+        }), 500
+        
 @api_routes.route('/api/parameterized-query', methods=['POST'])
 def parameterized_query():
     """Execute a parameterized SQL query against the database with enhanced security."""
     try:
-        from app_setup import db
-        from sqlalchemy import text
         import time
         
         # Get query details from request
@@ -322,6 +602,190 @@ def nl_to_sql():
         }), 500
         
 # Direct database access routes for imported data
+def _encode_cursor(last_id):
+    """Encode the last id of a page as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+def _decode_cursor(cursor):
+    """Decode a pagination cursor back to the id it was built from."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _paginate_by_id(query, id_column, offset, limit, cursor=None):
+    """
+    Fetch one page of a query ordered by its primary key.
+    
+    With a cursor the page is located by seeking past the last id seen
+    (keyset pagination), so deep pages cost the same as the first one.
+    Without a cursor the legacy offset is applied.
+    
+    Args:
+        query: SQLAlchemy query to page through
+        id_column: Primary key column to order and seek by
+        offset: Number of rows to skip when no cursor is given
+        limit: Page size
+        cursor: Opaque cursor from a previous page's next_cursor
+        
+    Returns:
+        Tuple of (rows, next_cursor), where next_cursor is None on the last page
+    """
+    query = query.order_by(id_column)
+    if cursor:
+        query = query.filter(id_column > _decode_cursor(cursor))
+    elif offset:
+        query = query.offset(offset)
+    
+    # Fetch one extra row to find out whether another page follows
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, _encode_cursor(rows[-1].id)
+    return rows, None
+
+# Listing items serialized per chunk written to the client
+JSON_STREAM_CHUNK_SIZE = 100
+
+def _stream_json_listing(list_key, items, **fields):
+    """
+    Stream a JSON object holding a list, serializing the list in chunks.
+    
+    The response starts going out after the first chunk of items instead of
+    after the whole page has been built into dicts and encoded as one string.
+    
+    Args:
+        list_key: Key of the list in the response object
+        items: Iterable of JSON-serializable items, typically a generator
+        **fields: Other top-level fields, written after the list
+        
+    Returns:
+        Streaming JSON response
+    """
+    dumps = current_app.json.dumps
+    
+    def generate():
+        yield '{' + dumps(list_key) + ':['
+        separator = ''
+        chunk = []
+        for item in items:
+            chunk.append(dumps(item))
+            if len(chunk) == JSON_STREAM_CHUNK_SIZE:
+                yield separator + ','.join(chunk)
+                separator = ','
+                chunk = []
+        if chunk:
+            yield separator + ','.join(chunk)
+        yield ']'
+        for name, value in fields.items():
+            yield ',' + dumps(name) + ':' + dumps(value)
+        yield '}'
+    
+    return Response(generate(), mimetype='application/json')
+
+def _requested_total(query, model, filtered):
+    """
+    Count the rows of a listing, but only when the client asks for it.
+    
+    Paging with a cursor or offset does not need the total, so the count is
+    skipped unless ?include_total=1 is passed. Unfiltered tables use the
+    cheap row estimate; filtered ones run a plain COUNT with no ORDER BY or
+    subquery wrapper.
+    
+    Args:
+        query: Filtered SQLAlchemy query for the listing
+        model: Model being listed
+        filtered: Whether any filters were applied to the query
+        
+    Returns:
+        Row count, or None if the client did not request it
+    """
+    if not request.args.get('include_total'):
+        return None
+    if not filtered:
+        return _estimated_row_count(model)
+    return query.order_by(None).with_entities(func.count(model.id)).scalar()
+
+# Columns read by the imported data endpoints. Querying these instead of whole
+# models returns lightweight rows with no identity map or change tracking.
+# Money columns are cast to float in SQL so the driver hands back floats and
+# the serializers don't convert each Decimal in Python
+_ACCOUNT_COLUMNS = (
+    Account.id,
+    Account.account_id,
+    Account.owner_name,
+    Account.mailing_address,
+    Account.mailing_city,
+    Account.mailing_state,
+    Account.mailing_zip,
+    Account.property_address,
+    Account.property_city,
+    Account.legal_description,
+    Account.assessment_year,
+    cast(Account.assessed_value, Float).label('assessed_value'),
+    cast(Account.tax_amount, Float).label('tax_amount'),
+    Account.tax_status,
+    Account.created_at,
+    Account.updated_at
+)
+_PROPERTY_IMAGE_COLUMNS = (
+    PropertyImage.id,
+    PropertyImage.property_id,
+    PropertyImage.account_id,
+    PropertyImage.image_url,
+    PropertyImage.image_path,
+    PropertyImage.image_type,
+    PropertyImage.image_date,
+    PropertyImage.width,
+    PropertyImage.height,
+    PropertyImage.file_size,
+    PropertyImage.file_format,
+    PropertyImage.created_at,
+    PropertyImage.updated_at
+)
+_IMPROVEMENT_COLUMNS = (
+    Property.id,
+    Property.property_type,
+    Property.square_footage,
+    Property.stories,
+    Property.year_built,
+    Property.created_at,
+    Property.updated_at,
+    Parcel.parcel_id.label('parcel_number'),
+    cast(Parcel.improvement_value, Float).label('improvement_value')
+)
+
+def _account_to_dict(account):
+    """
+    Serialize an account for the imported data API.
+    
+    Args:
+        account: Row selected with _ACCOUNT_COLUMNS
+        
+    Returns:
+        JSON-serializable dictionary of the account fields
+    """
+    created_at = account.created_at
+    updated_at = account.updated_at
+    return {
+        'id': account.id,
+        'account_id': account.account_id,
+        'owner_name': account.owner_name,
+        'mailing_address': account.mailing_address,
+        'mailing_city': account.mailing_city,
+        'mailing_state': account.mailing_state,
+        'mailing_zip': account.mailing_zip,
+        'property_address': account.property_address,
+        'property_city': account.property_city,
+        'legal_description': account.legal_description,
+        'assessment_year': account.assessment_year,
+        'assessed_value': account.assessed_value or None,
+        'tax_amount': account.tax_amount or None,
+        'tax_status': account.tax_status,
+        'created_at': created_at.isoformat() if created_at else None,
+        'updated_at': updated_at.isoformat() if updated_at else None
+    }
+
 @api_routes.route('/api/imported-data/accounts', methods=['GET'])
 def get_imported_accounts():
     """Get imported account data directly from the database."""
@@ -329,51 +793,36 @@ def get_imported_accounts():
         # Get query parameters
         offset = request.args.get('offset', 0, type=int)
         limit = request.args.get('limit', 100, type=int)
+        cursor = request.args.get('cursor')
         owner_name = request.args.get('owner_name', '')
         
         # Build query
-        from app_setup import db
-        query = db.session.query(Account)
+        query = db.session.query(*_ACCOUNT_COLUMNS)
         
         # Apply filters
         if owner_name:
             query = query.filter(Account.owner_name.ilike(f'%{owner_name}%'))
         
-        # Get total count
-        total_count = query.count()
-        
-        # Apply pagination
-        query = query.order_by(Account.id).offset(offset).limit(limit)
+        # Get total count if requested
+        total_count = _requested_total(query, Account, filtered=bool(owner_name))
         
-        # Execute query
-        accounts = query.all()
+        # Apply pagination and execute query
+        accounts, next_cursor = _paginate_by_id(query, Account.id, offset, limit, cursor)
         
         # Prepare response
-        accounts_data = [{
-            'id': account.id,
-            'account_id': account.account_id,
-            'owner_name': account.owner_name,
-            'mailing_address': account.mailing_address,
-            'mailing_city': account.mailing_city,
-            'mailing_state': account.mailing_state,
-            'mailing_zip': account.mailing_zip,
-            'property_address': account.property_address,
-            'property_city': account.property_city,
-            'legal_description': account.legal_description,
-            'assessment_year': account.assessment_year,
-            'assessed_value': float(account.assessed_value) if account.assessed_value else None,
-            'tax_amount': float(account.tax_amount) if account.tax_amount else None,
-            'tax_status': account.tax_status,
-            'created_at': account.created_at.isoformat() if account.created_at else None,
-            'updated_at': account.updated_at.isoformat() if account.updated_at else None
-        } for account in accounts]
-        
+        return _stream_json_listing(
+            'accounts',
+            (_account_to_dict(account) for account in accounts),
+            total=total_count,
+            offset=offset,
+            limit=limit,
+            next_cursor=next_cursor
+        )
+    except ValueError as e:
         return jsonify({
-            'accounts': accounts_data,
-            'total': total_count,
-            'offset': offset,
-            'limit': limit,
-        })
+            "status": "error",
+            "message": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error fetching accounts data: {str(e)}")
         return jsonify({
@@ -386,8 +835,7 @@ def get_imported_account(account_id):
     """Get details for a specific account directly from the database."""
     try:
         # Build query
-        from app_setup import db
-        account = db.session.query(Account).filter(Account.account_id == account_id).first()
+        account = db.session.query(*_ACCOUNT_COLUMNS).filter(Account.account_id == account_id).first()
         
         if not account:
             return jsonify({
@@ -396,24 +844,7 @@ def get_imported_account(account_id):
             }), 404
         
         # Prepare response
-        account_data = {
-            'id': account.id,
-            'account_id': account.account_id,
-            'owner_name': account.owner_name,
-            'mailing_address': account.mailing_address,
-            'mailing_city': account.mailing_city,
-            'mailing_state': account.mailing_state,
-            'mailing_zip': account.mailing_zip,
-            'property_address': account.property_address,
-            'property_city': account.property_city,
-            'legal_description': account.legal_description,
-            'assessment_year': account.assessment_year,
-            'assessed_value': float(account.assessed_value) if account.assessed_value else None,
-            'tax_amount': float(account.tax_amount) if account.tax_amount else None,
-            'tax_status': account.tax_status,
-            'created_at': account.created_at.isoformat() if account.created_at else None,
-            'updated_at': account.updated_at.isoformat() if account.updated_at else None
-        }
+        account_data = _account_to_dict(account)
         
         return jsonify({
             'status': 'success',
@@ -433,12 +864,12 @@ def get_property_images():
         # Get query parameters
         offset = request.args.get('offset', 0, type=int)
         limit = request.args.get('limit', 100, type=int)
+        cursor = request.args.get('cursor')
         property_id = request.args.get('property_id', '')
         image_type = request.args.get('image_type', '')
         
         # Build query
-        from app_setup import db
-        query = db.session.query(PropertyImage)
+        query = db.session.query(*_PROPERTY_IMAGE_COLUMNS)
         
         # Apply filters
         if property_id:
@@ -446,17 +877,14 @@ def get_property_images():
         if image_type:
             query = query.filter(PropertyImage.image_type == image_type)
         
-        # Get total count
-        total_count = query.count()
+        # Get total count if requested
+        total_count = _requested_total(query, PropertyImage, filtered=bool(property_id or image_type))
         
-        # Apply pagination
-        query = query.order_by(PropertyImage.id).offset(offset).limit(limit)
-        
-        # Execute query
-        images = query.all()
+        # Apply pagination and execute query
+        images, next_cursor = _paginate_by_id(query, PropertyImage.id, offset, limit, cursor)
         
         # Prepare response
-        images_data = [{
+        images_data = ({
             'id': image.id,
             'property_id': image.property_id,
             'account_id': image.account_id,
@@ -470,14 +898,21 @@ def get_property_images():
             'file_format': image.file_format,
             'created_at': image.created_at.isoformat() if image.created_at else None,
             'updated_at': image.updated_at.isoformat() if image.updated_at else None
-        } for image in images]
+        } for image in images)
         
+        return _stream_json_listing(
+            'property_images',
+            images_data,
+            total=total_count,
+            offset=offset,
+            limit=limit,
+            next_cursor=next_cursor
+        )
+    except ValueError as e:
         return jsonify({
-            'property_images': images_data,
-            'total': total_count,
-            'offset': offset,
-            'limit': limit,
-        })
+            "status": "error",
+            "message": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error fetching property images data: {str(e)}")
         return jsonify({
@@ -492,65 +927,56 @@ def get_improvements():
         # Get query parameters
         offset = request.args.get('offset', 0, type=int)
         limit = request.args.get('limit', 100, type=int)
+        cursor = request.args.get('cursor')
         property_id = request.args.get('property_id', '')
         
         # Build query
-        from app_setup import db
         # Since we don't have a dedicated Improvement model,
-        # we'll query from Property model which has improvement details
-        query = db.session.query(Property)
+        # we'll query from Property model which has improvement details.
+        # The parcel columns come from the same joined query so building the
+        # response doesn't issue one lookup per row
+        query = db.session.query(*_IMPROVEMENT_COLUMNS).join(Parcel, Parcel.id == Property.parcel_id)
         
         # Apply filters
         if property_id:
-            # Filter properties that have a matching parcel ID string
-            parcel = db.session.query(Parcel).filter(Parcel.parcel_id.ilike(f'%{property_id}%')).first()
-            if parcel:
-                query = query.filter(Property.parcel_id == parcel.id)
-            else:
-                # No matching parcel, return empty result
-                return jsonify({
-                    'improvements': [],
-                    'total': 0,
-                    'offset': offset,
-                    'limit': limit,
-                })
-        
-        # Get total count
-        total_count = query.count()
+            # Filter properties whose parcel ID matches the search string
+            query = query.filter(Parcel.parcel_id.ilike(f'%{property_id}%'))
         
-        # Apply pagination
-        query = query.order_by(Property.id).offset(offset).limit(limit)
+        # Get total count if requested
+        total_count = _requested_total(query, Property, filtered=bool(property_id))
         
-        # Execute query
-        properties = query.all()
+        # Apply pagination and execute query
+        properties, next_cursor = _paginate_by_id(query, Property.id, offset, limit, cursor)
         
         # Prepare response
         # Map property attributes to improvement attributes
-        improvements_data = []
-        for prop in properties:
-            # Get the associated parcel
-            parcel = db.session.query(Parcel).filter(Parcel.id == prop.parcel_id).first()
-            if parcel:
-                improvements_data.append({
-                    'id': prop.id,
-                    'property_id': parcel.parcel_id,
-                    'improvement_id': f"I-{prop.id}",  # Generate an improvement ID
-                    'description': f"{prop.property_type} structure",
-                    'improvement_value': float(parcel.improvement_value) if parcel.improvement_value else 0,
-                    'living_area': prop.square_footage,
-                    'stories': prop.stories,
-                    'year_built': prop.year_built,
-                    'primary_use': prop.property_type,
-                    'created_at': prop.created_at.isoformat() if prop.created_at else None,
-                    'updated_at': prop.updated_at.isoformat() if prop.updated_at else None
-                })
+        improvements_data = ({
+            'id': prop.id,
+            'property_id': prop.parcel_number,
+            'improvement_id': f"I-{prop.id}",  # Generate an improvement ID
+            'description': f"{prop.property_type} structure",
+            'improvement_value': prop.improvement_value or 0,
+            'living_area': prop.square_footage,
+            'stories': prop.stories,
+            'year_built': prop.year_built,
+            'primary_use': prop.property_type,
+            'created_at': prop.created_at.isoformat() if prop.created_at else None,
+            'updated_at': prop.updated_at.isoformat() if prop.updated_at else None
+        } for prop in properties)
         
+        return _stream_json_listing(
+            'improvements',
+            improvements_data,
+            total=total_count,
+            offset=offset,
+            limit=limit,
+            next_cursor=next_cursor
+        )
+    except ValueError as e:
         return jsonify({
-            'improvements': improvements_data,
-            'total': total_count,
-            'offset': offset,
-            'limit': limit,
-        })
+            "status": "error",
+            "message": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error fetching improvements data: {str(e)}")
         return jsonify({
@@ -558,54 +984,62 @@ def get_improvements():
             "message": f"Failed to fetch improvements data: {str(e)}"
         }), 500
         
+def _load_query_builder_schema():
+    """Introspect the database and group column details by table for the query builder."""
+    from sqlalchemy import inspect
+    
+    # Create an inspector to get database schema information
+    inspector = inspect(db.engine)
+    
+    # Get all tables and their schema details
+    db_schema = []
+    for table_name in inspector.get_table_names():
+        # Get primary and foreign key columns once per table rather than per column
+        pk_set = set(inspector.get_pk_constraint(table_name).get('constrained_columns', []))
+        fk_set = {
+            col
+            for fk in inspector.get_foreign_keys(table_name)
+            for col in fk.get('constrained_columns', [])
+        }
+        
+        # Get column details
+        for column in inspector.get_columns(table_name):
+            is_primary_key = column['name'] in pk_set
+            is_foreign_key = column['name'] in fk_set
+            
+            # Add column info to schema
+            db_schema.append({
+                'table_name': table_name,
+                'column_name': column['name'],
+                'data_type': str(column['type']),
+                'is_nullable': column.get('nullable', True),
+                'is_primary_key': is_primary_key,
+                'is_foreign_key': is_foreign_key
+            })
+    
+    # Transform schema data into a more usable format for the UI
+    tables = {}
+    for item in db_schema:
+        table_name = item.get("table_name")
+        if table_name not in tables:
+            tables[table_name] = {"columns": []}
+        
+        tables[table_name]["columns"].append({
+            "name": item.get("column_name"),
+            "data_type": item.get("data_type"),
+            "is_nullable": item.get("is_nullable", True),
+            "is_primary_key": item.get("is_primary_key", False),
+            "is_foreign_key": item.get("is_foreign_key", False)
+        })
+    
+    return tables
+
 @api_routes.route('/query-builder')
 def query_builder():
     """Render the interactive query builder interface."""
     # Get database schema directly from SQLAlchemy
     try:
-        from app_setup import db
-        from sqlalchemy import text, inspect
-        
-        # Create an inspector to get database schema information
-        inspector = inspect(db.engine)
-        
-        # Get all tables and their schema details
-        db_schema = []
-        for table_name in inspector.get_table_names():
-            # Get column details
-            for column in inspector.get_columns(table_name):
-                # Get primary key info
-                primary_keys = inspector.get_pk_constraint(table_name).get('constrained_columns', [])
-                is_primary_key = column['name'] in primary_keys
-                
-                # Get foreign key info
-                foreign_keys = inspector.get_foreign_keys(table_name)
-                is_foreign_key = any(column['name'] in fk.get('constrained_columns', []) for fk in foreign_keys)
-                
-                # Add column info to schema
-                db_schema.append({
-                    'table_name': table_name,
-                    'column_name': column['name'],
-                    'data_type': str(column['type']),
-                    'is_nullable': column.get('nullable', True),
-                    'is_primary_key': is_primary_key,
-                    'is_foreign_key': is_foreign_key
-                })
-        
-        # Transform schema data into a more usable format for the UI
-        tables = {}
-        for item in db_schema:
-            table_name = item.get("table_name")
-            if table_name not in tables:
-                tables[table_name] = {"columns": []}
-            
-            tables[table_name]["columns"].append({
-                "name": item.get("column_name"),
-                "data_type": item.get("data_type"),
-                "is_nullable": item.get("is_nullable", True),
-                "is_primary_key": item.get("is_primary_key", False),
-                "is_foreign_key": item.get("is_foreign_key", False)
-            })
+        tables = _get_cached_schema('query_builder', _load_query_builder_schema)
     except Exception as e:
         logger.error(f"Error fetching schema for query builder: {str(e)}")
         tables = {}
@@ -618,6 +1052,42 @@ def query_builder():
         schema=tables
     )
 
+# Filter options only change when new data is imported. The cache is per
+# gunicorn worker and POST /admin/flush-cache only reaches the worker that
+# handles it, so this TTL bounds how long the other workers, and browsers
+# holding the dashboard page, show the options from before an import
+FILTER_OPTIONS_TTL = 300  # seconds
+
+@cache(ttl_seconds=FILTER_OPTIONS_TTL)
+def _get_filter_options():
+    """
+    Load the city and property type dropdown options for the dashboard.
+    
+    The result is cached for FILTER_OPTIONS_TTL seconds.
+    
+    Returns:
+        Tuple of (cities, property_types)
+    """
+    # Get distinct cities
+    cities_future = _query_executor.submit(
+        _run_in_app_context,
+        lambda: [city[0] for city in db.session.query(Parcel.city).distinct().order_by(Parcel.city)]
+    )
+    
+    # Get distinct property types
+    property_types_future = _query_executor.submit(
+        _run_in_app_context,
+        lambda: [
+            p_type for (p_type,) in
+            db.session.query(Property.property_type).filter(
+                Property.property_type.isnot(None),
+                Property.property_type != ''
+            ).distinct().order_by(Property.property_type)
+        ]
+    )
+    
+    return cities_future.result(), property_types_future.result()
+
 @api_routes.route('/visualize')
 def visualize():
     """Render the data visualization dashboard."""
@@ -625,37 +1095,59 @@ def visualize():
     current_year = datetime.datetime.now().year
     
     # Get list of cities and property types for filters
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Get distinct cities
-            cities = [city[0] for city in db.session.query(Parcel.city).distinct().order_by(Parcel.city)]
-            
-            # Get distinct property types
-            property_types = [
-                p_type[0] for p_type in 
-                db.session.query(Property.property_type).distinct().order_by(Property.property_type)
-                if p_type[0]  # Filter out None values
-            ]
-        except Exception as e:
-            logger.error(f"Error fetching filter options: {str(e)}")
-            cities = []
-            property_types = []
+    try:
+        cities, property_types = _get_filter_options()
+    except Exception as e:
+        logger.error(f"Error fetching filter options: {str(e)}")
+        cities = []
+        property_types = []
     
-    return render_template(
+    return _render_static_page(
         'visualize.html',
+        max_age=FILTER_OPTIONS_TTL,
         title="MCP Assessor Agent API",
         version="1.0.0",
         current_year=current_year,
-        cities=cities,
-        property_types=property_types,
+        cities=tuple(cities),
+        property_types=tuple(property_types),
         description="Interactive data visualization for property assessments"
     )
 
+@api_routes.route('/admin/flush-cache', methods=['POST'])
+def flush_cache():
+    """
+    Clear cached filter options, schemas, query results and responses, e.g. after a data import.
+    
+    Only the caches of the worker process that handles the request are
+    cleared; the other workers catch up as their entries expire. The endpoint
+    is disabled unless API_KEY is configured.
+    """
+    if not ADMIN_API_KEY:
+        return jsonify({
+            "status": "error",
+            "message": "Cache flush is disabled because no API key is configured"
+        }), 403
+    if request.headers.get('X-API-Key') != ADMIN_API_KEY:
+        return jsonify({
+            "status": "error",
+            "message": "Invalid or missing API key"
+        }), 401
+    
+    invalidate_cache()
+    with _schema_cache_lock:
+        _schema_cache.clear()
+    with _query_result_cache_lock:
+        _query_result_cache.clear()
+    
+    return jsonify({
+        "status": "success",
+        "message": "Caches cleared"
+    })
+
 @api_routes.route('/imported-data')
 def imported_data():
     """Render the imported data dashboard."""
-    return render_template(
+    return _render_static_page(
         'imported_data.html',
         title="Imported Assessment Data",
         version="1.0.0",
@@ -692,228 +1184,286 @@ def export_combined_data_route(format):
     return export_combined_data(format=format, limit=limit)
 
 # API endpoints for visualization data
+# Window for recent sales and for the dashboard's period-over-period changes
+SUMMARY_CHANGE_PERIOD_DAYS = 30
+
+def _percent_change(current, previous):
+    """
+    Calculate the percentage change between two values.
+    
+    Args:
+        current: Value for the current period
+        previous: Value for the previous period
+        
+    Returns:
+        Percentage change rounded to one decimal, or 0.0 without a usable baseline
+    """
+    if not previous:
+        return 0.0
+    return round((float(current) - float(previous)) / float(previous) * 100, 1)
+
+def summary_totals(city=None, min_value=None, max_value=None):
+    """
+    Calculate the dashboard summary totals, optionally filtered.
+    
+    City filters compare the property's city: Account.property_city for the
+    account totals and Parcel.city for the sales.
+    
+    Args:
+        city: Property city to restrict to
+        min_value: Lowest assessed value to include
+        max_value: Highest assessed value to include
+        
+    Returns:
+        Tuple of (total_properties, avg_value, total_value, recent_sales)
+    """
+    # Build base query with filters using Account model since we have account data
+    accounts_query = Account.query
+    if city:
+        accounts_query = accounts_query.filter(Account.property_city == city)
+    if min_value:
+        accounts_query = accounts_query.filter(Account.assessed_value >= float(min_value))
+    if max_value:
+        accounts_query = accounts_query.filter(Account.assessed_value <= float(max_value))
+    
+    # Calculate statistics over the filtered accounts in one query
+    total_properties, avg_value, total_value = accounts_query.with_entities(
+        func.count(Account.id),
+        func.avg(Account.assessed_value),
+        func.sum(Account.assessed_value)
+    ).one()
+    
+    # Count sales in the current period
+    period_start = datetime.date.today() - datetime.timedelta(days=SUMMARY_CHANGE_PERIOD_DAYS)
+    sales_query = db.session.query(func.count(Sale.id)).filter(Sale.sale_date >= period_start)
+    if city:
+        sales_query = sales_query.join(Parcel, Parcel.id == Sale.parcel_id).filter(Parcel.city == city)
+    recent_sales = sales_query.scalar() or 0
+    
+    return total_properties, avg_value or 0, total_value or 0, recent_sales
+
+def _get_summary_baseline():
+    """
+    Return the summary snapshot from a period ago.
+    
+    record_summary_snapshot.py writes one snapshot a day, so the changes are
+    an indexed lookup instead of a second aggregate pass over the previous
+    period.
+    
+    Returns:
+        SummaryStatsDaily from at least one period ago, or None if there isn't one yet
+    """
+    cutoff = datetime.date.today() - datetime.timedelta(days=SUMMARY_CHANGE_PERIOD_DAYS)
+    return SummaryStatsDaily.query.filter(
+        SummaryStatsDaily.snapshot_date <= cutoff
+    ).order_by(SummaryStatsDaily.snapshot_date.desc()).first()
+
 @api_routes.route('/api/visualization-data/summary')
+@cached_response(ttl_seconds=300, query_args=('city', 'min_value', 'max_value'))
 def visualization_summary():
     """Get summary statistics for the visualization dashboard."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Get query parameters for filtering
-            city = request.args.get('city')
-            min_value = request.args.get('min_value')
-            max_value = request.args.get('max_value')
-            
-            # Build base query with filters using Account model since we have account data
-            accounts_query = Account.query
-            if city:
-                accounts_query = accounts_query.filter(Account.mailing_city == city)
-            if min_value and hasattr(Account, 'assessed_value'):
-                accounts_query = accounts_query.filter(Account.assessed_value >= float(min_value))
-            if max_value and hasattr(Account, 'assessed_value'):
-                accounts_query = accounts_query.filter(Account.assessed_value <= float(max_value))
-            
-            # Calculate statistics
-            total_properties = accounts_query.count()
-            avg_value = db.session.query(func.avg(Account.assessed_value)).scalar() or 0
-            total_value = db.session.query(func.sum(Account.assessed_value)).scalar() or 0
-            
-            # We don't have real sales data, so use static values for demo
-            recent_sales = 125  # Example value
-            
-            # For demo purposes, we're using static change indicators
-            # In a real app, these would be calculated by comparing to previous periods
-            properties_change = 2.5  # 2.5% increase
-            value_change = 4.2       # 4.2% increase
-            total_value_change = 3.8  # 3.8% increase
-            sales_change = -1.5      # 1.5% decrease
-            
-            return jsonify({
-                "status": "success",
-                "total_properties": total_properties,
-                "avg_value": float(avg_value),
-                "total_value": float(total_value),
-                "recent_sales": recent_sales,
-                "properties_change": properties_change,
-                "value_change": value_change,
-                "total_value_change": total_value_change,
-                "sales_change": sales_change
-            })
-        except Exception as e:
-            logger.error(f"Error generating visualization summary: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate summary: {str(e)}"
-            }), 500
+    try:
+        # Get query parameters for filtering
+        city = request.args.get('city')
+        min_value = request.args.get('min_value')
+        max_value = request.args.get('max_value')
+        
+        total_properties, avg_value, total_value, recent_sales = summary_totals(city, min_value, max_value)
+        
+        # Snapshots cover all accounts, so filtered views have no baseline to compare to
+        properties_change = value_change = total_value_change = sales_change = 0.0
+        if not (city or min_value or max_value):
+            baseline = _get_summary_baseline()
+            if baseline:
+                properties_change = _percent_change(total_properties, baseline.total_properties)
+                value_change = _percent_change(avg_value, baseline.avg_value)
+                total_value_change = _percent_change(total_value, baseline.total_value)
+                sales_change = _percent_change(recent_sales, baseline.sales_count)
+        
+        return jsonify({
+            "status": "success",
+            "total_properties": total_properties,
+            "avg_value": float(avg_value),
+            "total_value": float(total_value),
+            "recent_sales": recent_sales,
+            "properties_change": properties_change,
+            "value_change": value_change,
+            "total_value_change": total_value_change,
+            "sales_change": sales_change
+        })
+    except Exception as e:
+        logger.error(f"Error generating visualization summary: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate summary: {str(e)}"
+        }), 500
+
+# Dashboard chart statements that take no request parameters are built once
+# at import time; each request just executes them
+_PROPERTY_TYPE_VALUES_STMT = (
+    select(Property.property_type, func.avg(Parcel.total_value).label('avg_value'))
+    .join(Parcel, Parcel.id == Property.parcel_id)
+    .where(Property.property_type != None)  # Exclude null property types
+    .group_by(Property.property_type)
+    .order_by(Property.property_type)
+)
+
+VALUE_DISTRIBUTION_RANGES = [
+    (0, 100000, 'Under $100K'),
+    (100000, 250000, '$100K-$250K'),
+    (250000, 500000, '$250K-$500K'),
+    (500000, 1000000, '$500K-$1M'),
+    (1000000, float('inf'), 'Over $1M')
+]
+
+# Count parcels in every range with a single aggregate query
+_VALUE_DISTRIBUTION_STMT = select(*[
+    func.count(Parcel.id).filter(
+        and_(Parcel.total_value >= min_val, Parcel.total_value < max_val)
+        if max_val != float('inf') else Parcel.total_value >= min_val
+    )
+    for min_val, max_val, _ in VALUE_DISTRIBUTION_RANGES
+])
+
+# Average value and property count for every assessment year at once
+_VALUE_TRENDS_STMT = (
+    select(Parcel.assessment_year, func.avg(Parcel.total_value), func.count(Parcel.id))
+    .group_by(Parcel.assessment_year)
+    .order_by(Parcel.assessment_year)
+)
 
 @api_routes.route('/api/visualization-data/property-types')
+@cached_response(ttl_seconds=300)
 def visualization_property_types():
     """Get property values by property type for visualization."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Query average values by property type
-            results = db.session.query(
-                Property.property_type,
-                func.avg(Parcel.total_value).label('avg_value')
-            ).join(
-                Parcel, Parcel.id == Property.parcel_id
-            ).group_by(
-                Property.property_type
-            ).filter(
-                Property.property_type != None  # Exclude null property types
-            ).order_by(
-                Property.property_type
-            ).all()
-            
-            # Format the results
-            labels = [r[0] for r in results]
-            values = [float(r[1]) for r in results]
-            
-            return jsonify({
-                "status": "success",
-                "labels": labels,
-                "values": values
-            })
-        except Exception as e:
-            logger.error(f"Error generating property type data: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate property type data: {str(e)}"
-            }), 500
+    try:
+        # Query average values by property type
+        results = db.session.execute(_PROPERTY_TYPE_VALUES_STMT).all()
+        
+        # Format the results
+        labels = [r[0] for r in results]
+        values = [float(r[1]) for r in results]
+        
+        return jsonify({
+            "status": "success",
+            "labels": labels,
+            "values": values
+        })
+    except Exception as e:
+        logger.error(f"Error generating property type data: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate property type data: {str(e)}"
+        }), 500
 
 @api_routes.route('/api/visualization-data/value-distribution')
+@cached_response(ttl_seconds=300)
 def visualization_value_distribution():
     """Get property value distribution for visualization."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Define value ranges
-            ranges = [
-                (0, 100000, 'Under $100K'),
-                (100000, 250000, '$100K-$250K'),
-                (250000, 500000, '$250K-$500K'),
-                (500000, 1000000, '$500K-$1M'),
-                (1000000, float('inf'), 'Over $1M')
-            ]
-            
-            # Count parcels in each range
-            counts = []
-            for min_val, max_val, label in ranges:
-                count = Parcel.query.filter(
-                    Parcel.total_value >= min_val,
-                    Parcel.total_value < max_val
-                ).count()
-                counts.append(count)
-            
-            # Calculate percentages
-            total = sum(counts)
-            percentages = [count / total * 100 if total > 0 else 0 for count in counts]
-            
-            return jsonify({
-                "status": "success",
-                "labels": [label for _, _, label in ranges],
-                "values": percentages
-            })
-        except Exception as e:
-            logger.error(f"Error generating value distribution data: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate value distribution data: {str(e)}"
-            }), 500
+    try:
+        counts = list(db.session.execute(_VALUE_DISTRIBUTION_STMT).one())
+        
+        # Calculate percentages
+        total = sum(counts)
+        percentages = [count / total * 100 if total > 0 else 0 for count in counts]
+        
+        return jsonify({
+            "status": "success",
+            "labels": [label for _, _, label in VALUE_DISTRIBUTION_RANGES],
+            "values": percentages
+        })
+    except Exception as e:
+        logger.error(f"Error generating value distribution data: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate value distribution data: {str(e)}"
+        }), 500
 
 @api_routes.route('/api/visualization-data/sales-history')
+@cached_response(ttl_seconds=300)
 def visualization_sales_history():
     """Get sales history data for visualization."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Get sales by month for the last year
-            end_date = datetime.datetime.now().date()
-            start_date = end_date - datetime.timedelta(days=365)
-            
-            # Build an array of months
-            months = []
-            counts = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                next_month = datetime.datetime(
-                    current_date.year + (1 if current_date.month == 12 else 0),
-                    (current_date.month % 12) + 1,
-                    1
-                ).date()
-                
-                # Count sales in this month
-                month_sales = Sale.query.filter(
-                    Sale.sale_date >= current_date,
-                    Sale.sale_date < next_month
-                ).count()
-                
-                # Format month label
-                month_label = current_date.strftime('%b %Y')
-                
-                months.append(month_label)
-                counts.append(month_sales)
-                
-                # Move to next month
-                current_date = next_month
+    try:
+        # Get sales by month for the last year
+        end_date = datetime.datetime.now().date()
+        start_date = end_date - datetime.timedelta(days=365)
+        
+        # Build an array of month buckets
+        month_starts = []
+        current_date = start_date
+        
+        while current_date <= end_date:
+            month_starts.append(current_date)
             
-            return jsonify({
-                "status": "success",
-                "labels": months,
-                "values": counts
-            })
-        except Exception as e:
-            logger.error(f"Error generating sales history data: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate sales history data: {str(e)}"
-            }), 500
+            # Move to next month
+            current_date = datetime.datetime(
+                current_date.year + (1 if current_date.month == 12 else 0),
+                (current_date.month % 12) + 1,
+                1
+            ).date()
+        
+        # Count sales per month in a single grouped query
+        if db.engine.dialect.name == 'postgresql':
+            month_expr = func.date_trunc('month', Sale.sale_date)
+        else:
+            month_expr = func.strftime('%Y-%m-01', Sale.sale_date)
+        
+        results = db.session.query(
+            month_expr,
+            func.count(Sale.id)
+        ).filter(
+            Sale.sale_date >= start_date,
+            Sale.sale_date < current_date
+        ).group_by(
+            month_expr
+        ).all()
+        
+        sales_by_month = {str(month)[:7]: count for month, count in results}
+        
+        months = [month.strftime('%b %Y') for month in month_starts]
+        counts = [sales_by_month.get(month.strftime('%Y-%m'), 0) for month in month_starts]
+        
+        return jsonify({
+            "status": "success",
+            "labels": months,
+            "values": counts
+        })
+    except Exception as e:
+        logger.error(f"Error generating sales history data: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate sales history data: {str(e)}"
+        }), 500
 
 @api_routes.route('/api/visualization-data/value-trends')
+@cached_response(ttl_seconds=300)
 def visualization_value_trends():
     """Get property value trends by year for visualization."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Get distinct assessment years
-            years = [year[0] for year in 
-                    db.session.query(Parcel.assessment_year)
-                    .distinct()
-                    .order_by(Parcel.assessment_year)
-                    .all()]
-            
-            avg_values = []
-            property_counts = []
-            
-            for year in years:
-                # Get average value for this year
-                avg_value = db.session.query(
-                    func.avg(Parcel.total_value)
-                ).filter(
-                    Parcel.assessment_year == year
-                ).scalar() or 0
-                
-                # Get property count for this year
-                count = Parcel.query.filter(
-                    Parcel.assessment_year == year
-                ).count()
-                
-                avg_values.append(float(avg_value))
-                property_counts.append(count)
-            
-            return jsonify({
-                "status": "success",
-                "labels": years,
-                "avg_values": avg_values,
-                "property_counts": property_counts
-            })
-        except Exception as e:
-            logger.error(f"Error generating value trends data: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate value trends data: {str(e)}"
-            }), 500
+    try:
+        # Get average value and property count for every assessment year at once
+        results = db.session.execute(_VALUE_TRENDS_STMT).all()
+        
+        years = []
+        avg_values = []
+        property_counts = []
+        
+        for year, avg_value, count in results:
+            years.append(year)
+            avg_values.append(float(avg_value or 0))
+            property_counts.append(count)
+        
+        return jsonify({
+            "status": "success",
+            "labels": years,
+            "avg_values": avg_values,
+            "property_counts": property_counts
+        })
+    except Exception as e:
+        logger.error(f"Error generating value trends data: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate value trends data: {str(e)}"
+        }), 500
 
 # Statistics routes
 @api_routes.route('/statistics-dashboard')
@@ -962,63 +1512,140 @@ def api_value_ranges():
     """API endpoint to get property value ranges for filtering."""
     return map_module.get_value_ranges()
 
+# Map location rows, built once and executed with bind parameters so the
+# compiled SQL is reused. Only the columns the map needs are selected, so
+# rows come back as plain tuples instead of full ORM instances
+MAX_LOCATIONS_PAGE_SIZE = 500
+_PROPERTY_LOCATIONS_STMT = (
+    select(
+        Account.id,
+        Account.account_id,
+        Account.property_address,
+        Account.property_city,
+        Account.mailing_city,
+        Account.mailing_state,
+        Account.mailing_zip,
+        cast(Account.assessed_value, Float)
+    )
+    .where(Account.id > bindparam('after_id'))
+    .order_by(Account.id)
+    .limit(bindparam('limit'))
+)
+
+# Demo map placement: center point (Washington state) and the property types
+# assigned to accounts, which don't carry coordinates or a type for the map
+DEMO_MAP_CENTER = (47.7511, -120.7401)
+DEMO_PROPERTY_TYPES = ("Residential", "Commercial", "Agricultural", "Industrial", "Vacant Land")
+
 @api_routes.route('/api/visualization-data/property-locations')
+@cached_response(ttl_seconds=300, query_args=('after_id', 'limit'))
 def visualization_property_locations():
     """Get property location data for map visualization."""
-    from app_setup import app, db
-    with app.app_context():
-        try:
-            # Since we don't have parcels with latitude/longitude data,
-            # we'll create demo property locations using accounts data
-            accounts = db.session.query(Account).limit(50).all()
-            
-            # Generate property data for the map using fake locations
-            # For a real application, you would need to geocode the addresses
-            import random
-            
-            # Define a center point for the map (example: Washington state area)
-            center_lat = 47.7511  # Washington state center latitude
-            center_lng = -120.7401  # Washington state center longitude
-            
-            property_data = []
-            property_types = ["Residential", "Commercial", "Agricultural", "Industrial", "Vacant Land"]
-            
-            for i, account in enumerate(accounts):
-                # Generate a random offset from center (within about 50 miles)
-                lat_offset = (random.random() - 0.5) * 0.8
-                lng_offset = (random.random() - 0.5) * 0.8
-                
-                # Use account values where possible, and generate reasonable fake data for visualization
-                property_data.append({
-                    "id": account.id,
-                    "parcel_id": account.account_id,
-                    "address": account.property_address or f"{random.randint(100, 9999)} Main St",
-                    "city": account.property_city or account.mailing_city or "Richland",
-                    "state": account.mailing_state or "WA",
-                    "zip_code": account.mailing_zip or "99352",
-                    "total_value": float(account.assessed_value or random.randint(150000, 750000)),
-                    "latitude": center_lat + lat_offset,
-                    "longitude": center_lng + lng_offset,
-                    "property_type": random.choice(property_types)  # We don't have this data, so generate it
-                })
-            
-            return jsonify({
-                "status": "success",
-                "properties": property_data
-            })
-        except Exception as e:
-            logger.error(f"Error generating property location data: {str(e)}")
-            return jsonify({
-                "status": "error",
-                "message": f"Failed to generate property location data: {str(e)}"
-            }), 500
+    try:
+        # Since we don't have parcels with latitude/longitude data,
+        # we'll create demo property locations using accounts data.
+        # Page through accounts by id (keyset pagination) so later pages
+        # don't rescan the rows before them
+        after_id = request.args.get('after_id', 0, type=int)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), MAX_LOCATIONS_PAGE_SIZE)
+        accounts = db.session.execute(
+            _PROPERTY_LOCATIONS_STMT,
+            {"after_id": after_id, "limit": limit}
+        ).all()
+        
+        # Generate property data for the map using fake locations
+        # For a real application, you would need to geocode the addresses
+        center_lat, center_lng = DEMO_MAP_CENTER
+        rand, randint, choice = random.random, random.randint, random.choice
+        
+        # Use account values where possible, and generate reasonable fake data
+        # for visualization; the offsets place points within about 50 miles
+        # of the center
+        property_data = [
+            {
+                "id": account_id,
+                "parcel_id": account_number,
+                "address": address or f"{randint(100, 9999)} Main St",
+                "city": property_city or mailing_city or "Richland",
+                "state": mailing_state or "WA",
+                "zip_code": mailing_zip or "99352",
+                "total_value": assessed_value or float(randint(150000, 750000)),
+                "latitude": center_lat + (rand() - 0.5) * 0.8,
+                "longitude": center_lng + (rand() - 0.5) * 0.8,
+                "property_type": choice(DEMO_PROPERTY_TYPES)  # We don't have this data, so generate it
+            }
+            for (account_id, account_number, address, property_city, mailing_city,
+                 mailing_state, mailing_zip, assessed_value) in accounts
+        ]
+        
+        return jsonify({
+            "status": "success",
+            "properties": property_data,
+            # Cursor for the next page, or None when this was the last one
+            "next_after_id": accounts[-1].id if len(accounts) == limit else None
+        })
+    except Exception as e:
+        logger.error(f"Error generating property location data: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "message": f"Failed to generate property location data: {str(e)}"
+        }), 500
 # Property Detail Routes
+@cache(ttl_seconds=300)
+def _get_neighborhood_stats(city):
+    """
+    Get assessed value statistics for the properties in a city.
+    
+    The result is the finished dict the property detail page renders, so
+    every property in the same city reuses it instead of re-running the
+    aggregate and reloading all of the city's values for the median.
+    
+    Args:
+        city: Property city
+        
+    Returns:
+        Dictionary of count, average, min, max and median value, or None
+    """
+    from sqlalchemy import cast, Numeric
+    
+    # Calculate statistics for properties in the same city
+    stats = db.session.query(
+        func.count().label('property_count'),
+        func.avg(cast(Account.assessed_value, Numeric)).label('avg_value'),
+        func.min(cast(Account.assessed_value, Numeric)).label('min_value'),
+        func.max(cast(Account.assessed_value, Numeric)).label('max_value')
+    ).filter(
+        Account.property_city == city,
+        Account.assessed_value.isnot(None)
+    ).first()
+    
+    # Calculate median value (simplistic approach)
+    all_values = db.session.query(Account.assessed_value).filter(
+        Account.property_city == city,
+        Account.assessed_value.isnot(None)
+    ).order_by(Account.assessed_value).all()
+    
+    median_value = 0
+    if all_values:
+        values = [float(val[0]) for val in all_values]
+        mid = len(values) // 2
+        median_value = values[mid] if len(values) % 2 != 0 else (values[mid-1] + values[mid]) / 2
+    
+    if not stats:
+        return None
+    
+    return {
+        'property_count': stats.property_count,
+        'avg_value': float(stats.avg_value) if stats.avg_value else 0,
+        'min_value': float(stats.min_value) if stats.min_value else 0,
+        'max_value': float(stats.max_value) if stats.max_value else 0,
+        'median_value': median_value
+    }
+
 @api_routes.route('/property/<account_id>')
 def property_detail(account_id):
     """Render the property detail page for a specific account."""
     try:
-        from app_setup import db
-        
         # Get the property data
         property_data = db.session.query(Account).filter(Account.account_id == account_id).first()
         
@@ -1043,41 +1670,7 @@ def property_detail(account_id):
         # Get neighborhood statistics
         neighborhood_stats = None
         if property_data.property_city:
-            from sqlalchemy import func, cast, Numeric
-            
-            # Calculate statistics for properties in the same city
-            stats_query = db.session.query(
-                func.count().label('property_count'),
-                func.avg(cast(Account.assessed_value, Numeric)).label('avg_value'),
-                func.min(cast(Account.assessed_value, Numeric)).label('min_value'),
-                func.max(cast(Account.assessed_value, Numeric)).label('max_value')
-            ).filter(
-                Account.property_city == property_data.property_city,
-                Account.assessed_value.isnot(None)
-            )
-            
-            stats = stats_query.first()
-            
-            # Calculate median value (simplistic approach)
-            all_values = db.session.query(Account.assessed_value).filter(
-                Account.property_city == property_data.property_city,
-                Account.assessed_value.isnot(None)
-            ).order_by(Account.assessed_value).all()
-            
-            median_value = 0
-            if all_values:
-                values = [float(val[0]) for val in all_values]
-                mid = len(values) // 2
-                median_value = values[mid] if len(values) % 2 != 0 else (values[mid-1] + values[mid]) / 2
-            
-            if stats:
-                neighborhood_stats = {
-                    'property_count': stats.property_count,
-                    'avg_value': float(stats.avg_value) if stats.avg_value else 0,
-                    'min_value': float(stats.min_value) if stats.min_value else 0,
-                    'max_value': float(stats.max_value) if stats.max_value else 0,
-                    'median_value': median_value
-                }
+            neighborhood_stats = _get_neighborhood_stats(property_data.property_city)
         
         # Get assessment history (simulated for now since we don't have historical data)
         # In a real application, this would come from a dedicated table with assessment history
@@ -1130,8 +1723,6 @@ def property_detail(account_id):
 @api_routes.route('/property-search')
 def property_search():
     """Render the advanced property search page."""
-    from app_setup import db
-    
     # Get property types for dropdown
     property_types = db.session.query(Account.property_type).filter(
         Account.property_type.isnot(None)
@@ -9,6 +9,7 @@ import time
 import os
 import signal
 import sys
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_child_exit
 
 # Global processes
 processes = []
@@ -22,11 +23,11 @@ def run_process(command, name):
 
 def start_flask():
     """Start the Flask application."""
-    return run_process("gunicorn --bind 0.0.0.0:5000 --reuse-port --reload main:app", "Flask")
+    return run_process("gunicorn --bind 0.0.0.0:5000 --reuse-port main:app", "Flask")
 
 def start_fastapi():
     """Start the FastAPI application."""
-    return run_process("uvicorn app:app --host 0.0.0.0 --port 8000 --reload", "FastAPI")
+    return run_process(" ".join(["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS]), "FastAPI")
 
 def seed_database():
     """Run the database seeding script."""
@@ -96,7 +97,8 @@ def main():
                     elif name == "FastAPI":
                         new_process = start_fastapi()
                     processes[i] = (new_process, name)
-            time.sleep(5)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([process for process, _ in processes])
     except KeyboardInterrupt:
         cleanup()
 
@@ -1,24 +1,19 @@
 """
 This file provides a runner for the FastAPI application.
-It allows running the FastAPI application with uvicorn.
+It runs the FastAPI application under Gunicorn with uvicorn workers.
 """
 
 import os
-import uvicorn
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Define port for the FastAPI application
-API_PORT = int(os.environ.get("API_PORT", 8000))
+# Gunicorn settings for the API: UvicornWorker processes, API_WORKERS and
+# API_PORT. Passing it explicitly keeps gunicorn from loading the Flask app's
+# gunicorn.conf.py from the working directory
+API_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gunicorn_api.conf.py")
 
 if __name__ == "__main__":
-    # Run FastAPI application
-    uvicorn.run(
-        "app:app",
-        host="0.0.0.0",
-        port=API_PORT,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    # Replace this process with Gunicorn so it receives signals directly
+    os.execvp("gunicorn", ["gunicorn", "-c", API_CONFIG, "app:app"])
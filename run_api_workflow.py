@@ -5,12 +5,12 @@ making it available for the Flask application to connect to.
 
 import os
 import sys
-import time
 import signal
 import logging
 import threading
 import subprocess
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, wait_for_http_ready
 
 # Configure logging
 logging.basicConfig(
@@ -31,9 +31,8 @@ fastapi_process = None
 
 def log_output(process, prefix):
     """Monitor and log process output."""
-    for line in iter(process.stdout.readline, ""):
-        if line:
-            logger.info(f"{prefix}: {line.strip()}")
+    for line in process.stdout:
+        logger.info(f"{prefix}: {line.rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI service."""
@@ -43,10 +42,12 @@ def start_fastapi():
     try:
         # Run FastAPI with uvicorn
         fastapi_process = subprocess.Popen(
-            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000"],
+            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_ACCESS_LOG_ARGS],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -54,7 +55,8 @@ def start_fastapi():
         threading.Thread(target=log_output, args=(fastapi_process, "FastAPI"), daemon=True).start()
         
         # Wait for FastAPI to initialize
-        time.sleep(5)
+        if not wait_for_http_ready(f"{os.environ['FASTAPI_URL']}/health", process=fastapi_process):
+            logger.warning("FastAPI did not pass its health check in time")
         
         logger.info("FastAPI service started")
         return True
@@ -88,13 +90,9 @@ def main():
     
     try:
         # Keep script running
-        while True:
-            # Check if FastAPI is still running
-            if fastapi_process.poll() is not None:
-                logger.error(f"FastAPI process exited with code {fastapi_process.returncode}")
-                break
-            
-            time.sleep(2)
+        # Block until FastAPI exits
+        fastapi_process.wait()
+        logger.error(f"FastAPI process exited with code {fastapi_process.returncode}")
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
     finally:
@@ -12,6 +12,7 @@ import signal
 import sys
 import time
 from subprocess import PIPE, Popen
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_child_exit
 
 # Add colors for terminal output
 GREEN = "\033[92m"
@@ -46,13 +47,13 @@ def run_process(command, name):
 
 def start_flask():
     """Start the Flask application."""
-    command = "gunicorn --bind 0.0.0.0:5000 --workers 2 --reuse-port --reload main:app"
+    command = "gunicorn --bind 0.0.0.0:5000 --workers 2 --reuse-port main:app"
     return run_process(command, "Flask Docs")
 
 
 def start_fastapi():
     """Start the FastAPI application."""
-    command = "uvicorn app:api --host 0.0.0.0 --port 8000 --reload"
+    command = " ".join(["uvicorn", "app:api", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS])
     return run_process(command, "FastAPI")
 
 
@@ -124,7 +125,8 @@ def main():
                 print(f"{RED}FastAPI process terminated unexpectedly, restarting...{ENDC}")
                 fastapi_process = start_fastapi()
             
-            time.sleep(1)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([flask_process, fastapi_process])
     
     except KeyboardInterrupt:
         # This shouldn't be reached due to the signal handler, but just in case
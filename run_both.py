@@ -1,17 +1,15 @@
 """
 Combined runner script for both FastAPI and Flask applications.
-This script starts both services and manages them using Python's multiprocessing.
+This script starts both services as child processes and stops both when either exits.
 """
 
 import os
 import sys
-import time
 import signal
 import logging
-import multiprocessing
-import uvicorn
-from gunicorn.app.base import BaseApplication
+import subprocess
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, wait_for_http_ready
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,102 +21,72 @@ load_dotenv()
 # Set environment variables for Flask to communicate with FastAPI
 os.environ["FASTAPI_URL"] = "http://127.0.0.1:8000"
 
-def run_fastapi():
-    """Start the FastAPI application using uvicorn."""
-    logger.info("Starting FastAPI service on port 8000...")
-    try:
-        # Import the app directly instead of using the command line
-        from asgi import app
-        uvicorn.run(app, host="0.0.0.0", port=8000)
-    except Exception as e:
-        logger.error(f"FastAPI service error: {e}")
-        sys.exit(1)
-
-def run_flask():
-    """Start the Flask application using gunicorn."""
-    logger.info("Starting Flask documentation on port 5000...")
-    try:
-        # Custom Gunicorn application class
-        class FlaskApplication(BaseApplication):
-            def __init__(self, app, options=None):
-                self.options = options or {}
-                self.application = app
-                super().__init__()
-
-            def load_config(self):
-                for key, value in self.options.items():
-                    if key in self.cfg.settings and value is not None:
-                        self.cfg.set(key, value)
-
-            def load(self):
-                return self.application
-
-        # Import Flask app
-        from main import app
-        
-        # Configure Gunicorn
-        options = {
-            'bind': '0.0.0.0:5000',
-            'workers': 1,
-            'reload': True,
-        }
-        
-        # Run Gunicorn with the Flask app
-        FlaskApplication(app, options).run()
-    except Exception as e:
-        logger.error(f"Flask service error: {e}")
-        sys.exit(1)
+# Server commands. The children inherit this process's stdout and stderr, so
+# their logs go straight to the terminal instead of being relayed through Python.
+# Gunicorn picks up worker and reload settings from gunicorn.conf.py.
+FASTAPI_COMMAND = [sys.executable, "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_ACCESS_LOG_ARGS]
+FLASK_COMMAND = [sys.executable, "-m", "gunicorn", "--bind", "0.0.0.0:5000", "main:app"]
+
+def start_service(name, command):
+    """
+    Start a service as a child process.
+
+    Args:
+        name: Service name for logging
+        command: Command line to run
+
+    Returns:
+        The started subprocess.Popen
+    """
+    process = subprocess.Popen(command)
+    logger.info(f"Started {name} process (PID: {process.pid})")
+    return process
 
 def main():
     """Main function to run both services."""
-    # Set up processes
-    fastapi_process = multiprocessing.Process(target=run_fastapi)
-    flask_process = multiprocessing.Process(target=run_flask)
-    
-    # Start FastAPI
-    fastapi_process.start()
-    logger.info(f"Started FastAPI process (PID: {fastapi_process.pid})")
-    
+    logger.info("Starting FastAPI service on port 8000...")
+    fastapi_process = start_service("FastAPI", FASTAPI_COMMAND)
+
     # Wait for FastAPI to initialize
-    time.sleep(5)
-    
-    # Start Flask
-    flask_process.start()
-    logger.info(f"Started Flask process (PID: {flask_process.pid})")
-    
+    if not wait_for_http_ready(f"{os.environ['FASTAPI_URL']}/health", process=fastapi_process):
+        logger.warning("FastAPI did not pass its health check in time")
+
+    logger.info("Starting Flask documentation on port 5000...")
+    flask_process = start_service("Flask", FLASK_COMMAND)
+
+    processes = {fastapi_process.pid: ("FastAPI", fastapi_process), flask_process.pid: ("Flask", flask_process)}
+
+    def stop_services():
+        for name, process in processes.values():
+            if process.poll() is None:
+                process.terminate()
+                logger.info(f"Terminated {name} process (PID: {process.pid})")
+        for _, process in processes.values():
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
     # Function to handle signals
     def signal_handler(sig, frame):
         logger.info("Shutting down services...")
-        if fastapi_process.is_alive():
-            fastapi_process.terminate()
-            logger.info(f"Terminated FastAPI process (PID: {fastapi_process.pid})")
-        if flask_process.is_alive():
-            flask_process.terminate()
-            logger.info(f"Terminated Flask process (PID: {flask_process.pid})")
+        stop_services()
         sys.exit(0)
-    
+
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    
-    # Wait for both processes to complete
-    fastapi_process.join()
-    flask_process.join()
-    
-    # If we get here, it means one of the processes exited
-    if not fastapi_process.is_alive():
-        logger.error("FastAPI process exited unexpectedly")
-    if not flask_process.is_alive():
-        logger.error("Flask process exited unexpectedly")
-    
+
+    # Block until either child exits; the kernel wakes us, so there is no polling loop
+    pid, _ = os.wait()
+    name, _ = processes.get(pid, ("Unknown", None))
+    logger.error(f"{name} process exited unexpectedly")
+
     # Clean up
-    if fastapi_process.is_alive():
-        fastapi_process.terminate()
-    if flask_process.is_alive():
-        flask_process.terminate()
-    
+    stop_services()
+
     # Exit with error
     sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -10,6 +10,7 @@ import signal
 import sys
 import time
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_child_exit
 
 # Load environment variables
 load_dotenv()
@@ -47,7 +48,7 @@ def start_flask():
     flask_port = int(os.environ.get("FLASK_PORT", 5000))
     logger.info(f"Starting Flask documentation on port {flask_port}")
     return run_process(
-        ["gunicorn", "--bind", f"0.0.0.0:{flask_port}", "--reload", "main:app"],
+        ["gunicorn", "--bind", f"0.0.0.0:{flask_port}", "main:app"],
         "Flask"
     )
 
@@ -56,7 +57,7 @@ def start_fastapi():
     fastapi_port = int(os.environ.get("FASTAPI_PORT", 8000))
     logger.info(f"Starting FastAPI service on port {fastapi_port}")
     return run_process(
-        ["uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", str(fastapi_port), "--reload"],
+        ["uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", str(fastapi_port), *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS],
         "FastAPI"
     )
 
@@ -103,7 +104,7 @@ def main():
         
         # Keep the main thread alive
         while all(p[0].poll() is None for p in processes):
-            time.sleep(1)
+            wait_for_child_exit([p[0] for p in processes])
         
         # If we get here, at least one process has exited
         for process, name in processes:
@@ -14,19 +14,13 @@ import time
 import signal
 import logging
 import socket
-import urllib.request
+import http.client
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from process_utils import UVICORN_ACCESS_LOG_ARGS, configure_queued_logging, wait_for_child_exit
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("servers.log"),
-    ]
-)
+configure_queued_logging("servers.log", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Global variables
@@ -60,29 +54,50 @@ def stop_all_processes():
     # Clear the processes list
     processes = []
 
+# Bytes read from a child's output pipe per system call
+OUTPUT_CHUNK_SIZE = 65536
+
 def capture_output(process, name):
-    """Capture and log output from a process."""
+    """
+    Capture and log output from a process.
+    
+    Output is read in large chunks rather than line by line, so a chatty
+    server costs one read and one log record per chunk instead of per line.
+    """
     if not process:
         return
         
     log_file = f"{name.lower()}.log"
+    fd = process.stdout.fileno()
+    pending = b""
     
     with open(log_file, "wb") as f:
-        while process and process.poll() is None:
+        while True:
             try:
-                line = process.stdout.readline()
-                if line:
-                    # Write to log file
-                    f.write(line)
-                    f.flush()
-                    
-                    # Also log to console with prefix
-                    line_str = line.decode('utf-8', errors='replace').strip()
-                    if line_str:
-                        logger.info(f"[{name}] {line_str}")
+                chunk = os.read(fd, OUTPUT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                
+                # Write to log file
+                f.write(chunk)
+                f.flush()
+                
+                # Also log complete lines to console with prefix
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                text = "\n".join(
+                    f"[{name}] {line.decode('utf-8', errors='replace').rstrip()}"
+                    for line in lines if line.strip()
+                )
+                if text:
+                    logger.info(text)
             except Exception as e:
                 logger.error(f"Error reading output from {name}: {e}")
                 break
+    
+    # Log a final line that had no trailing newline
+    if pending.strip():
+        logger.info(f"[{name}] {pending.decode('utf-8', errors='replace').rstrip()}")
 
 def is_port_in_use(port):
     """Check if a port is already in use."""
@@ -140,15 +155,14 @@ def start_fastapi():
             "--port", 
             str(FASTAPI_PORT), 
             "--log-level", 
-            "info"
+            "info",
+            *UVICORN_ACCESS_LOG_ARGS
         ]
         
         fastapi_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            stderr=subprocess.STDOUT
         )
         
         logger.info(f"FastAPI started with PID {fastapi_process.pid}")
@@ -195,9 +209,7 @@ def start_flask():
         flask_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            stderr=subprocess.STDOUT
         )
         
         logger.info(f"Flask started with PID {flask_process.pid}")
@@ -220,32 +232,45 @@ def start_flask():
         return None
 
 def check_service_health(process, name, port, max_attempts=30, retry_interval=1):
-    """Check if a service is healthy by making HTTP requests."""
+    """
+    Check if a service is healthy by making HTTP requests.
+    
+    The polls share one keep-alive connection, so once the service accepts
+    connections the retries don't each pay for a new TCP handshake.
+    """
     if not process:
         logger.error(f"{name} process not started")
         return False
         
-    base_url = f"http://localhost:{port}"
     endpoint = "/health" if name == "FastAPI" else "/"
-    url = base_url + endpoint
+    url = f"http://localhost:{port}{endpoint}"
     
     logger.info(f"Checking {name} health at {url}")
     
-    for attempt in range(max_attempts):
-        if process.poll() is not None:
-            logger.error(f"{name} process terminated with code {process.returncode}")
-            return False
+    conn = http.client.HTTPConnection("localhost", port, timeout=2)
+    try:
+        for attempt in range(max_attempts):
+            if process.poll() is not None:
+                logger.error(f"{name} process terminated with code {process.returncode}")
+                return False
+                
+            try:
+                conn.request("GET", endpoint)
+                response = conn.getresponse()
+                # Read the body so the connection can carry the next request
+                response.read()
+                if response.status == 200:
+                    logger.info(f"{name} is healthy (status 200)")
+                    return True
+            except Exception as e:
+                # Drop the failed connection; the next request reconnects
+                conn.close()
+                if attempt % 5 == 0:  # Log only every 5th attempt to reduce noise
+                    logger.debug(f"Health check attempt {attempt+1}/{max_attempts} failed: {e}")
             
-        try:
-            response = urllib.request.urlopen(url, timeout=2)
-            if response.status == 200:
-                logger.info(f"{name} is healthy (status 200)")
-                return True
-        except Exception as e:
-            if attempt % 5 == 0:  # Log only every 5th attempt to reduce noise
-                logger.debug(f"Health check attempt {attempt+1}/{max_attempts} failed: {e}")
-        
-        time.sleep(retry_interval)
+            time.sleep(retry_interval)
+    finally:
+        conn.close()
     
     logger.error(f"{name} failed to become healthy after {max_attempts} attempts")
     return False
@@ -332,8 +357,8 @@ def main():
                     logger.error(f"Flask terminated unexpectedly with code {flask_process.returncode}")
                     flask_process = start_flask()
                 
-                # Sleep to avoid high CPU usage
-                time.sleep(5)
+                # Sleep until a service exits instead of polling
+                wait_for_child_exit([fastapi_process, flask_process])
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 time.sleep(10)  # Sleep longer after an error
@@ -11,6 +11,7 @@ import threading
 import subprocess
 import logging
 from dotenv import load_dotenv
+from process_utils import wait_for_child_exit
 
 # Configure logging
 logging.basicConfig(
@@ -32,9 +33,8 @@ flask_process = None
 
 def log_output(process, service_name):
     """Monitor and log process output."""
-    for line in iter(process.stdout.readline, ''):
-        if line:
-            logger.info(f"{service_name}: {line.strip()}")
+    for line in process.stdout:
+        logger.info(f"{service_name}: {line.rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI application."""
@@ -47,7 +47,9 @@ def start_fastapi():
             [sys.executable, "run_api.py"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -72,10 +74,12 @@ def start_flask():
     try:
         # Use subprocess to run gunicorn for Flask
         flask_process = subprocess.Popen(
-            ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"],
+            ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -155,8 +159,8 @@ def main():
                 cleanup()
                 return
             
-            # Wait before checking again
-            time.sleep(2)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([fastapi_process, flask_process])
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
         cleanup()
@@ -13,6 +13,7 @@ import threading
 import time
 import logging
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_child_exit
 
 # Configure logging
 logging.basicConfig(
@@ -30,16 +31,12 @@ processes = []
 
 def log_output(process, service_name):
     """Monitor and log process output."""
-    while True:
-        line = process.stdout.readline()
-        if not line and process.poll() is not None:
-            break
-        if line:
-            line = line.decode('utf-8').rstrip()
-            logger.info(f"[{service_name}] {line}")
+    # The pipe is opened in text mode, so lines arrive already decoded
+    for line in process.stdout:
+        logger.info(f"[{service_name}] {line.rstrip()}")
     
     # Check if process exited with an error
-    if process.returncode != 0:
+    if process.wait() != 0:
         logger.error(f"{service_name} exited with code {process.returncode}")
 
 def start_fastapi():
@@ -48,7 +45,7 @@ def start_fastapi():
     # Run FastAPI using uvicorn
     fastapi_cmd = [
         "python", "-m", "uvicorn", "app:app", 
-        "--host", "0.0.0.0", "--port", "8000", "--reload"
+        "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS
     ]
     
     try:
@@ -56,8 +53,10 @@ def start_fastapi():
             fastapi_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
         )
         processes.append(process)
         
@@ -88,8 +87,7 @@ def start_flask():
     logger.info("Starting Flask documentation on port 5000...")
     # Run Flask using gunicorn
     flask_cmd = [
-        "gunicorn", "--bind", "0.0.0.0:5000", 
-        "--reload", "main:app"
+        "gunicorn", "--bind", "0.0.0.0:5000", "main:app"
     ]
     
     try:
@@ -97,8 +95,10 @@ def start_flask():
             flask_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1
         )
         processes.append(process)
         
@@ -164,7 +164,8 @@ def main():
     try:
         # Keep script running
         while True:
-            time.sleep(1)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit(processes)
             # Check if any process has exited
             for process in processes:
                 if process.poll() is not None:
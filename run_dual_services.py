@@ -11,6 +11,7 @@ import signal
 import sys
 import logging
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS
 
 # Configure logging
 logging.basicConfig(
@@ -27,9 +28,8 @@ fastapi_process = None
 
 def log_output(process, prefix):
     """Log subprocess output with a prefix."""
-    for line in iter(process.stdout.readline, ''):
-        if line:
-            logger.info(f"[{prefix}] {line.strip()}")
+    for line in process.stdout:
+        logger.info(f"[{prefix}] {line.rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI service as a background process."""
@@ -37,10 +37,12 @@ def start_fastapi():
     global fastapi_process
     try:
         fastapi_process = subprocess.Popen(
-            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000"],
+            ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_ACCESS_LOG_ARGS],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -97,7 +99,7 @@ def main():
     try:
         # Use os.execvp to replace the current process with Gunicorn
         # This way, when Gunicorn receives signals, they'll be properly handled
-        os.execvp("gunicorn", ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"])
+        os.execvp("gunicorn", ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"])
     except OSError as e:
         logger.error(f"Failed to start Flask service: {e}")
         cleanup()
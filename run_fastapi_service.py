@@ -6,11 +6,9 @@ It's designed to be run as a standalone service in the workflow.
 import os
 import sys
 import logging
-import time
 import signal
-import subprocess
-import uvicorn
 from dotenv import load_dotenv
+from process_utils import uvicorn_command
 
 # Load environment variables
 load_dotenv()
@@ -59,25 +57,11 @@ def run_fastapi():
         
         logger.info("Starting FastAPI with uvicorn")
         
-        # Use subprocess to start uvicorn to avoid blocking this script
-        cmd = ["python", "-m", "uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", "8000"]
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Log the output
-        for line in iter(process.stdout.readline, ""):
-            logger.info(f"[FastAPI] {line.strip()}")
-            
-        # Process has ended
-        return_code = process.wait()
-        logger.info(f"FastAPI process exited with code {return_code}")
-        
-        return return_code == 0
+        # Replace this process with uvicorn. It writes its logs directly and
+        # receives signals itself, with no Python process left relaying its
+        # output. exec raises OSError if uvicorn cannot be started
+        cmd = uvicorn_command()
+        os.execv(cmd[0], cmd)
         
     except Exception as e:
         logger.error(f"Error starting FastAPI service: {str(e)}", exc_info=True)
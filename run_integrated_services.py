@@ -10,29 +10,27 @@ import sys
 import subprocess
 import time
 import signal
+import socket
 import threading
 import logging
-import requests
 from datetime import datetime
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, configure_queued_logging, wait_for_child_exit, wait_for_http_ready
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('integrated_services.log')
-    ]
-)
+configure_queued_logging('integrated_services.log', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Global variables to store process handles
 fastapi_process = None
 flask_process = None
 
+# Listening socket for the FastAPI service, bound once by this runner and
+# handed to each uvicorn process it starts
+FASTAPI_PORT = 8000
+fastapi_socket = None
+
 def check_port_available(port):
     """Check if a port is available."""
-    import socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     available = True
     try:
@@ -55,49 +53,117 @@ def wait_for_port(port, timeout=30):
     logger.warning(f"Timed out waiting for port {port} to become available")
     return False
 
+def bind_listening_socket(port):
+    """
+    Bind and listen on a port with SO_REUSEPORT set.
+    
+    SO_REUSEPORT lets the bind succeed alongside other listeners that set
+    it too, such as a previous uvicorn instance that is still shutting down,
+    so starting a service doesn't wait for the port to be released.
+    
+    Args:
+        port: Port to listen on
+        
+    Returns:
+        The listening socket
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(('0.0.0.0', port))
+        sock.listen(socket.SOMAXCONN)
+    except OSError:
+        sock.close()
+        raise
+    # The socket is passed to child processes by file descriptor
+    sock.set_inheritable(True)
+    return sock
+
+def free_port(port):
+    """
+    Stop whatever process is listening on a port and wait for it to close.
+    
+    Args:
+        port: Port to free
+        
+    Returns:
+        True if the port is available afterwards, False otherwise
+    """
+    try:
+        subprocess.run(
+            ["fuser", "-k", f"{port}/tcp"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False
+        )
+        logger.info(f"Killed existing process on port {port}")
+        # Wait for port to become available
+        if not wait_for_port(port, timeout=10):
+            logger.error(f"Failed to free up port {port}")
+            return False
+        return True
+    except Exception as e:
+        logger.error(f"Error stopping service on port {port}: {str(e)}")
+        return False
+
+# Bytes read from a child's output pipe per system call
+OUTPUT_CHUNK_SIZE = 65536
+
 def log_output(process, service_name):
-    """Monitor and log process output."""
-    for line in iter(process.stdout.readline, b''):
+    """
+    Monitor and log process output.
+    
+    Output is read in large chunks and each chunk's complete lines are
+    logged as one record, instead of one read and one record per line.
+    """
+    fd = process.stdout.fileno()
+    pending = b""
+    for chunk in iter(lambda: os.read(fd, OUTPUT_CHUNK_SIZE), b''):
         try:
-            decoded_line = line.decode('utf-8').rstrip()
-            logger.info(f"[{service_name}] {decoded_line}")
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            text = "\n".join(
+                f"[{service_name}] {line.decode('utf-8', errors='replace').rstrip()}"
+                for line in lines if line.strip()
+            )
+            if text:
+                logger.info(text)
         except Exception as e:
             logger.error(f"Error logging output from {service_name}: {str(e)}")
+    
+    # Log a final line that had no trailing newline
+    if pending.strip():
+        logger.info(f"[{service_name}] {pending.decode('utf-8', errors='replace').rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI application."""
-    global fastapi_process
+    global fastapi_process, fastapi_socket
     
     try:
-        # First make sure port 8000 is available
-        if not check_port_available(8000):
-            # Try to kill any process using port 8000
+        # Bind the port here and pass the socket to uvicorn with --fd. The
+        # socket is kept open across restarts, so a restarted service never
+        # waits for the port. Only a listener without SO_REUSEPORT can block
+        # the bind; that one is stopped first
+        if fastapi_socket is None:
             try:
-                subprocess.run(
-                    ["fuser", "-k", "8000/tcp"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    check=False
-                )
-                logger.info("Killed existing process on port 8000")
-                # Wait for port to become available
-                if not wait_for_port(8000, timeout=10):
-                    logger.error("Failed to free up port 8000")
+                fastapi_socket = bind_listening_socket(FASTAPI_PORT)
+            except OSError:
+                if not free_port(FASTAPI_PORT):
                     return False
-            except Exception as e:
-                logger.error(f"Error stopping service on port 8000: {str(e)}")
-                return False
+                fastapi_socket = bind_listening_socket(FASTAPI_PORT)
         
         # Start FastAPI service
-        cmd = ["python", "-m", "uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+        fd = fastapi_socket.fileno()
+        cmd = ["python", "-m", "uvicorn", "app:app", "--fd", str(fd), *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS]
         logger.info(f"Starting FastAPI service: {' '.join(cmd)}")
         
         fastapi_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            pass_fds=(fd,)
         )
         
         # Start a thread to log output
@@ -109,18 +175,9 @@ def start_fastapi():
         
         # Wait for FastAPI to start
         logger.info("Waiting for FastAPI service to initialize...")
-        time.sleep(5)
-        
-        # Check if service started successfully
-        for _ in range(30):
-            try:
-                response = requests.get("http://localhost:8000/health", timeout=2)
-                if response.status_code == 200:
-                    logger.info("FastAPI service is healthy")
-                    return True
-            except requests.RequestException:
-                pass
-            time.sleep(1)
+        if wait_for_http_ready(f"http://localhost:{FASTAPI_PORT}/health", timeout=35, process=fastapi_process):
+            logger.info("FastAPI service is healthy")
+            return True
             
         logger.warning("FastAPI service did not respond to health check")
         return fastapi_process.poll() is None  # Return True if process is still running
@@ -135,34 +192,17 @@ def start_flask():
     
     try:
         # First make sure port 5000 is available
-        if not check_port_available(5000):
-            # Try to kill any process using port 5000
-            try:
-                subprocess.run(
-                    ["fuser", "-k", "5000/tcp"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    check=False
-                )
-                logger.info("Killed existing process on port 5000")
-                # Wait for port to become available
-                if not wait_for_port(5000, timeout=10):
-                    logger.error("Failed to free up port 5000")
-                    return False
-            except Exception as e:
-                logger.error(f"Error stopping service on port 5000: {str(e)}")
-                return False
+        if not check_port_available(5000) and not free_port(5000):
+            return False
         
         # Start Flask service
-        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"]
+        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"]
         logger.info(f"Starting Flask service: {' '.join(cmd)}")
         
         flask_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False
+            stderr=subprocess.STDOUT
         )
         
         # Start a thread to log output
@@ -174,18 +214,9 @@ def start_flask():
         
         # Wait for Flask to start
         logger.info("Waiting for Flask service to initialize...")
-        time.sleep(5)
-        
-        # Check if service started successfully
-        for _ in range(30):
-            try:
-                response = requests.get("http://localhost:5000/health", timeout=2)
-                if response.status_code == 200:
-                    logger.info("Flask service is healthy")
-                    return True
-            except requests.RequestException:
-                pass
-            time.sleep(1)
+        if wait_for_http_ready("http://localhost:5000/health", timeout=35, process=flask_process):
+            logger.info("Flask service is healthy")
+            return True
             
         logger.warning("Flask service did not respond to health check")
         return flask_process.poll() is None  # Return True if process is still running
@@ -226,6 +257,9 @@ def cleanup(signum=None, frame=None):
     except Exception as e:
         logger.error(f"Error terminating Flask process: {str(e)}")
     
+    if fastapi_socket is not None:
+        fastapi_socket.close()
+    
     # Exit gracefully
     if signum is not None:
         sys.exit(0)
@@ -256,7 +290,7 @@ def main():
     logger.info("Flask service started successfully")
     logger.info("Both services are now running.")
     logger.info("Flask Documentation: http://localhost:5000")
-    logger.info("FastAPI Service: http://localhost:8000")
+    logger.info(f"FastAPI Service: http://localhost:{FASTAPI_PORT}")
     
     # Monitor services
     try:
@@ -283,8 +317,8 @@ def main():
                     cleanup()
                     return 1
             
-            # Sleep for a while before checking again
-            time.sleep(5)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([fastapi_process, flask_process])
     
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
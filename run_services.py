@@ -10,6 +10,7 @@ import subprocess
 import signal
 import threading
 from dotenv import load_dotenv
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS
 
 # Load environment variables from .env file
 load_dotenv()
@@ -20,7 +21,7 @@ processes = []
 def run_flask():
     """Run the Flask application."""
     print("Starting Flask application on port 5000...")
-    flask_cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"]
+    flask_cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"]
     flask_proc = subprocess.Popen(flask_cmd)
     processes.append(flask_proc)
     return flask_proc
@@ -28,7 +29,7 @@ def run_flask():
 def run_fastapi():
     """Run the FastAPI application."""
     print("Starting FastAPI application on port 8000...")
-    fastapi_cmd = ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+    fastapi_cmd = ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS]
     fastapi_proc = subprocess.Popen(fastapi_cmd)
     processes.append(fastapi_proc)
     return fastapi_proc
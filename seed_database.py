@@ -2,12 +2,14 @@
 This script seeds the database with sample data for testing purposes.
 """
 
-import random
 import datetime
+import itertools
 import logging
+import numpy as np
 from faker import Faker
 import os
 from dotenv import load_dotenv
+from sqlalchemy import func, select, text
 
 # Load environment variables
 load_dotenv()
@@ -20,186 +22,345 @@ from models import Parcel, Property, Sale
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize Faker
+# Initialize Faker, and the NumPy generator used to draw numeric and
+# categorical columns for a whole batch of rows at once
 fake = Faker()
+rng = np.random.default_rng()
+
+# Value choices for the sample data, built once at import
+CITIES = ("Seattle", "Portland", "San Francisco", "Los Angeles", "Chicago",
+          "New York", "Boston", "Austin", "Denver", "Miami")
+STATES = ("WA", "OR", "CA", "IL", "NY", "MA", "TX", "CO", "FL")
+PROPERTY_TYPES = ("Single Family", "Multi-Family", "Condominium", "Townhouse",
+                  "Apartment", "Commercial", "Industrial", "Vacant Land")
+CONDITIONS = ("Excellent", "Good", "Average", "Fair", "Poor")
+QUALITIES = ("Luxury", "High", "Average", "Economy", "Low")
+ZONINGS = ("Residential", "Commercial", "Industrial", "Mixed Use", "Agricultural")
+TAX_DISTRICTS = tuple(f"District {number}" for number in range(1, 6))
+SALE_TYPES = ("Standard", "Foreclosure", "Short Sale", "New Construction", "Auction")
+FINANCING_TYPES = ("Conventional", "FHA", "VA", "Cash", "Owner Financing")
+
+# Core INSERT statements for the seed tables, built once. The rows are plain
+# dictionaries that need no ORM identity tracking, so they are executed on
+# the session's connection, skipping the ORM bulk insert layer, and stay in
+# the seed's single transaction
+PARCEL_INSERT = Parcel.__table__.insert()
+PROPERTY_INSERT = Property.__table__.insert()
+SALE_INSERT = Sale.__table__.insert()
+
+# Street names for the parcel addresses generated in SQL
+STREET_NAMES = ("Main St", "Oak Ave", "Pine St", "Maple Dr", "Cedar Ln",
+                "Elm St", "Washington Ave", "Lake Rd", "Hill St", "Park Blvd")
+
+# PostgreSQL parcel generator. Every value is drawn by random() in the
+# database, with the same ranges as _insert_parcel_rows; parcel numbers are
+# derived from the ids so they are unique
+PARCEL_SERIES_INSERT = text("""
+    INSERT INTO parcels (id, parcel_id, address, city, state, zip_code,
+                         land_value, improvement_value, total_value,
+                         assessment_year, latitude, longitude,
+                         created_at, updated_at)
+    SELECT id, 'P' || lpad(id::text, 8, '0'), address, city, state, zip_code,
+           land_value, improvement_value, land_value + improvement_value,
+           assessment_year, latitude, longitude, :now, :now
+    FROM (
+        SELECT :first_id + gs - 1 AS id,
+               (100 + floor(random() * 9900))::int || ' '
+                   || (:streets)[1 + floor(random() * cardinality(:streets))::int] AS address,
+               (:cities)[1 + floor(random() * cardinality(:cities))::int] AS city,
+               (:states)[1 + floor(random() * cardinality(:states))::int] AS state,
+               lpad(floor(random() * 100000)::int::text, 5, '0') AS zip_code,
+               round((50000 + random() * 450000)::numeric, 2) AS land_value,
+               round((100000 + random() * 900000)::numeric, 2) AS improvement_value,
+               2020 + floor(random() * 5)::int AS assessment_year,
+               random() * 180 - 90 AS latitude,
+               random() * 360 - 180 AS longitude
+        FROM generate_series(1, :count) AS gs
+    ) AS generated
+""")
+
+# Rows per bulk INSERT statement. Larger seeds are split so no single
+# statement or parameter list grows without bound; PostgreSQL gains nothing
+# from batches past about a thousand rows
+INSERT_BATCH_SIZE = 10000
+POSTGRESQL_INSERT_BATCH_SIZE = 1000
+
+def insert_batches(rows):
+    """
+    Split rows into batches sized for a bulk INSERT on the current database.
+    
+    Args:
+        rows: Iterable of row dictionaries; a generator is consumed one
+            batch at a time
+        
+    Yields:
+        Lists of consecutive rows
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        batch_size = POSTGRESQL_INSERT_BATCH_SIZE
+    else:
+        batch_size = INSERT_BATCH_SIZE
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, batch_size)):
+        yield batch
+
+def _insert_parcel_rows(parcel_ids, now):
+    """Generate parcel rows in Python and bulk insert them."""
+    count = len(parcel_ids)
+    
+    # Draw each random column for every parcel in one call. tolist()
+    # converts to Python values the database drivers accept
+    land_values = np.round(rng.uniform(50000, 500000, size=count), 2)
+    improvement_values = np.round(rng.uniform(100000, 1000000, size=count), 2)
+    columns = {
+        "id": parcel_ids,
+        "parcel_id": (f"P{fake.unique.random_number(digits=8)}" for _ in range(count)),
+        "address": (fake.street_address() for _ in range(count)),
+        "city": rng.choice(CITIES, size=count).tolist(),
+        "state": rng.choice(STATES, size=count).tolist(),
+        "zip_code": (fake.zipcode() for _ in range(count)),
+        "land_value": land_values.tolist(),
+        "improvement_value": improvement_values.tolist(),
+        "total_value": (land_values + improvement_values).tolist(),
+        "assessment_year": rng.integers(2020, 2025, size=count).tolist(),
+        "latitude": rng.uniform(-90, 90, size=count).tolist(),
+        "longitude": rng.uniform(-180, 180, size=count).tolist(),
+        "created_at": itertools.repeat(now),
+        "updated_at": itertools.repeat(now)
+    }
+    
+    # Add parcels to the database. The row dicts and Faker values are
+    # produced as each batch is taken, so only one batch of rows exists
+    # at a time
+    for batch in insert_batches(_zip_rows(columns)):
+        db.session.connection().execute(PARCEL_INSERT, batch)
 
 def create_sample_parcels(count=10):
-    """Create sample parcel records."""
-    logger.info(f"Creating {count} sample parcels...")
-    parcels = []
+    """
+    Create sample parcel records.
     
-    # List of cities for sample data
-    cities = ["Seattle", "Portland", "San Francisco", "Los Angeles", "Chicago", 
-              "New York", "Boston", "Austin", "Denver", "Miami"]
+    On PostgreSQL the rows are generated by the database in a single
+    INSERT ... SELECT over generate_series, so no row data passes through
+    Python. Elsewhere they are generated here and written with bulk
+    INSERTs. Ids are assigned after the current maximum, so the inserts
+    don't have to return generated keys. Callers hold the seeding lock, so
+    no other writer takes these ids in the meantime.
     
-    # List of states for sample data
-    states = ["WA", "OR", "CA", "IL", "NY", "MA", "TX", "CO", "FL"]
+    Returns:
+        List of the database ids of the created parcels
+    """
+    logger.info(f"Creating {count} sample parcels...")
+    now = datetime.datetime.utcnow()
+    first_id = (db.session.scalar(select(func.max(Parcel.id))) or 0) + 1
+    parcel_ids = list(range(first_id, first_id + count))
     
-    for i in range(count):
-        city = random.choice(cities)
-        state = random.choice(states)
+    if db.session.get_bind().dialect.name == "postgresql":
+        db.session.execute(PARCEL_SERIES_INSERT, {
+            "first_id": first_id,
+            "count": count,
+            "cities": list(CITIES),
+            "states": list(STATES),
+            "streets": list(STREET_NAMES),
+            "now": now
+        })
         
-        parcel = Parcel(
-            parcel_id=f"P{fake.unique.random_number(digits=8)}",
-            address=fake.street_address(),
-            city=city,
-            state=state,
-            zip_code=fake.zipcode(),
-            land_value=round(random.uniform(50000, 500000), 2),
-            improvement_value=round(random.uniform(100000, 1000000), 2),
-            assessment_year=random.randint(2020, 2024),
-            latitude=fake.latitude(),
-            longitude=fake.longitude(),
-            created_at=datetime.datetime.utcnow(),
-            updated_at=datetime.datetime.utcnow()
+        # Move the id sequence past the assigned ids so later inserts that
+        # rely on it don't collide with them
+        db.session.execute(
+            text("SELECT setval(pg_get_serial_sequence('parcels', 'id'), :last_id)"),
+            {"last_id": parcel_ids[-1]}
         )
-        
-        # Calculate total value
-        parcel.total_value = parcel.land_value + parcel.improvement_value
-        
-        parcels.append(parcel)
-    
-    # Add parcels to the database
-    db.session.add_all(parcels)
-    db.session.commit()
+    else:
+        _insert_parcel_rows(parcel_ids, now)
     
-    logger.info(f"Created {len(parcels)} sample parcels.")
-    return parcels
+    logger.info(f"Created {count} sample parcels.")
+    return parcel_ids
 
-def create_sample_properties(parcels):
-    """Create sample property records for the given parcels."""
-    logger.info(f"Creating sample properties for {len(parcels)} parcels...")
-    properties = []
+def _zip_rows(columns):
+    """
+    Zip column-wise data into row dictionaries.
     
-    # List of property types for sample data
-    property_types = ["Single Family", "Multi-Family", "Condominium", "Townhouse", 
-                      "Apartment", "Commercial", "Industrial", "Vacant Land"]
+    Args:
+        columns: Dictionary of column name to an iterable of values
+        
+    Returns:
+        Generator of row dictionaries
+    """
+    return (dict(zip(columns, values)) for values in zip(*columns.values()))
+
+def _land_property_columns(parcel_ids, now):
+    """Generate the columns of vacant land properties, which have no building."""
+    count = len(parcel_ids)
+    no_building = itertools.repeat(None)
+    return {
+        "parcel_id": parcel_ids,
+        "property_type": itertools.repeat("Vacant Land"),
+        "year_built": no_building,
+        "square_footage": no_building,
+        "bedrooms": no_building,
+        "bathrooms": no_building,
+        "lot_size": np.round(rng.uniform(0.1, 10.0, size=count), 2).tolist(),
+        "lot_size_unit": itertools.repeat("acres"),
+        "stories": no_building,
+        "condition": rng.choice(CONDITIONS, size=count).tolist(),
+        "quality": rng.choice(QUALITIES, size=count).tolist(),
+        "tax_district": rng.choice(TAX_DISTRICTS, size=count).tolist(),
+        "zoning": rng.choice(ZONINGS, size=count).tolist(),
+        "created_at": itertools.repeat(now),
+        "updated_at": itertools.repeat(now)
+    }
+
+def _built_property_columns(parcel_ids, property_types, now):
+    """Generate the columns of properties with a building."""
+    count = len(parcel_ids)
+    # Bedrooms and bathrooms apply to homes and condos; stories to homes
+    has_rooms = np.isin(property_types, ("Single Family", "Multi-Family", "Condominium"))
+    is_family = np.isin(property_types, ("Single Family", "Multi-Family"))
+    return {
+        "parcel_id": parcel_ids,
+        "property_type": property_types.tolist(),
+        "year_built": rng.integers(1950, 2024, size=count).tolist(),
+        "square_footage": rng.integers(1000, 5001, size=count).tolist(),
+        "bedrooms": np.where(has_rooms, rng.integers(1, 7, size=count), None).tolist(),
+        "bathrooms": np.where(has_rooms, np.round(rng.uniform(1.0, 5.0, size=count), 1), None).tolist(),
+        "lot_size": np.round(rng.uniform(0.1, 1.0, size=count), 2).tolist(),
+        "lot_size_unit": itertools.repeat("acres"),
+        "stories": np.where(is_family, np.round(rng.uniform(1.0, 3.0, size=count), 1), None).tolist(),
+        "condition": rng.choice(CONDITIONS, size=count).tolist(),
+        "quality": rng.choice(QUALITIES, size=count).tolist(),
+        "tax_district": rng.choice(TAX_DISTRICTS, size=count).tolist(),
+        "zoning": rng.choice(ZONINGS, size=count).tolist(),
+        "created_at": itertools.repeat(now),
+        "updated_at": itertools.repeat(now)
+    }
+
+def create_sample_properties(parcel_ids):
+    """
+    Create sample property records for the given parcel ids.
     
-    # List of conditions for sample data
-    conditions = ["Excellent", "Good", "Average", "Fair", "Poor"]
+    Vacant land and built properties are generated separately, so building
+    details are only drawn for the properties that have a building.
     
-    # List of quality ratings for sample data
-    qualities = ["Luxury", "High", "Average", "Economy", "Low"]
+    Returns:
+        Number of properties created
+    """
+    logger.info(f"Creating sample properties for {len(parcel_ids)} parcels...")
+    now = datetime.datetime.utcnow()
     
-    # List of zoning types for sample data
-    zonings = ["Residential", "Commercial", "Industrial", "Mixed Use", "Agricultural"]
+    # Number of properties per parcel (1-3)
+    property_counts = rng.integers(1, 4, size=len(parcel_ids))
+    property_parcel_ids = np.repeat(parcel_ids, property_counts)
+    property_types = rng.choice(PROPERTY_TYPES, size=len(property_parcel_ids))
+    is_land = property_types == "Vacant Land"
     
-    for parcel in parcels:
-        # Number of properties per parcel (1-3)
-        num_properties = random.randint(1, 3)
-        
-        for _ in range(num_properties):
-            property_type = random.choice(property_types)
-            
-            # Skip building details for vacant land
-            if property_type == "Vacant Land":
-                prop = Property(
-                    parcel_id=parcel.id,
-                    property_type=property_type,
-                    lot_size=round(random.uniform(0.1, 10.0), 2),
-                    lot_size_unit="acres",
-                    condition=random.choice(conditions),
-                    quality=random.choice(qualities),
-                    tax_district=f"District {random.randint(1, 5)}",
-                    zoning=random.choice(zonings),
-                    created_at=datetime.datetime.utcnow(),
-                    updated_at=datetime.datetime.utcnow()
-                )
-            else:
-                prop = Property(
-                    parcel_id=parcel.id,
-                    property_type=property_type,
-                    year_built=random.randint(1950, 2023),
-                    square_footage=random.randint(1000, 5000),
-                    bedrooms=random.randint(1, 6) if "Family" in property_type or "Condominium" in property_type else None,
-                    bathrooms=round(random.uniform(1.0, 5.0), 1) if "Family" in property_type or "Condominium" in property_type else None,
-                    lot_size=round(random.uniform(0.1, 1.0), 2),
-                    lot_size_unit="acres",
-                    stories=round(random.uniform(1.0, 3.0), 1) if "Family" in property_type else None,
-                    condition=random.choice(conditions),
-                    quality=random.choice(qualities),
-                    tax_district=f"District {random.randint(1, 5)}",
-                    zoning=random.choice(zonings),
-                    created_at=datetime.datetime.utcnow(),
-                    updated_at=datetime.datetime.utcnow()
-                )
-            
-            properties.append(prop)
+    # Both column sets have the same keys, so the rows still go out in
+    # single executemany batches
+    properties = itertools.chain(
+        _zip_rows(_land_property_columns(property_parcel_ids[is_land].tolist(), now)),
+        _zip_rows(_built_property_columns(
+            property_parcel_ids[~is_land].tolist(), property_types[~is_land], now
+        ))
+    )
     
     # Add properties to the database
-    db.session.add_all(properties)
-    db.session.commit()
+    for batch in insert_batches(properties):
+        db.session.connection().execute(PROPERTY_INSERT, batch)
     
-    logger.info(f"Created {len(properties)} sample properties.")
-    return properties
+    logger.info(f"Created {len(property_parcel_ids)} sample properties.")
+    return len(property_parcel_ids)
 
-def create_sample_sales(parcels):
-    """Create sample sale records for the given parcels."""
-    logger.info(f"Creating sample sales for {len(parcels)} parcels...")
-    sales = []
+def create_sample_sales(parcel_ids):
+    """
+    Create sample sale records for the given parcel ids.
     
-    # List of sale types for sample data
-    sale_types = ["Standard", "Foreclosure", "Short Sale", "New Construction", "Auction"]
+    The sale columns are generated as whole arrays and zipped into row
+    dictionaries as each INSERT batch is taken, so the full list of rows
+    never exists at once.
     
-    # List of financing types for sample data
-    financing_types = ["Conventional", "FHA", "VA", "Cash", "Owner Financing"]
+    Returns:
+        Number of sales created
+    """
+    logger.info(f"Creating sample sales for {len(parcel_ids)} parcels...")
+    now = datetime.datetime.utcnow()
     
-    for parcel in parcels:
-        # Number of sales per parcel (1-5)
-        num_sales = random.randint(1, 5)
-        
-        # Generate sales dates in chronological order
-        sale_years = sorted(random.sample(range(2010, 2025), num_sales))
-        
-        for i, year in enumerate(sale_years):
-            # Generate random sale date within the year
-            sale_date = datetime.date(year, random.randint(1, 12), random.randint(1, 28))
-            
-            # Base price with some randomness
-            base_price = round(random.uniform(200000, 800000), 2)
-            
-            # Increase price for later sales (appreciation)
-            appreciation_factor = 1.0 + (i * 0.1)  # 10% appreciation per sale
-            sale_price = round(base_price * appreciation_factor, 2)
-            
-            sale = Sale(
-                parcel_id=parcel.id,
-                sale_date=sale_date,
-                sale_price=sale_price,
-                sale_type=random.choice(sale_types),
-                transaction_id=fake.uuid4(),
-                buyer_name=fake.name(),
-                seller_name=fake.name(),
-                financing_type=random.choice(financing_types),
-                created_at=datetime.datetime.utcnow(),
-                updated_at=datetime.datetime.utcnow()
-            )
-            
-            sales.append(sale)
+    # Number of sales per parcel (1-5)
+    sale_counts = rng.integers(1, 6, size=len(parcel_ids))
+    total_sales = int(sale_counts.sum())
+    
+    # Generate each parcel's distinct sale years in chronological order: a
+    # random permutation of the 15 candidate years per parcel, of which the
+    # first sale_counts are kept and sorted. Unused slots sort to the end
+    # and are dropped, leaving the years grouped by parcel
+    candidate_years = 2010 + rng.permuted(np.tile(np.arange(15), (len(parcel_ids), 1)), axis=1)[:, :5]
+    candidate_years[np.arange(5) >= sale_counts[:, None]] = np.iinfo(candidate_years.dtype).max
+    candidate_years.sort(axis=1)
+    sale_years = candidate_years[np.arange(5) < sale_counts[:, None]]
+    
+    # Position of each sale within its parcel's history
+    sale_order = np.arange(total_sales) - np.repeat(np.cumsum(sale_counts) - sale_counts, sale_counts)
+    
+    # Draw the remaining columns for every sale at once: a random date within
+    # the year, built with datetime64 arithmetic, and a base price that
+    # appreciates 10% per later sale
+    sale_dates = (
+        (sale_years - 1970).astype("datetime64[Y]").astype("datetime64[M]")
+        + rng.integers(0, 12, size=total_sales).astype("timedelta64[M]")
+    ).astype("datetime64[D]") + rng.integers(0, 28, size=total_sales).astype("timedelta64[D]")
+    base_prices = np.round(rng.uniform(200000, 800000, size=total_sales), 2)
+    
+    # Column-wise sale data, one list per column
+    columns = {
+        "parcel_id": np.repeat(parcel_ids, sale_counts).tolist(),
+        # tolist() converts datetime64[D] values to datetime.date
+        "sale_date": sale_dates.tolist(),
+        "sale_price": np.round(base_prices * (1.0 + sale_order * 0.1), 2).tolist(),
+        "sale_type": rng.choice(SALE_TYPES, size=total_sales).tolist(),
+        "transaction_id": [fake.uuid4() for _ in range(total_sales)],
+        "buyer_name": [fake.name() for _ in range(total_sales)],
+        "seller_name": [fake.name() for _ in range(total_sales)],
+        "financing_type": rng.choice(FINANCING_TYPES, size=total_sales).tolist(),
+        "created_at": itertools.repeat(now),
+        "updated_at": itertools.repeat(now)
+    }
+    sales = _zip_rows(columns)
     
     # Add sales to the database
-    db.session.add_all(sales)
-    db.session.commit()
+    for batch in insert_batches(sales):
+        db.session.connection().execute(SALE_INSERT, batch)
     
-    logger.info(f"Created {len(sales)} sample sales.")
-    return sales
+    logger.info(f"Created {total_sales} sample sales.")
+    return total_sales
 
 def seed_database():
     """Main function to seed the database."""
     logger.info("Starting database seeding...")
     
     with app.app_context():
+        # Several processes can seed at once, e.g. each gunicorn worker
+        # importing wsgi.py. On PostgreSQL a transaction-level advisory lock
+        # makes them take turns, so only the first one finds no parcels
+        if db.session.get_bind().dialect.name == "postgresql":
+            db.session.execute(text("SELECT pg_advisory_xact_lock(hashtext('seed_database'))"))
+            # The seed can simply be rerun, so its commit doesn't need to
+            # wait for the WAL flush. SET LOCAL reverts when the transaction
+            # ends, so the pooled connection keeps normal durability
+            db.session.execute(text("SET LOCAL synchronous_commit = OFF"))
+        
         # Check if database is already seeded
         existing_count = db.session.query(Parcel).count()
         if existing_count > 0:
             logger.info(f"Database already contains {existing_count} parcels. Skipping seeding.")
+            # End the transaction, releasing the lock
+            db.session.rollback()
             return
         
         try:
-            # Create sample data
-            parcels = create_sample_parcels(count=50)
-            create_sample_properties(parcels)
-            create_sample_sales(parcels)
+            # Create sample data in a single transaction, so the seed costs
+            # one commit and a failure leaves no partial data behind
+            parcel_ids = create_sample_parcels(count=50)
+            create_sample_properties(parcel_ids)
+            create_sample_sales(parcel_ids)
+            db.session.commit()
             
             logger.info("Database seeding completed successfully.")
         except Exception as e:
@@ -48,6 +48,10 @@ fastapi_url = os.environ.get("FASTAPI_URL", "http://localhost:8000")
 os.environ["FASTAPI_URL"] = fastapi_url
 logger.info(f"FastAPI URL set to: {fastapi_url}")
 
+# Health checks share the Flask service's session for calls to FastAPI, so
+# they reuse its kept-alive connections instead of opening one per request
+from fastapi_client import SESSION
+
 from flask import Flask, render_template, jsonify, request
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
@@ -59,12 +63,13 @@ class Base(DeclarativeBase):
 db = SQLAlchemy(model_class=Base)
 app = Flask(__name__)
 
-# Configure the database
+# Configure the database with the main Flask app's engine options
+# (app_setup.py), so this pool is sized within the Flask service's
+# FLASK_DB_CONNECTIONS budget (gunicorn.conf.py) and honours the same
+# FLASK_DB_* and DB_* settings
+from app_setup import app as _main_app
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-}
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = dict(_main_app.config["SQLALCHEMY_ENGINE_OPTIONS"])
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", os.urandom(24))
 
 # Initialize the app with the extension
@@ -72,6 +77,8 @@ db.init_app(app)
 
 # Import models 
 from models import Parcel, Property, Sale
+from seed_database import seed_database
+from process_utils import uvicorn_command
 
 # Create database tables
 with app.app_context():
@@ -96,7 +103,7 @@ def health():
     # Check FastAPI connection
     fastapi_status = "unknown"
     try:
-        fastapi_response = requests.get(f"{fastapi_url}/health", timeout=2)
+        fastapi_response = SESSION.get(f"{fastapi_url}/health", timeout=2)
         if fastapi_response.status_code == 200:
             fastapi_status = "connected"
         else:
@@ -117,8 +124,10 @@ def index():
     """Simple index route for Flask."""
     return render_template("index.html", fastapi_url=fastapi_url)
 
-# Import routes after app creation
-from database import *
+# Import routes after app creation. A module import rather than a star
+# import keeps database's names (its datetime module, logger, index view)
+# from replacing this module's own
+import database  # noqa: F401
 
 # Function to seed the database if needed
 def seed_database_if_needed():
@@ -129,8 +138,10 @@ def seed_database_if_needed():
             try:
                 parcel_count = Parcel.query.count()
                 if parcel_count == 0:
-                    logger.info("No parcels found in database. Running seed script...")
-                    subprocess.run(["python", "seed_database.py"], check=True)
+                    logger.info("No parcels found in database. Seeding...")
+                    # Seed in this process, reusing the loaded app and its
+                    # connection pool instead of starting a new interpreter
+                    seed_database()
                     logger.info("Database seeded successfully")
                 else:
                     logger.info(f"Database already has {parcel_count} parcels. No seeding needed.")
@@ -164,8 +175,7 @@ def start_fastapi():
                 pass
             
             # Start FastAPI with uvicorn
-            # Fix the command to use a different import path
-            cmd = ["python", "-m", "uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+            cmd = uvicorn_command()
             logger.info(f"Starting FastAPI service with command: {' '.join(cmd)}")
             
             fastapi_process = subprocess.Popen(
@@ -196,7 +206,7 @@ def start_fastapi():
     # Wait for FastAPI to start
     for _ in range(30):
         try:
-            response = requests.get(f"{fastapi_url}/health", timeout=1)
+            response = SESSION.get(f"{fastapi_url}/health", timeout=1)
             if response.status_code == 200:
                 logger.info("FastAPI is running and healthy")
                 return True
@@ -227,16 +237,16 @@ def cleanup_on_exit(signum=None, frame=None):
     if signum is not None:
         sys.exit(0)
 
-# Register the cleanup function
+# Register the cleanup function. Signal handlers are only installed when
+# this file runs as a script (below), so importing it under gunicorn
+# leaves the worker's own SIGINT/SIGTERM handling in place
 atexit.register(cleanup_on_exit)
-signal.signal(signal.SIGINT, cleanup_on_exit)
-signal.signal(signal.SIGTERM, cleanup_on_exit)
 
 # Test function to verify FastAPI connectivity
 def fastapi_test():
     """Test connectivity to the FastAPI service."""
     try:
-        response = requests.get(f"{fastapi_url}/health", timeout=5)
+        response = SESSION.get(f"{fastapi_url}/health", timeout=5)
         logger.info(f"FastAPI health response: {response.status_code}")
         return response.json() if response.status_code == 200 else None
     except Exception as e:
@@ -244,6 +254,9 @@ def fastapi_test():
         return None
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGINT, cleanup_on_exit)
+    signal.signal(signal.SIGTERM, cleanup_on_exit)
+    
     # Instead of running separately, use main.py for better integration
     logger.info("Starting MCP Assessor Agent API server using main.py...")
     import main
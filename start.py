@@ -14,6 +14,8 @@ import signal
 import multiprocessing
 from typing import List, Tuple
 
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS
+
 # Running processes
 processes = []
 
@@ -83,7 +85,7 @@ def run_process(command: str, name: str) -> subprocess.Popen:
 
 def start_flask():
     """Start the Flask documentation service."""
-    command = "gunicorn --bind 0.0.0.0:5000 --workers 1 --reuse-port --reload main:app"
+    command = "gunicorn --bind 0.0.0.0:5000 --workers 1 --reuse-port main:app"
     process = run_process(command, "Flask")
     time.sleep(1)
     
@@ -98,7 +100,7 @@ def start_flask():
 
 def start_fastapi():
     """Start the FastAPI service."""
-    command = "uvicorn app:app --host 0.0.0.0 --port 8000 --reload"
+    command = " ".join(["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS])
     process = run_process(command, "FastAPI")
     time.sleep(1)
     
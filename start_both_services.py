@@ -13,6 +13,7 @@ import signal
 import threading
 import logging
 from datetime import datetime
+from process_utils import UVICORN_ACCESS_LOG_ARGS, UVICORN_RELOAD_ARGS, wait_for_child_exit
 
 # Configure logging
 logging.basicConfig(
@@ -31,17 +32,9 @@ flask_process = None
 
 def log_output(process, name):
     """Log output from a process."""
-    for line in iter(process.stdout.readline, ''):
-        try:
-            # Check if the line is bytes or string
-            if isinstance(line, bytes):
-                decoded_line = line.decode('utf-8').rstrip()
-            else:
-                decoded_line = line.rstrip()
-            
-            logger.info(f"[{name}] {decoded_line}")
-        except Exception as e:
-            logger.error(f"Error logging output from {name}: {e}")
+    # The pipe is opened in text mode, so lines arrive already decoded
+    for line in process.stdout:
+        logger.info(f"[{name}] {line.rstrip()}")
 
 def start_fastapi():
     """Start the FastAPI service."""
@@ -61,14 +54,16 @@ def start_fastapi():
             pass  # It's okay if this fails
         
         # Start the FastAPI service with explicit reload flag for development
-        cmd = ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+        cmd = ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", *UVICORN_RELOAD_ARGS, *UVICORN_ACCESS_LOG_ARGS]
         logger.info(f"Starting FastAPI process with command: {' '.join(cmd)}")
         
         fastapi_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -103,14 +98,16 @@ def start_flask():
             pass  # It's okay if this fails
         
         # Choose how to start the Flask service - using gunicorn for production
-        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"]
+        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"]
         logger.info(f"Starting Flask process with command: {' '.join(cmd)}")
         
         flask_process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
             bufsize=1
         )
         
@@ -159,17 +156,20 @@ def check_service_health(port, max_attempts=30):
     import requests
     
     logger.info(f"Checking service health on port {port}")
-    for i in range(max_attempts):
-        try:
-            response = requests.get(f"http://localhost:{port}/health")
-            if response.status_code == 200:
-                logger.info(f"Service on port {port} is healthy")
-                return True
-        except requests.RequestException:
-            pass
-        
-        # Wait before trying again
-        time.sleep(1)
+    # Reuse one keep-alive connection across the polls instead of opening a
+    # new one for each attempt
+    with requests.Session() as session:
+        for i in range(max_attempts):
+            try:
+                response = session.get(f"http://localhost:{port}/health")
+                if response.status_code == 200:
+                    logger.info(f"Service on port {port} is healthy")
+                    return True
+            except requests.RequestException:
+                pass
+            
+            # Wait before trying again
+            time.sleep(1)
     
     logger.warning(f"Service on port {port} did not become healthy after {max_attempts} attempts")
     return False
@@ -210,7 +210,8 @@ def main():
         
         # Block the main thread but allow for graceful shutdown
         while True:
-            time.sleep(1)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([fastapi_process, flask_process])
             
             # Check if processes are still running
             if fastapi_process and fastapi_process.poll() is not None:
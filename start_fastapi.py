@@ -8,8 +8,8 @@ import os
 import sys
 import subprocess
 import signal
-import time
 import logging
+from process_utils import uvicorn_command
 
 # Configure logging
 logging.basicConfig(
@@ -63,16 +63,13 @@ def main():
         # Start FastAPI with uvicorn
         logger.info("Starting FastAPI service on port 8000...")
         
-        cmd = ["uvicorn", "app:app", "--host", "0.0.0.0", "--port", "8000", "--reload"]
+        cmd = uvicorn_command()
         fastapi_process = subprocess.Popen(cmd)
         
         logger.info("FastAPI service started. Press Ctrl+C to exit.")
         
         # Keep the script running
-        while fastapi_process.poll() is None:
-            time.sleep(1)
-        
-        return_code = fastapi_process.returncode
+        return_code = fastapi_process.wait()
         logger.info(f"FastAPI process exited with code {return_code}")
         return return_code
     
@@ -13,6 +13,8 @@ import time
 import signal
 import logging
 
+from process_utils import UVICORN_ACCESS_LOG_ARGS, wait_for_http_ready
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,7 +36,7 @@ def start_fastapi():
     env = os.environ.copy()
     
     # Start the FastAPI process using uvicorn
-    fastapi_cmd = ["uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", str(FASTAPI_PORT)]
+    fastapi_cmd = ["uvicorn", "asgi:app", "--host", "0.0.0.0", "--port", str(FASTAPI_PORT), *UVICORN_ACCESS_LOG_ARGS]
     fastapi_process = subprocess.Popen(
         fastapi_cmd,
         env=env,
@@ -66,32 +68,11 @@ def start_fastapi():
 
 def wait_for_fastapi():
     """Wait for FastAPI service to be ready."""
-    import requests
-    
-    max_attempts = 20
-    for attempt in range(1, max_attempts + 1):
-        try:
-            response = requests.get(f"{FASTAPI_URL}/health", timeout=1)
-            if response.status_code == 200:
-                logger.info(f"FastAPI service is ready (attempt {attempt}/{max_attempts})")
-                return True
-        except requests.exceptions.RequestException:
-            pass
-        
-        # Try with root health as an alternative
-        try:
-            response = requests.get(f"{FASTAPI_URL}/api/health", timeout=1)
-            if response.status_code == 200:
-                logger.info(f"FastAPI service is ready on API prefix endpoint (attempt {attempt}/{max_attempts})")
-                return True
-        except requests.exceptions.RequestException:
-            pass
-        
-        if attempt < max_attempts:
-            logger.info(f"Waiting for FastAPI to start (attempt {attempt}/{max_attempts})...")
-            time.sleep(1)
+    if wait_for_http_ready(f"{FASTAPI_URL}/health", timeout=20):
+        logger.info("FastAPI service is ready")
+        return True
     
-    logger.warning(f"FastAPI service did not become ready after {max_attempts} attempts")
+    logger.warning("FastAPI service did not become ready after 20 seconds")
     return False
 
 def cleanup(signum=None, frame=None):
@@ -4,10 +4,14 @@ Test script for the JWT authentication implementation.
 This script tests the JWT authentication endpoints and token validation.
 """
 
+import atexit
 import json
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Configure logging
@@ -20,13 +24,27 @@ AUTH_URL = f"{API_URL}/api/v1/auth"
 USERNAME = "admin"
 PASSWORD = "admin"
 
+# (connect, read) timeout in seconds for each request
+REQUEST_TIMEOUT = (3, 30)
+
+# Shared session so the test requests reuse one kept-alive connection to the
+# API instead of opening a new one per call
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+atexit.register(_SESSION.close)
+
 def test_login():
     """Test the login endpoint with username and password."""
     logger.info(f"Testing login with username: {USERNAME}")
     
-    response = requests.post(
+    response = _SESSION.post(
         f"{AUTH_URL}/login",
-        json={"username": USERNAME, "password": PASSWORD}
+        json={"username": USERNAME, "password": PASSWORD},
+        timeout=REQUEST_TIMEOUT
     )
     
     logger.info(f"Response status code: {response.status_code}")
@@ -43,10 +61,11 @@ def test_token_endpoint():
     """Test the OAuth2 token endpoint."""
     logger.info(f"Testing OAuth2 token endpoint with username: {USERNAME}")
     
-    response = requests.post(
+    response = _SESSION.post(
         f"{AUTH_URL}/token",
         data={"username": USERNAME, "password": PASSWORD},
-        headers={"Content-Type": "application/x-www-form-urlencoded"}
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=REQUEST_TIMEOUT
     )
     
     logger.info(f"Response status code: {response.status_code}")
@@ -63,9 +82,10 @@ def test_me_endpoint(token):
     """Test the /users/me endpoint with the token."""
     logger.info("Testing /users/me endpoint with token")
     
-    response = requests.get(
+    response = _SESSION.get(
         f"{AUTH_URL}/users/me",
-        headers={"Authorization": f"Bearer {token}"}
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=REQUEST_TIMEOUT
     )
     
     logger.info(f"Response status code: {response.status_code}")
@@ -88,9 +108,10 @@ def test_agent_token():
         "agent_secret": "agent-secret-key"
     }
     
-    response = requests.post(
+    response = _SESSION.post(
         f"{AUTH_URL}/agent-token",
-        json=agent_data
+        json=agent_data,
+        timeout=REQUEST_TIMEOUT
     )
     
     logger.info(f"Response status code: {response.status_code}")
@@ -103,26 +124,33 @@ def test_agent_token():
         logger.error(f"Failed to get agent token: {response.text}")
         return None
 
-def main():
-    """Main function to run all tests."""
-    logger.info("Testing JWT authentication implementation")
-    
-    # Test login
+def run_login_flow():
+    """Log in with username and password, then use the token."""
     login_data = test_login()
     
     if login_data:
         # Test /users/me endpoint with token
         test_me_endpoint(login_data.get("access_token"))
-    
-    # Test OAuth2 token endpoint
+
+def run_token_flow():
+    """Get a token from the OAuth2 endpoint, then use it."""
     token_data = test_token_endpoint()
     
     if token_data:
         # Test /users/me endpoint with token from OAuth2 endpoint
         test_me_endpoint(token_data.get("access_token"))
+
+def main():
+    """Main function to run all tests."""
+    logger.info("Testing JWT authentication implementation")
     
-    # Test agent token endpoint
-    agent_token_data = test_agent_token()
+    # The flows are independent, so run them at the same time over the
+    # shared session; the run takes as long as the slowest flow instead of
+    # the sum of all three, and the server sees steady load throughout
+    flows = [run_login_flow, run_token_flow, test_agent_token]
+    with ThreadPoolExecutor(max_workers=len(flows)) as executor:
+        for future in [executor.submit(flow) for flow in flows]:
+            future.result()
     
     logger.info("Authentication testing completed")
 
@@ -5,10 +5,11 @@ This script provides a more comprehensive test of the JWT authentication system,
 including the demo routes.
 """
 
+import asyncio
 import json
 import sys
 import logging
-import requests
+import httpx
 from typing import Dict, Any, Optional
 
 # Configure logging
@@ -23,19 +24,29 @@ API_URL = "http://localhost:5000"
 AUTH_URL = f"{API_URL}/api/v1/auth"
 DEMO_URL = f"{API_URL}/api/auth/demo"
 
+# Timeout in seconds for each request
+REQUEST_TIMEOUT = 30
+
+# Users logged in by the test run, with their passwords
+TEST_USERS = [("admin", "admin"), ("assessor", "assessor"), ("user", "user")]
+
 class JWTAuthClient:
     """
     Client for testing JWT authentication.
+    
+    Requests go through a shared httpx.AsyncClient, so several clients can
+    run their checks concurrently over one keep-alive connection pool.
     """
     
-    def __init__(self):
+    def __init__(self, http: httpx.AsyncClient):
+        self.http = http
         self.access_token = None
         self.refresh_token = None
         self.token_type = "bearer"
         self.username = None
         self.roles = []
     
-    def login(self, username: str, password: str) -> bool:
+    async def login(self, username: str, password: str) -> bool:
         """
         Login with username and password.
         
@@ -48,7 +59,7 @@ class JWTAuthClient:
         """
         try:
             # Make login request
-            response = requests.post(
+            response = await self.http.post(
                 f"{AUTH_URL}/login",
                 json={"username": username, "password": password}
             )
@@ -82,7 +93,7 @@ class JWTAuthClient:
             
         return {"Authorization": f"{self.token_type.capitalize()} {self.access_token}"}
     
-    def get_current_user(self) -> Optional[Dict[str, Any]]:
+    async def get_current_user(self) -> Optional[Dict[str, Any]]:
         """
         Get information about the current user.
         
@@ -95,7 +106,7 @@ class JWTAuthClient:
             
         try:
             # Make request to /users/me endpoint
-            response = requests.get(
+            response = await self.http.get(
                 f"{AUTH_URL}/users/me",
                 headers=self.get_auth_header()
             )
@@ -114,7 +125,7 @@ class JWTAuthClient:
             logger.error(f"Error getting current user: {str(e)}")
             return None
     
-    def test_public_route(self) -> Optional[Dict[str, Any]]:
+    async def test_public_route(self) -> Optional[Dict[str, Any]]:
         """
         Test a public route that doesn't require authentication.
         
@@ -123,7 +134,7 @@ class JWTAuthClient:
         """
         try:
             # Make request to public endpoint
-            response = requests.get(f"{DEMO_URL}/public")
+            response = await self.http.get(f"{DEMO_URL}/public")
             
             # Check if request was successful
             if response.status_code == 200:
@@ -138,7 +149,7 @@ class JWTAuthClient:
             logger.error(f"Error accessing public route: {str(e)}")
             return None
     
-    def test_protected_route(self) -> Optional[Dict[str, Any]]:
+    async def test_protected_route(self) -> Optional[Dict[str, Any]]:
         """
         Test a protected route that requires authentication.
         
@@ -151,7 +162,7 @@ class JWTAuthClient:
             
         try:
             # Make request to protected endpoint
-            response = requests.get(
+            response = await self.http.get(
                 f"{DEMO_URL}/protected",
                 headers=self.get_auth_header()
             )
@@ -169,7 +180,7 @@ class JWTAuthClient:
             logger.error(f"Error accessing protected route: {str(e)}")
             return None
     
-    def test_admin_route(self) -> Optional[Dict[str, Any]]:
+    async def test_admin_route(self) -> Optional[Dict[str, Any]]:
         """
         Test an admin route that requires the manage:users permission.
         
@@ -182,7 +193,7 @@ class JWTAuthClient:
             
         try:
             # Make request to admin endpoint
-            response = requests.get(
+            response = await self.http.get(
                 f"{DEMO_URL}/admin",
                 headers=self.get_auth_header()
             )
@@ -200,7 +211,7 @@ class JWTAuthClient:
             logger.error(f"Error accessing admin route: {str(e)}")
             return None
     
-    def test_assessor_route(self) -> Optional[Dict[str, Any]]:
+    async def test_assessor_route(self) -> Optional[Dict[str, Any]]:
         """
         Test an assessor route that requires the write:assessment permission.
         
@@ -213,7 +224,7 @@ class JWTAuthClient:
             
         try:
             # Make request to assessor endpoint
-            response = requests.get(
+            response = await self.http.get(
                 f"{DEMO_URL}/assessor",
                 headers=self.get_auth_header()
             )
@@ -232,71 +243,46 @@ class JWTAuthClient:
             return None
 
 
-def main():
-    """Main function to run the test client."""
-    logger.info("Starting JWT authentication test client")
-    
-    # Create client
-    client = JWTAuthClient()
-    
-    # Test public route (should work without authentication)
-    client.test_public_route()
-    
-    # Test admin login
-    if not client.login("admin", "admin"):
-        logger.error("Admin login failed. Exiting.")
-        return
-    
-    # Get current user
-    client.get_current_user()
-    
-    # Test protected route (should work for any authenticated user)
-    client.test_protected_route()
-    
-    # Test admin route (should work for admin)
-    client.test_admin_route()
-    
-    # Test assessor route (should work for admin, might not work for regular user)
-    client.test_assessor_route()
-    
-    # Now test with assessor user
-    client = JWTAuthClient()
-    if not client.login("assessor", "assessor"):
-        logger.error("Assessor login failed. Exiting.")
-        return
-    
-    # Get current user
-    client.get_current_user()
-    
-    # Test protected route (should work for any authenticated user)
-    client.test_protected_route()
-    
-    # Test admin route (should fail for assessor)
-    client.test_admin_route()
-    
-    # Test assessor route (should work for assessor)
-    client.test_assessor_route()
+async def check_user(http: httpx.AsyncClient, username: str, password: str):
+    """
+    Log in as a user and check which routes they can access.
     
-    # Now test with regular user
-    client = JWTAuthClient()
-    if not client.login("user", "user"):
-        logger.error("User login failed. Exiting.")
+    Args:
+        http: Shared HTTP client
+        username: User's username
+        password: User's password
+    """
+    client = JWTAuthClient(http)
+    if not await client.login(username, password):
+        logger.error(f"{username.capitalize()} login failed.")
         return
     
-    # Get current user
-    client.get_current_user()
-    
-    # Test protected route (should work for any authenticated user)
-    client.test_protected_route()
-    
-    # Test admin route (should fail for regular user)
-    client.test_admin_route()
+    # The route checks only need the token, so send them all at once.
+    # Protected should work for any authenticated user, admin only for
+    # admin, and assessor for admin and assessor
+    await asyncio.gather(
+        client.get_current_user(),
+        client.test_protected_route(),
+        client.test_admin_route(),
+        client.test_assessor_route()
+    )
+
+
+async def main():
+    """Main function to run the test client."""
+    logger.info("Starting JWT authentication test client")
     
-    # Test assessor route (should fail for regular user)
-    client.test_assessor_route()
+    limits = httpx.Limits(max_keepalive_connections=20)
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=limits) as http:
+        # The public route (which works without authentication) and each
+        # user's checks are independent, so they run concurrently
+        await asyncio.gather(
+            JWTAuthClient(http).test_public_route(),
+            *(check_user(http, username, password) for username, password in TEST_USERS)
+        )
     
     logger.info("JWT authentication test client completed")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""
+Unit Tests for the Cache Module
+
+This module provides unit tests for the function result cache and the
+Flask response cache in app.cache.
+"""
+
+import unittest
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from flask import Flask, Response, jsonify, request
+
+from app import cache as cache_module
+from app.cache import cache, cached_response, invalidate_cache
+
+
+class TestCacheDecorator(unittest.TestCase):
+    """Unit tests for the function result cache."""
+
+    def setUp(self):
+        """Start from an empty cache."""
+        invalidate_cache()
+        self.calls = 0
+
+    def tearDown(self):
+        """Leave an empty cache behind."""
+        invalidate_cache()
+
+    def test_hit_and_expiry(self):
+        """Test that results are reused until they expire."""
+        @cache(ttl_seconds=60)
+        def lookup(value):
+            self.calls += 1
+            return value * 2
+
+        now = time.time()
+        with patch.object(cache_module.time, "time", return_value=now):
+            self.assertEqual(lookup(2), 4)
+            self.assertEqual(lookup(2), 4)
+            self.assertEqual(lookup(3), 6)
+        self.assertEqual(self.calls, 2)
+
+        with patch.object(cache_module.time, "time", return_value=now + 61):
+            lookup(2)
+        self.assertEqual(self.calls, 3)
+
+    def test_bounded(self):
+        """Test that the least recently used entries are evicted."""
+        @cache(ttl_seconds=60)
+        def lookup(value):
+            self.calls += 1
+            return value
+
+        with patch.object(cache_module, "MAX_CACHE_ENTRIES", 2):
+            lookup(1)
+            lookup(2)
+            lookup(1)
+            lookup(3)
+            self.assertEqual(len(cache_module._cache), 2)
+            lookup(1)
+            self.assertEqual(self.calls, 3)
+            lookup(2)
+            self.assertEqual(self.calls, 4)
+
+
+class TestCachedResponse(unittest.TestCase):
+    """Unit tests for the Flask response cache."""
+
+    def setUp(self):
+        """Create an app with cached views that count their calls."""
+        invalidate_cache()
+        self.calls = 0
+        app = Flask(__name__)
+
+        @app.route("/listing")
+        @cached_response(ttl_seconds=60, query_args=("city", "page"))
+        def listing():
+            self.calls += 1
+            return jsonify({"city": request.args.get("city"), "page": request.args.get("page")})
+
+        @app.route("/failing")
+        @cached_response(ttl_seconds=60)
+        def failing():
+            self.calls += 1
+            return jsonify({"status": "error"}), 500
+
+        @app.route("/streamed")
+        @cached_response(ttl_seconds=60)
+        def streamed():
+            self.calls += 1
+            return Response(iter([b'{"a": ', b'1}']), content_type="application/json")
+
+        self.client = app.test_client()
+
+    def tearDown(self):
+        """Leave an empty cache behind."""
+        invalidate_cache()
+
+    def test_hit(self):
+        """Test that a repeated request is served from the cache."""
+        first = self.client.get("/listing?city=Richland")
+        second = self.client.get("/listing?city=Richland")
+        self.assertEqual(first.headers["X-Cache"], "miss")
+        self.assertEqual(second.headers["X-Cache"], "hit")
+        self.assertEqual(second.get_json(), {"city": "Richland", "page": None})
+        self.assertEqual(self.calls, 1)
+
+    def test_key_uses_declared_args_only(self):
+        """Test that undeclared query arguments don't create new entries."""
+        self.client.get("/listing?city=Richland&x=1")
+        response = self.client.get("/listing?x=2&city=Richland")
+        self.assertEqual(response.headers["X-Cache"], "hit")
+        self.assertEqual(len(cache_module._cache), 1)
+
+    def test_key_includes_declared_args(self):
+        """Test that declared query arguments select different entries."""
+        self.client.get("/listing?city=Richland")
+        self.client.get("/listing?city=Kennewick")
+        self.client.get("/listing?city=Richland&page=2")
+        self.assertEqual(self.calls, 3)
+
+    def test_key_includes_api_key(self):
+        """Test that callers with different API keys don't share entries."""
+        self.client.get("/listing", headers={"X-API-Key": "first"})
+        response = self.client.get("/listing", headers={"X-API-Key": "second"})
+        self.assertEqual(response.headers["X-Cache"], "miss")
+        self.assertIn("private", response.headers["Cache-Control"])
+
+    def test_expiry(self):
+        """Test that entries are refreshed after their TTL."""
+        now = time.time()
+        with patch.object(cache_module.time, "time", return_value=now):
+            self.client.get("/listing")
+        with patch.object(cache_module.time, "time", return_value=now + 61):
+            response = self.client.get("/listing")
+        self.assertEqual(response.headers["X-Cache"], "miss")
+        self.assertEqual(self.calls, 2)
+
+    def test_conditional_request(self):
+        """Test that a matching If-None-Match gets a 304."""
+        etag = self.client.get("/listing").headers["ETag"]
+        response = self.client.get("/listing", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_stale_etag(self):
+        """Test that a non-matching If-None-Match gets the full response."""
+        self.client.get("/listing")
+        response = self.client.get("/listing", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Cache"], "hit")
+
+    def test_errors_not_cached(self):
+        """Test that unsuccessful responses are not stored."""
+        self.client.get("/failing")
+        self.client.get("/failing")
+        self.assertEqual(self.calls, 2)
+
+    def test_streamed_not_cached(self):
+        """Test that streamed responses pass through without being buffered or stored."""
+        response = self.client.get("/streamed")
+        self.assertEqual(response.get_json(), {"a": 1})
+        self.assertEqual(response.headers["X-Cache"], "miss")
+        self.client.get("/streamed")
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(cache_module._cache), 0)
+
+    def test_bounded(self):
+        """Test that the response cache keeps at most MAX_CACHE_ENTRIES entries."""
+        with patch.object(cache_module, "MAX_CACHE_ENTRIES", 3):
+            for page in range(10):
+                self.client.get(f"/listing?page={page}")
+        self.assertEqual(len(cache_module._cache), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit Tests for the FastAPI Circuit Breaker
+
+This module provides unit tests for the circuit breaker that guards the
+Flask proxy's calls to the FastAPI service.
+"""
+
+import unittest
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import requests
+
+from fastapi_client import CircuitBreaker, CircuitOpenError
+
+
+def _response(status_code):
+    """Build a stand-in response with the given status code."""
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+def _raise(exc):
+    """Raise the given exception, as a failing upstream call would."""
+    raise exc
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Unit tests for the circuit breaker state transitions."""
+
+    RESET_TIMEOUT = 0.05  # seconds
+
+    def setUp(self):
+        """Create a breaker that opens after two failures."""
+        self.breaker = CircuitBreaker(fail_max=2, reset_timeout=self.RESET_TIMEOUT)
+
+    def _open(self):
+        """Trip the breaker with connection errors."""
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.breaker.call(_raise, requests.exceptions.ConnectionError())
+        self.assertEqual(self.breaker.state, "open")
+
+    def _wait_for_half_open(self):
+        """Wait out the reset timeout."""
+        time.sleep(self.RESET_TIMEOUT * 1.5)
+        self.assertEqual(self.breaker.state, "half-open")
+
+    def test_starts_closed(self):
+        """Test that a new breaker passes calls through."""
+        self.assertEqual(self.breaker.state, "closed")
+        self.assertEqual(self.breaker.call(_response, 200).status_code, 200)
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that fail_max failures open the circuit and reject calls."""
+        self._open()
+        upstream = MagicMock()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(upstream)
+        upstream.assert_not_called()
+
+    def test_timeouts_and_gateway_errors_count(self):
+        """Test that timeouts and 502/503/504 responses count as failures."""
+        with self.assertRaises(requests.exceptions.Timeout):
+            self.breaker.call(_raise, requests.exceptions.ReadTimeout())
+        self.breaker.call(_response, 503)
+        self.assertEqual(self.breaker.state, "open")
+
+    def test_success_resets_failures(self):
+        """Test that a success in between keeps failures from adding up."""
+        self.breaker.call(_response, 502)
+        self.breaker.call(_response, 200)
+        self.breaker.call(_response, 502)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_client_errors_are_not_failures(self):
+        """Test that 4xx/500 responses mean FastAPI is up."""
+        for status_code in (400, 404, 500):
+            self.breaker.call(_response, status_code)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_success_closes(self):
+        """Test that a successful trial call closes the circuit."""
+        self._open()
+        self._wait_for_half_open()
+        self.breaker.call(_response, 200)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_failure_reopens(self):
+        """Test that a failed trial call opens the circuit again."""
+        self._open()
+        self._wait_for_half_open()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.breaker.call(_raise, requests.exceptions.ConnectionError())
+        self.assertEqual(self.breaker.state, "open")
+
+    def test_half_open_admits_one_trial(self):
+        """Test that other calls are rejected while the trial is in flight."""
+        self._open()
+        self._wait_for_half_open()
+
+        def trial():
+            with self.assertRaises(CircuitOpenError):
+                self.breaker.call(_response, 200)
+            return _response(200)
+
+        self.breaker.call(trial)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_half_open_other_exception_releases_trial(self):
+        """Test that a non-outage exception lets the next call probe again."""
+        self._open()
+        self._wait_for_half_open()
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.breaker.call(_raise, requests.exceptions.ChunkedEncodingError())
+        self.assertEqual(self.breaker.state, "half-open")
+        self.breaker.call(_response, 200)
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_other_exception_does_not_count(self):
+        """Test that non-outage exceptions leave a closed circuit alone."""
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                self.breaker.call(_raise, ValueError("bad payload"))
+        self.assertEqual(self.breaker.state, "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit Tests for the FastAPI Proxy Routes
+
+This module provides unit tests for the Flask routes in database.py that
+relay requests to the FastAPI service, with the upstream replaced by a stub.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+
+import database
+from app.cache import invalidate_cache
+from fastapi_client import SESSION
+
+
+def _upstream_response(body):
+    """Build a stand-in for a FastAPI response that was read in full."""
+    response = MagicMock()
+    response.status_code = 200
+    response.content = body
+    response.headers = {"Content-Type": "application/json"}
+    return response
+
+
+class TestSchemaProxies(unittest.TestCase):
+    """Unit tests for the cached schema proxies."""
+
+    def setUp(self):
+        """Serve the database routes with the FastAPI session stubbed out."""
+        invalidate_cache()
+        app = Flask(__name__)
+        app.register_blueprint(database.database_bp)
+        self.client = app.test_client()
+        patcher = patch.object(SESSION, "request", return_value=_upstream_response(b'{"tables": []}'))
+        self.request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Leave an empty cache behind."""
+        invalidate_cache()
+
+    def test_schema_summary_is_cached(self):
+        """Test that repeated schema requests are answered from the cache."""
+        first = self.client.get("/api/schema-summary?db=postgres&prefix=acc")
+        second = self.client.get("/api/schema-summary?db=postgres&prefix=acc")
+        self.assertEqual(second.get_json(), {"tables": []})
+        self.assertEqual((first.headers["X-Cache"], second.headers["X-Cache"]), ("miss", "hit"))
+        self.assertEqual(self.request.call_count, 1)
+        self.assertFalse(self.request.call_args.kwargs["stream"])
+
+    def test_cache_key_includes_schema_arguments(self):
+        """Test that different databases and prefixes are fetched separately."""
+        self.client.get("/api/discover-schema?db=postgres")
+        self.client.get("/api/discover-schema?db=mssql")
+        self.client.get("/api/schema-summary?db=postgres&prefix=a")
+        self.client.get("/api/schema-summary?db=postgres&prefix=b")
+        self.assertEqual(self.request.call_count, 4)
+
+    def test_upstream_errors_not_cached(self):
+        """Test that failed schema requests are retried upstream."""
+        self.request.return_value.status_code = 500
+        self.client.get("/api/discover-schema?db=postgres")
+        self.client.get("/api/discover-schema?db=postgres")
+        self.assertEqual(self.request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
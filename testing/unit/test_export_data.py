@@ -0,0 +1,190 @@
+"""
+Unit Tests for Streamed Data Exports
+
+This module provides unit tests for exporting SQLAlchemy queries as CSV and
+Excel without loading every row into memory, including PostgreSQL COPY
+exports through a recording cursor.
+"""
+
+import unittest
+import os
+import sys
+import csv
+import re
+import zipfile
+from io import BytesIO, StringIO
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+from sqlalchemy.dialects.postgresql import psycopg2 as pg_psycopg2
+
+import export_data
+from app_setup import db
+from export_data import copy_query_as_csv, stream_query_as_csv, stream_query_as_excel
+from models import Account
+
+
+class ExportTestCase(unittest.TestCase):
+    """Base class that exports from an in-memory database."""
+
+    ACCOUNT_COUNT = 7
+
+    def setUp(self):
+        """Create an in-memory database with a few accounts."""
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Account(account_id=f"A{i}", property_city="Richland", assessed_value=i * 1000)
+            for i in range(self.ACCOUNT_COUNT)
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        """Drop the database."""
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _query(self, **filters):
+        return (Account.query.with_entities(Account.account_id, Account.assessed_value)
+                .filter_by(**filters).order_by(Account.account_id))
+
+    def _expected_rows(self):
+        return [["account_id", "assessed_value"]] + [
+            [f"A{i}", f"{i * 1000}.00"] for i in range(self.ACCOUNT_COUNT)
+        ]
+
+
+class TestStreamQueryAsCsv(ExportTestCase):
+    """Unit tests for stream_query_as_csv."""
+
+    def test_streams_all_rows_in_batches(self):
+        """Test that every row is written, one chunk per batch, after a header."""
+        with patch.object(export_data, "CSV_STREAM_BATCH_SIZE", 3):
+            response = stream_query_as_csv(self._query(), "accounts.csv")
+            self.assertTrue(response.is_streamed)
+            chunks = list(response.response)
+
+        self.assertEqual(len(chunks), 3)  # Rows 1-3, 4-6 and the last row
+        self.assertEqual(list(csv.reader(StringIO("".join(chunks)))), self._expected_rows())
+        self.assertEqual(response.mimetype, "text/csv")
+        self.assertEqual(response.headers["Content-Disposition"], "attachment; filename=accounts.csv")
+
+    def test_empty_result(self):
+        """Test that an export with no rows returns 404 instead of an empty file."""
+        response = stream_query_as_csv(self._query(property_city="Prosser"), "accounts.csv")
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_as_csv_streams_queries(self):
+        """Test that export_as_csv hands SQLAlchemy queries to the streaming export."""
+        response = export_data.export_as_csv(self._query(), "accounts.csv")
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(list(csv.reader(StringIO(response.get_data(as_text=True)))), self._expected_rows())
+
+
+class CopyCursor:
+    """Cursor that records COPY statements and writes canned CSV output."""
+
+    def __init__(self, output):
+        self.output = output
+        self.statements = []
+        self.rowcount = -1
+
+    def mogrify(self, query, params):
+        return (query % {name: repr(value) for name, value in params.items()}).encode()
+
+    def copy_expert(self, sql, file):
+        self.statements.append(sql)
+        file.write(self.output)
+        self.rowcount = self.output.count(b"\n") - 1
+
+    def close(self):
+        pass
+
+
+class TestCopyQueryAsCsv(ExportTestCase):
+    """Unit tests for copy_query_as_csv and the PostgreSQL export path."""
+
+    def _postgres_db(self, output):
+        """Stand in for a PostgreSQL engine whose raw connections use a CopyCursor."""
+        self.cursor = CopyCursor(output)
+        fake_db = MagicMock()
+        fake_db.engine.dialect = pg_psycopg2.dialect()
+        fake_db.engine.raw_connection.return_value.cursor.return_value = self.cursor
+        return patch.object(export_data, "db", fake_db)
+
+    def test_copies_query_to_stdout(self):
+        """Test that the query runs as COPY ... TO STDOUT with its parameters inlined."""
+        output = b"account_id,assessed_value\nA1,1000.00\n"
+        with self._postgres_db(output) as fake_db:
+            response = copy_query_as_csv(self._query(property_city="Richland"), "accounts.csv")
+            body = response.get_data()
+
+        self.assertEqual(body, output)
+        self.assertEqual(response.headers["Content-Disposition"], "attachment; filename=accounts.csv")
+        fake_db.engine.raw_connection.return_value.close.assert_called_once()
+        statement, = self.cursor.statements
+        self.assertTrue(statement.startswith("COPY (SELECT "))
+        self.assertTrue(statement.endswith(") TO STDOUT WITH CSV HEADER"))
+        self.assertIn("'Richland'", statement)
+        self.assertIsNone(re.search(r"%\(\w+\)s", statement))
+
+    def test_empty_result(self):
+        """Test that a COPY with only a header returns 404."""
+        with self._postgres_db(b"account_id,assessed_value\n"):
+            response = copy_query_as_csv(self._query(), "accounts.csv")
+        self.assertEqual(response.status_code, 404)
+
+    def test_postgres_csv_uses_copy(self):
+        """Test that stream_query_as_csv exports through COPY on PostgreSQL."""
+        with self._postgres_db(b"account_id\nA1\n"):
+            response = stream_query_as_csv(self._query(), "accounts.csv")
+            self.assertEqual(response.get_data(), b"account_id\nA1\n")
+        self.assertEqual(len(self.cursor.statements), 1)
+
+    def test_falls_back_to_row_streaming(self):
+        """Test that a failed COPY falls back to streaming rows."""
+        with patch.object(db.engine.dialect, "name", "postgresql"), \
+                patch.object(export_data, "copy_query_as_csv", side_effect=RuntimeError("COPY failed")) as copy:
+            response = stream_query_as_csv(self._query(), "accounts.csv")
+            rows = list(csv.reader(StringIO(response.get_data(as_text=True))))
+        copy.assert_called_once()
+        self.assertEqual(rows, self._expected_rows())
+
+
+class TestStreamQueryAsExcel(ExportTestCase):
+    """Unit tests for stream_query_as_excel."""
+
+    def _sheet_xml(self, response):
+        """Read the first sheet's XML from an xlsx response."""
+        with zipfile.ZipFile(BytesIO(response.get_data())) as workbook:
+            return workbook.read("xl/worksheets/sheet1.xml").decode()
+
+    def test_writes_header_and_rows(self):
+        """Test that the workbook holds the header and every row."""
+        with self.app.test_request_context():
+            response = stream_query_as_excel(self._query(), "accounts.xlsx", "Accounts")
+        response.direct_passthrough = False
+        sheet = self._sheet_xml(response)
+        values = re.findall(r"<(?:t|v)>([^<]*)</(?:t|v)>", sheet)
+        self.assertEqual(values, [value for row in self._expected_rows() for value in row])
+        # Values stay numeric cells rather than text
+        self.assertIn('<c r="B2"><v>0.00</v></c>', sheet)
+        self.assertIn("accounts.xlsx", response.headers["Content-Disposition"])
+
+    def test_empty_result(self):
+        """Test that an export with no rows returns 404."""
+        response = stream_query_as_excel(self._query(property_city="Prosser"), "accounts.xlsx")
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
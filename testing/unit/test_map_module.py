@@ -0,0 +1,132 @@
+"""
+Unit Tests for Map Module Helpers
+
+This module provides unit tests for the bounding box helpers and the grid
+clustering used by the map data endpoints.
+"""
+
+import unittest
+import os
+import sys
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app_setup import db
+from map_module import filter_to_bbox, get_cluster_grid_size, get_map_clusters, parse_bbox
+from models import Account
+
+
+class TestParseBbox(unittest.TestCase):
+    """Unit tests for parsing the bbox query parameter."""
+
+    def test_valid(self):
+        """Test that four comma-separated numbers are parsed in order."""
+        self.assertEqual(parse_bbox("-119.5,46.1,-119.0,46.4"), (-119.5, 46.1, -119.0, 46.4))
+        self.assertEqual(parse_bbox(" -120 , 46 , -119 , 47 "), (-120.0, 46.0, -119.0, 47.0))
+
+    def test_missing(self):
+        """Test that a missing parameter means no bounding box."""
+        self.assertIsNone(parse_bbox(None))
+        self.assertIsNone(parse_bbox(""))
+
+    def test_invalid(self):
+        """Test that malformed values are ignored."""
+        for value in ("1,2,3", "1,2,3,4,5", "a,b,c,d", "1,,3,4", ","):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_bbox(value))
+
+
+class TestFilterToBbox(unittest.TestCase):
+    """Unit tests for restricting account queries to a bounding box."""
+
+    def setUp(self):
+        """Create accounts inside and outside the box in an in-memory database."""
+        self.engine = create_engine("sqlite://")
+        Account.__table__.create(self.engine)
+        self.session = Session(self.engine)
+        self.session.add_all([
+            Account(account_id="inside", latitude=46.2, longitude=-119.2),
+            Account(account_id="edge", latitude=46.4, longitude=-119.0),
+            Account(account_id="north", latitude=47.5, longitude=-119.2),
+            Account(account_id="west", latitude=46.2, longitude=-121.0),
+            Account(account_id="unmapped", latitude=None, longitude=None),
+        ])
+        self.session.commit()
+
+    def tearDown(self):
+        """Close the session and dispose of the database."""
+        self.session.close()
+        self.engine.dispose()
+
+    def _account_ids(self, bbox):
+        query = filter_to_bbox(self.session.query(Account), bbox)
+        return sorted(account.account_id for account in query)
+
+    def test_filters_to_box(self):
+        """Test that only accounts within the box, edges included, are kept."""
+        self.assertEqual(self._account_ids((-119.5, 46.1, -119.0, 46.4)), ["edge", "inside"])
+
+    def test_no_box(self):
+        """Test that no bounding box leaves the query unchanged."""
+        self.assertEqual(len(self._account_ids(None)), 5)
+
+
+class TestMapClusters(unittest.TestCase):
+    """Unit tests for grouping accounts into map clusters."""
+
+    def setUp(self):
+        """Create accounts in two grid cells in an in-memory database."""
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Account(account_id="a1", latitude=46.201, longitude=-119.201, assessed_value=100000),
+            Account(account_id="a2", latitude=46.203, longitude=-119.203, assessed_value=300000),
+            Account(account_id="b1", latitude=46.301, longitude=-119.301, assessed_value=200000),
+            Account(account_id="unmapped", latitude=None, longitude=None, assessed_value=900000),
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        """Drop the database."""
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _clusters(self, query):
+        with self.app.test_request_context(f"/api/map/clusters{query}"):
+            return get_map_clusters().get_json()
+
+    def test_grid_size(self):
+        """Test that cells shrink by half per zoom level and zoom is clamped."""
+        self.assertEqual(get_cluster_grid_size(0), 90.0)
+        self.assertEqual(get_cluster_grid_size(1), 45.0)
+        self.assertEqual(get_cluster_grid_size(-3), 90.0)
+        self.assertEqual(get_cluster_grid_size(99), get_cluster_grid_size(20))
+
+    def test_groups_by_cell(self):
+        """Test that nearby accounts share a cluster with their aggregates."""
+        result = self._clusters("?zoom=10")
+        clusters = sorted(result["clusters"], key=lambda cluster: cluster["count"])
+        self.assertEqual([cluster["count"] for cluster in clusters], [1, 2])
+        self.assertEqual(clusters[1]["average_value"], 200000.0)
+        self.assertEqual(clusters[1]["total_value"], 400000.0)
+        self.assertAlmostEqual(clusters[1]["position"][0], 46.202)
+
+    def test_bbox(self):
+        """Test that only accounts inside the bbox are clustered."""
+        result = self._clusters("?zoom=10&bbox=-119.25,46.15,-119.15,46.25")
+        self.assertEqual([cluster["count"] for cluster in result["clusters"]], [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+Unit Tests for Prepared Statement Execution
+
+This module provides unit tests for execute_prepared in app.db, using a
+recording cursor in place of a PostgreSQL connection.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import psycopg2
+
+from app import db as app_db
+from app.db import execute_prepared
+
+
+class RecordingConnection:
+    """Stand-in for PreparedStatementConnection."""
+
+    def __init__(self):
+        self.prepared_statements = set()
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class RecordingCursor:
+    """Cursor that records statements and can fail PREPAREs."""
+
+    def __init__(self, connection, fail_prepare=False):
+        self.connection = connection
+        self.fail_prepare = fail_prepare
+        self.statements = []
+
+    def execute(self, query, params=None):
+        if self.fail_prepare and query.startswith("PREPARE"):
+            raise psycopg2.ProgrammingError("could not determine data type of parameter $1")
+        self.statements.append((query, params))
+
+
+class TestExecutePrepared(unittest.TestCase):
+    """Unit tests for execute_prepared."""
+
+    def setUp(self):
+        """Create a connection with no prepared statements."""
+        self.connection = RecordingConnection()
+        self.cursor = RecordingCursor(self.connection)
+
+    def test_prepares_once_per_shape(self):
+        """Test that a query is prepared once and executed with each set of values."""
+        query = "SELECT * FROM parcels WHERE city = %s AND total_value > %s"
+        execute_prepared(self.cursor, query, ["Richland", 100000])
+        execute_prepared(self.cursor, query, ["Kennewick", 200000])
+
+        self.assertEqual(len(self.connection.prepared_statements), 1)
+        name = next(iter(self.connection.prepared_statements))
+        self.assertEqual(self.cursor.statements, [
+            (f"PREPARE {name} AS SELECT * FROM parcels WHERE city = $1 AND total_value > $2", None),
+            (f"EXECUTE {name} (%s, %s)", ["Richland", 100000]),
+            (f"EXECUTE {name} (%s, %s)", ["Kennewick", 200000]),
+        ])
+
+    def test_different_queries_get_different_names(self):
+        """Test that each query shape gets its own statement."""
+        execute_prepared(self.cursor, "SELECT * FROM parcels WHERE id = %s", [1])
+        execute_prepared(self.cursor, "SELECT * FROM sales WHERE id = %s", [1])
+        self.assertEqual(len(self.connection.prepared_statements), 2)
+
+    def test_unpreparable_queries_run_directly(self):
+        """Test that queries without positional parameters or with other '%' run as plain statements."""
+        cases = [
+            ("SELECT 1", None),
+            ("SELECT 1", []),
+            ("SELECT * FROM parcels WHERE city = %(city)s", {"city": "Richland"}),
+            ("SELECT * FROM parcels WHERE city LIKE 'R%%' AND id = %s", [1]),
+            ("SELECT * FROM parcels WHERE id = %s", [1, 2]),
+        ]
+        for query, params in cases:
+            execute_prepared(self.cursor, query, params)
+        self.assertEqual(self.connection.prepared_statements, set())
+        self.assertEqual([statement for statement, _ in self.cursor.statements], [query for query, _ in cases])
+
+    def test_plain_connection(self):
+        """Test that connections without prepared statement tracking run queries directly."""
+        cursor = RecordingCursor(object())
+        execute_prepared(cursor, "SELECT * FROM parcels WHERE id = %s", [1])
+        self.assertEqual(cursor.statements, [("SELECT * FROM parcels WHERE id = %s", [1])])
+
+    def test_limit_reached(self):
+        """Test that new shapes run unprepared once the connection's limit is reached."""
+        with patch.object(app_db, "MAX_PREPARED_STATEMENTS", 1):
+            execute_prepared(self.cursor, "SELECT * FROM parcels WHERE id = %s", [1])
+            execute_prepared(self.cursor, "SELECT * FROM sales WHERE id = %s", [2])
+        self.assertEqual(len(self.connection.prepared_statements), 1)
+        self.assertEqual(self.cursor.statements[-1], ("SELECT * FROM sales WHERE id = %s", [2]))
+
+    def test_prepare_failure_falls_back(self):
+        """Test that a failed PREPARE rolls back and runs the query directly."""
+        cursor = RecordingCursor(self.connection, fail_prepare=True)
+        execute_prepared(cursor, "SELECT * FROM parcels WHERE id = %s", [None])
+        self.assertEqual(self.connection.rollbacks, 1)
+        self.assertEqual(self.connection.prepared_statements, set())
+        self.assertEqual(cursor.statements, [("SELECT * FROM parcels WHERE id = %s", [None])])
+
+
+class TestPaginatedPreparedQuery(unittest.TestCase):
+    """Unit tests for pagination in execute_parameterized_query."""
+
+    def setUp(self):
+        """Route PostgreSQL connections to a recording cursor."""
+        self.connection = RecordingConnection()
+        self.cursors = []
+        test = self
+
+        class Cursor(RecordingCursor):
+            description = [("total_count",)]
+
+            def fetchall(self):
+                return []
+
+            def fetchone(self):
+                return {"total_count": 0}
+
+            def close(self):
+                pass
+
+        class Connection:
+            def cursor(self, **kwargs):
+                cursor = Cursor(test.connection)
+                test.cursors.append(cursor)
+                return cursor
+
+        patches = [
+            patch.object(app_db, "get_postgres_connection", return_value=Connection()),
+            patch.object(app_db, "release_postgres_connection"),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run_pages(self, query, params, pages=3):
+        for page in range(1, pages + 1):
+            result = app_db.execute_parameterized_query(
+                "postgres", query, params, page=page, page_size=10, security_level="none"
+            )
+            self.assertEqual(result["status"], "success")
+        return [statement for cursor in self.cursors for statement in cursor.statements]
+
+    def test_pages_share_one_statement(self):
+        """Test that LIMIT and OFFSET are bound, so every page reuses the same statement."""
+        statements = self._run_pages("SELECT * FROM parcels WHERE city = %s", ["Richland"])
+        self.assertEqual(len(self.connection.prepared_statements), 2)  # Page query and count query
+        page_executions = [params for query, params in statements
+                           if query.startswith("EXECUTE") and len(params) == 3]
+        self.assertEqual(page_executions, [["Richland", 10, 0], ["Richland", 10, 10], ["Richland", 10, 20]])
+
+    def test_literal_percent_without_params(self):
+        """Test that literal '%' is escaped once the page bounds become parameters."""
+        statements = self._run_pages("SELECT * FROM parcels WHERE city LIKE 'R%'", None, pages=1)
+        self.assertIn(("SELECT * FROM parcels WHERE city LIKE 'R%%' LIMIT %s OFFSET %s", [10, 0]), statements)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unit Tests for Process Supervision Helpers
+
+This module provides unit tests for waiting on the child processes started
+by the service launcher scripts.
+"""
+
+import unittest
+import os
+import sys
+import subprocess
+from unittest.mock import patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import process_utils
+from process_utils import wait_for_child_exit
+
+
+def _child(seconds, exit_code=0):
+    """Start a Python child that sleeps and then exits with exit_code."""
+    return subprocess.Popen([
+        sys.executable, "-c", f"import sys, time; time.sleep({seconds}); sys.exit({exit_code})"
+    ])
+
+
+@unittest.skipUnless(hasattr(os, "waitid"), "os.waitid is not available on this platform")
+class TestWaitForChildExit(unittest.TestCase):
+    """Unit tests for wait_for_child_exit."""
+
+    def test_returns_when_watched_child_exits(self):
+        """Test that waiting ends on exit and leaves the return code to Popen.poll()."""
+        child = _child(0.1, exit_code=3)
+        wait_for_child_exit([child])
+        self.assertEqual(child.poll(), 3)
+
+    def test_reaps_unwatched_children(self):
+        """Test that other children are reaped while waiting continues."""
+        helper = _child(0, exit_code=0)
+        watched = _child(0.5, exit_code=4)
+        try:
+            wait_for_child_exit([watched])
+            self.assertEqual(watched.poll(), 4)
+            # The helper was reaped by wait_for_child_exit, not by its Popen
+            with self.assertRaises(ChildProcessError):
+                os.waitpid(helper.pid, os.WNOHANG)
+        finally:
+            helper.poll()
+            watched.kill()
+            watched.wait()
+
+    def test_any_child_when_none_watched(self):
+        """Test that any child exit ends the wait if no processes are given."""
+        child = _child(0.1, exit_code=5)
+        wait_for_child_exit()
+        self.assertEqual(child.poll(), 5)
+
+    def test_no_children(self):
+        """Test that it sleeps for the fallback interval if there are no children."""
+        with patch.object(process_utils.os, "waitid", side_effect=ChildProcessError), \
+                patch.object(process_utils.time, "sleep") as sleep:
+            wait_for_child_exit(fallback_interval=2)
+        sleep.assert_called_once_with(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit Tests for the Summary Snapshots
+
+This module provides unit tests for recording the daily dashboard summary
+snapshot and for the visualization summary endpoint that reads it.
+"""
+
+import unittest
+import os
+import sys
+import datetime
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+
+import routes
+from app.cache import invalidate_cache
+from app_setup import db
+from models import Account, Parcel, Sale, SummaryStatsDaily
+from record_summary_snapshot import record_summary_snapshot
+
+
+class TestSummarySnapshot(unittest.TestCase):
+    """Unit tests for the daily summary snapshot and the summary endpoint."""
+
+    def setUp(self):
+        """Serve the API routes from an in-memory database with a few accounts and sales."""
+        invalidate_cache()
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.app.register_blueprint(routes.api_routes)
+        self.client = self.app.test_client()
+
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        today = datetime.date.today()
+        db.session.add_all([
+            Account(account_id="A1", property_city="Richland", mailing_city="Kennewick", assessed_value=100000),
+            Account(account_id="A2", property_city="Richland", mailing_city="Richland", assessed_value=300000),
+            Account(account_id="A3", property_city="Kennewick", mailing_city="Richland", assessed_value=200000),
+        ])
+        richland = Parcel(parcel_id="P1", address="1 Main", city="Richland", state="WA", zip_code="99352",
+                          land_value=1, improvement_value=1, total_value=2, assessment_year=2024)
+        kennewick = Parcel(parcel_id="P2", address="2 Main", city="Kennewick", state="WA", zip_code="99336",
+                           land_value=1, improvement_value=1, total_value=2, assessment_year=2024)
+        db.session.add_all([richland, kennewick])
+        db.session.flush()
+        db.session.add_all([
+            Sale(parcel_id=richland.id, sale_date=today - datetime.timedelta(days=3), sale_price=1),
+            Sale(parcel_id=kennewick.id, sale_date=today - datetime.timedelta(days=5), sale_price=1),
+            Sale(parcel_id=kennewick.id, sale_date=today - datetime.timedelta(days=90), sale_price=1),
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        """Drop the database and the cached responses."""
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+        invalidate_cache()
+
+    def _summary(self, query=""):
+        response = self.client.get(f"/api/visualization-data/summary{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_records_unfiltered_totals(self):
+        """Test that the snapshot holds the totals over all accounts and recent sales."""
+        snapshot = record_summary_snapshot()
+        self.assertEqual(snapshot.snapshot_date, datetime.date.today())
+        self.assertEqual(snapshot.total_properties, 3)
+        self.assertEqual(float(snapshot.avg_value), 200000.0)
+        self.assertEqual(float(snapshot.total_value), 600000.0)
+        self.assertEqual(snapshot.sales_count, 2)
+
+    def test_rerun_updates_the_day(self):
+        """Test that recording twice on one day keeps a single, updated row."""
+        record_summary_snapshot()
+        db.session.add(Account(account_id="A4", property_city="Prosser", assessed_value=400000))
+        db.session.commit()
+        snapshot = record_summary_snapshot()
+        self.assertEqual(SummaryStatsDaily.query.count(), 1)
+        self.assertEqual(snapshot.total_properties, 4)
+
+    def test_summary_is_read_only(self):
+        """Test that loading the summary doesn't write a snapshot."""
+        summary = self._summary()
+        self.assertEqual(summary["total_properties"], 3)
+        self.assertEqual(summary["properties_change"], 0.0)
+        self.assertEqual(SummaryStatsDaily.query.count(), 0)
+
+    def test_changes_against_baseline(self):
+        """Test that changes compare with the newest snapshot at least a period old."""
+        today = datetime.date.today()
+        record_summary_snapshot(today - datetime.timedelta(days=routes.SUMMARY_CHANGE_PERIOD_DAYS + 10))
+        db.session.add(SummaryStatsDaily(
+            snapshot_date=today - datetime.timedelta(days=routes.SUMMARY_CHANGE_PERIOD_DAYS),
+            total_properties=2, avg_value=160000, total_value=320000, sales_count=4
+        ))
+        # Too recent to be the baseline
+        db.session.add(SummaryStatsDaily(
+            snapshot_date=today - datetime.timedelta(days=1),
+            total_properties=1, avg_value=1, total_value=1, sales_count=1
+        ))
+        db.session.commit()
+
+        summary = self._summary()
+        self.assertEqual(summary["properties_change"], 50.0)
+        self.assertEqual(summary["value_change"], 25.0)
+        self.assertEqual(summary["total_value_change"], 87.5)
+        self.assertEqual(summary["sales_change"], -50.0)
+
+    def test_city_filters_on_property_city(self):
+        """Test that the city filter means the property's city for both accounts and sales."""
+        record_summary_snapshot(datetime.date.today() - datetime.timedelta(days=routes.SUMMARY_CHANGE_PERIOD_DAYS))
+        summary = self._summary("?city=Richland")
+        self.assertEqual(summary["total_properties"], 2)
+        self.assertEqual(summary["total_value"], 400000.0)
+        self.assertEqual(summary["recent_sales"], 1)
+        # Filtered views have no snapshot to compare to
+        self.assertEqual(summary["properties_change"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,409 @@
+"""
+Unit Tests for Route Helpers
+
+This module provides unit tests for the helpers behind the Flask API routes.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+import routes
+from app_setup import db
+from models import Account
+from routes import _decode_cursor, _encode_cursor, _paginate_by_id, _percent_change
+
+Base = declarative_base()
+
+
+class Item(Base):
+    """Minimal table to page through."""
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20))
+
+
+class TestPaginationCursor(unittest.TestCase):
+    """Unit tests for the opaque pagination cursors."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the id it was built from."""
+        for last_id in (0, 1, 42, 10 ** 12):
+            self.assertEqual(_decode_cursor(_encode_cursor(last_id)), last_id)
+
+    def test_cursor_is_opaque(self):
+        """Test that the cursor doesn't expose the raw id."""
+        self.assertNotEqual(_encode_cursor(42), "42")
+
+    def test_invalid_cursor(self):
+        """Test that malformed cursors raise ValueError."""
+        for cursor in ("not base64!", "abc", _encode_cursor("not-a-number"), "éééé"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    _decode_cursor(cursor)
+
+
+class TestPaginateById(unittest.TestCase):
+    """Unit tests for keyset pagination."""
+
+    def setUp(self):
+        """Create a table of 25 rows in an in-memory database."""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.session = Session(self.engine)
+        self.session.add_all(Item(id=i, name=f"item {i}") for i in range(1, 26))
+        self.session.commit()
+
+    def tearDown(self):
+        """Close the session and dispose of the database."""
+        self.session.close()
+        self.engine.dispose()
+
+    def test_walks_every_row_once(self):
+        """Test that following next_cursor visits every row in order."""
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor = _paginate_by_id(self.session.query(Item), Item.id, 0, 10, cursor)
+            seen.extend(row.id for row in rows)
+            if cursor is None:
+                break
+        self.assertEqual(seen, list(range(1, 26)))
+
+    def test_last_page_has_no_cursor(self):
+        """Test that an exactly full last page doesn't return a cursor."""
+        rows, cursor = _paginate_by_id(self.session.query(Item), Item.id, 20, 5)
+        self.assertEqual([row.id for row in rows], [21, 22, 23, 24, 25])
+        self.assertIsNone(cursor)
+
+    def test_offset_without_cursor(self):
+        """Test that the legacy offset applies when no cursor is given."""
+        rows, cursor = _paginate_by_id(self.session.query(Item), Item.id, 5, 3)
+        self.assertEqual([row.id for row in rows], [6, 7, 8])
+        self.assertEqual(_decode_cursor(cursor), 8)
+
+    def test_cursor_takes_precedence_over_offset(self):
+        """Test that a cursor seeks past its id and ignores the offset."""
+        rows, _ = _paginate_by_id(self.session.query(Item), Item.id, 20, 3, _encode_cursor(3))
+        self.assertEqual([row.id for row in rows], [4, 5, 6])
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor raises ValueError."""
+        with self.assertRaises(ValueError):
+            _paginate_by_id(self.session.query(Item), Item.id, 0, 10, "abc")
+
+
+class TestImportedAccountsListing(unittest.TestCase):
+    """Unit tests for cursor pagination on the imported accounts listing."""
+
+    def setUp(self):
+        """Serve the API routes from an in-memory database of 7 accounts."""
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.app.register_blueprint(routes.api_routes)
+        self.client = self.app.test_client()
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all(Account(account_id=f"A{i}", owner_name=f"Owner {i}") for i in range(7))
+        db.session.commit()
+
+    def tearDown(self):
+        """Drop the database."""
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_follow_cursors(self):
+        """Test that following next_cursor lists every account once."""
+        seen = []
+        url = "/api/imported-data/accounts?limit=3"
+        while url:
+            body = self.client.get(url).get_json()
+            seen.extend(account["account_id"] for account in body["accounts"])
+            cursor = body.get("next_cursor")
+            url = f"/api/imported-data/accounts?limit=3&cursor={cursor}" if cursor else None
+        self.assertEqual(seen, [f"A{i}" for i in range(7)])
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor gets a 400."""
+        response = self.client.get("/api/imported-data/accounts?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["status"], "error")
+
+
+class TestPercentChange(unittest.TestCase):
+    """Unit tests for period-over-period percentage changes."""
+
+    def test_change(self):
+        """Test increases, decreases and rounding."""
+        self.assertEqual(_percent_change(150, 100), 50.0)
+        self.assertEqual(_percent_change(50, 100), -50.0)
+        self.assertEqual(_percent_change(1, 3), -66.7)
+
+    def test_no_baseline(self):
+        """Test that a zero or missing previous value gives 0.0."""
+        self.assertEqual(_percent_change(10, 0), 0.0)
+        self.assertEqual(_percent_change(10, None), 0.0)
+
+    def test_decimal_values(self):
+        """Test that Decimal values from the database are accepted."""
+        from decimal import Decimal
+        self.assertEqual(_percent_change(Decimal("110.00"), Decimal("100.00")), 10.0)
+
+
+class TestExecuteCachedQuery(unittest.TestCase):
+    """Unit tests for the custom SQL result cache."""
+
+    def setUp(self):
+        """Replace the database with a mock session that counts executions."""
+        self.original_db = routes.db
+        routes.db = MagicMock()
+        routes.db.session.info = {}
+        routes.db.session.execute.side_effect = self._execute
+        self.executed = []
+        self.count = 7
+        with routes._query_result_cache_lock:
+            routes._query_result_cache.clear()
+
+    def tearDown(self):
+        """Restore the database and clear the cache."""
+        routes.db = self.original_db
+        with routes._query_result_cache_lock:
+            routes._query_result_cache.clear()
+
+    def _execute(self, statement):
+        """Record the statement and return a one-row result."""
+        self.executed.append(str(statement))
+        result = MagicMock()
+        result.keys.return_value = ["n"]
+        result.fetchall.return_value = [(self.count,)]
+        return result
+
+    def _new_session(self):
+        """Start a new request's session, as the app context teardown would."""
+        routes.db.session.info = {}
+
+    def test_repeated_select_is_cached(self):
+        """Test that a repeated SELECT is served from the cache."""
+        first = routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        second = routes._execute_cached_query("SELECT   count(*) n\nFROM accounts;")
+        self.assertEqual(first, (["n"], [{"n": 7}]))
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.executed), 1)
+
+    def test_write_clears_cache(self):
+        """Test that a non-SELECT statement clears cached results."""
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        routes._execute_cached_query("DELETE FROM accounts WHERE id = 1 RETURNING id")
+        self.assertEqual(len(routes._query_result_cache), 0)
+
+    def test_select_after_write_in_rolled_back_session(self):
+        """Test that reads after an uncommitted write are neither cached nor served from cache."""
+        self.count = 8  # As seen inside the transaction that inserted a row
+        routes._execute_cached_query("INSERT INTO accounts (account_id) VALUES ('ZZ') RETURNING id")
+        _, rows = routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        self.assertEqual(rows, [{"n": 8}])
+        self.assertEqual(len(routes._query_result_cache), 0)
+
+        # The transaction is rolled back; the next request sees the committed count
+        self._new_session()
+        self.count = 7
+        _, rows = routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        self.assertEqual(rows, [{"n": 7}])
+
+    def test_cached_result_not_used_after_write(self):
+        """Test that a session that has written skips results cached before."""
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        self._new_session()
+        routes._execute_cached_query("UPDATE accounts SET owner_name = 'x' RETURNING id")
+        self.count = 9
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        self.assertEqual(len(self.executed), 4)
+
+    def test_expired_entry_is_refreshed(self):
+        """Test that entries older than the TTL are executed again."""
+        original_ttl = routes.QUERY_RESULT_CACHE_TTL
+        routes.QUERY_RESULT_CACHE_TTL = 0
+        try:
+            routes._execute_cached_query("SELECT count(*) n FROM accounts")
+            routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        finally:
+            routes.QUERY_RESULT_CACHE_TTL = original_ttl
+        self.assertEqual(len(self.executed), 2)
+
+    def test_least_recently_used_evicted(self):
+        """Test that the cache keeps at most QUERY_RESULT_CACHE_SIZE entries."""
+        original_size = routes.QUERY_RESULT_CACHE_SIZE
+        routes.QUERY_RESULT_CACHE_SIZE = 2
+        try:
+            for table in ("a", "b", "a", "c"):
+                routes._execute_cached_query(f"SELECT count(*) n FROM {table}")
+        finally:
+            routes.QUERY_RESULT_CACHE_SIZE = original_size
+        self.assertEqual(list(routes._query_result_cache), ["SELECT count(*) n FROM a", "SELECT count(*) n FROM c"])
+
+
+    def test_multiple_statements_always_run(self):
+        """Test that multi-statement text runs every time and clears the cache."""
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        for _ in range(2):
+            routes._execute_cached_query("SELECT count(*) n FROM accounts; DELETE FROM accounts")
+        self.assertEqual(len(self.executed), 3)
+        self.assertEqual(len(routes._query_result_cache), 0)
+        self.assertTrue(routes.db.session.info["query_cache_bypass"])
+
+    def test_writing_select_clears_cache(self):
+        """Test that SELECTs that write are treated like other writes."""
+        for sql_query in ("SELECT * INTO accounts_copy FROM accounts",
+                          "SELECT nextval('accounts_id_seq')",
+                          "SELECT setval('accounts_id_seq', 1)"):
+            with self.subTest(sql_query=sql_query):
+                self._new_session()
+                routes._execute_cached_query("SELECT count(*) n FROM accounts")
+                routes._execute_cached_query(sql_query)
+                self.assertEqual(len(routes._query_result_cache), 0)
+
+    def test_volatile_select_not_cached(self):
+        """Test that row locks and volatile functions run every time without clearing the cache."""
+        routes._execute_cached_query("SELECT count(*) n FROM accounts")
+        volatile = [
+            "SELECT now() n",
+            "SELECT pg_advisory_lock(42) n",
+            "SELECT id n FROM accounts WHERE id = 1 FOR UPDATE",
+            "SELECT id n FROM accounts FOR SHARE SKIP LOCKED",
+            "SELECT random() n",
+        ]
+        for sql_query in volatile:
+            routes._execute_cached_query(sql_query)
+            routes._execute_cached_query(sql_query)
+        self.assertEqual(len(self.executed), 1 + 2 * len(volatile))
+        self.assertEqual(list(routes._query_result_cache), ["SELECT count(*) n FROM accounts"])
+
+
+class TestRunBatch(unittest.TestCase):
+    """Unit tests for the run-batch endpoint."""
+
+    def setUp(self):
+        """Serve the API routes over a mock session that records statements."""
+        self.original_db = routes.db
+        routes.db = MagicMock()
+        routes.db.session.info = {}
+        routes.db.session.execute.side_effect = self._execute
+        routes.db.engine.dialect.name = "sqlite"
+        self.executed = []
+        with routes._query_result_cache_lock:
+            routes._query_result_cache.clear()
+        app = Flask(__name__)
+        app.register_blueprint(routes.api_routes)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        """Restore the database and clear the cache."""
+        routes.db = self.original_db
+        with routes._query_result_cache_lock:
+            routes._query_result_cache.clear()
+
+    def _execute(self, statement):
+        """Record the statement and return a one-row result."""
+        self.executed.append(str(statement))
+        result = MagicMock()
+        result.keys.return_value = ["n"]
+        result.fetchall.return_value = [(len(self.executed),)]
+        return result
+
+    def _post(self, queries):
+        return self.client.post("/api/run-batch", json={"queries": queries})
+
+    def test_runs_queries_in_order(self):
+        """Test that each query's result is returned in order and the transaction is rolled back."""
+        response = self._post(["SELECT 1 n", "SELECT 2 n;"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["rows"] for result in response.get_json()["results"]],
+                         [[{"n": 1}], [{"n": 2}]])
+        routes.db.session.rollback.assert_called_once()
+        routes.db.session.commit.assert_not_called()
+
+    def test_read_only_transaction_on_postgresql(self):
+        """Test that PostgreSQL runs the batch in a read-only transaction."""
+        routes.db.engine.dialect.name = "postgresql"
+        self._post(["SELECT 1 n"])
+        self.assertEqual(self.executed, ["SET TRANSACTION READ ONLY", "SELECT 1 n"])
+
+    def test_rejects_writes(self):
+        """Test that batches containing any statement that may write are rejected before running."""
+        payloads = [
+            ["SELECT 1 n; COMMIT; DELETE FROM accounts"],
+            ["SELECT 1 n", "SELECT 1 n; DROP TABLE accounts;"],
+            ["DELETE FROM accounts"],
+            ["WITH gone AS (DELETE FROM accounts RETURNING id) SELECT count(*) FROM gone"],
+            ["SELECT * INTO accounts_copy FROM accounts"],
+        ]
+        for queries in payloads:
+            with self.subTest(queries=queries):
+                response = self._post(queries)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("single SELECT", response.get_json()["message"])
+        self.assertEqual(self.executed, [])
+
+    def test_rejects_invalid_payloads(self):
+        """Test that missing, oversized and non-string batches get a 400."""
+        payloads = [
+            [],
+            "SELECT 1",
+            ["SELECT 1"] * (routes.MAX_BATCH_QUERIES + 1),
+            ["SELECT 1", 2],
+            ["  "],
+        ]
+        for queries in payloads:
+            with self.subTest(queries=queries):
+                self.assertEqual(self._post(queries).status_code, 400)
+        self.assertEqual(self.executed, [])
+
+
+class TestFlushCache(unittest.TestCase):
+    """Unit tests for the cache flush endpoint."""
+
+    def setUp(self):
+        """Serve the API routes."""
+        self.original_key = routes.ADMIN_API_KEY
+        app = Flask(__name__)
+        app.register_blueprint(routes.api_routes)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        """Restore the configured API key."""
+        routes.ADMIN_API_KEY = self.original_key
+
+    def test_disabled_without_api_key(self):
+        """Test that the endpoint refuses to run when no API key is configured."""
+        routes.ADMIN_API_KEY = None
+        self.assertEqual(self.client.post("/admin/flush-cache").status_code, 403)
+
+    def test_requires_matching_key(self):
+        """Test that only requests with the configured key clear the caches."""
+        routes.ADMIN_API_KEY = "secret"
+        with routes._query_result_cache_lock:
+            routes._query_result_cache["SELECT 1"] = ([], [], 0)
+        self.assertEqual(self.client.post("/admin/flush-cache").status_code, 401)
+        self.assertEqual(self.client.post("/admin/flush-cache", headers={"X-API-Key": "wrong"}).status_code, 401)
+        self.assertEqual(len(routes._query_result_cache), 1)
+        response = self.client.post("/admin/flush-cache", headers={"X-API-Key": "secret"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(routes._query_result_cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit Tests for the Database Seeder
+
+This module provides unit tests for the sample parcels, properties and sales
+written by seed_database.py, for seeding them in one transaction and for
+splitting the bulk INSERTs into batches, using an in-memory database.
+"""
+
+import unittest
+import os
+import sys
+from collections import defaultdict
+from unittest.mock import patch
+
+# Add parent directory to path to facilitate imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from flask import Flask
+
+import seed_database
+from app_setup import db
+from models import Parcel, Property, Sale
+from seed_database import (
+    create_sample_parcels, create_sample_properties, create_sample_sales, insert_batches, seed_database as seed
+)
+
+
+class SeedTestCase(unittest.TestCase):
+    """Base class that seeds an in-memory database."""
+
+    def setUp(self):
+        """Create an empty in-memory database."""
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        """Drop the database."""
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+
+class TestSampleRows(SeedTestCase):
+    """Unit tests for the sample row generators."""
+
+    def test_parcels(self):
+        """Test that parcels get the returned ids, unique numbers and consistent totals."""
+        parcel_ids = create_sample_parcels(count=20)
+        db.session.commit()
+
+        parcels = Parcel.query.order_by(Parcel.id).all()
+        self.assertEqual([parcel.id for parcel in parcels], parcel_ids)
+        self.assertEqual(len({parcel.parcel_id for parcel in parcels}), 20)
+        for parcel in parcels:
+            self.assertEqual(parcel.total_value, parcel.land_value + parcel.improvement_value)
+            self.assertTrue(2020 <= parcel.assessment_year <= 2024)
+
+    def test_parcel_ids_follow_existing(self):
+        """Test that new parcel ids start after the highest existing id."""
+        db.session.add(Parcel(id=41, parcel_id="P41", address="1 Main", city="Richland", state="WA",
+                              zip_code="99352", assessment_year=2024))
+        db.session.commit()
+        self.assertEqual(create_sample_parcels(count=3), [42, 43, 44])
+
+    def test_properties(self):
+        """Test that each parcel gets one to three properties and land has no building."""
+        parcel_ids = create_sample_parcels(count=30)
+        created = create_sample_properties(parcel_ids)
+        db.session.commit()
+
+        self.assertEqual(Property.query.count(), created)
+        per_parcel = defaultdict(int)
+        for prop in Property.query:
+            per_parcel[prop.parcel_id] += 1
+            if prop.property_type == "Vacant Land":
+                self.assertIsNone(prop.year_built)
+                self.assertIsNone(prop.square_footage)
+                self.assertIsNone(prop.bedrooms)
+            else:
+                self.assertIsNotNone(prop.year_built)
+            if prop.property_type not in ("Single Family", "Multi-Family", "Condominium"):
+                self.assertIsNone(prop.bedrooms)
+        self.assertEqual(set(per_parcel), set(parcel_ids))
+        self.assertTrue(all(1 <= count <= 3 for count in per_parcel.values()))
+
+    def test_sales(self):
+        """Test that each parcel gets one to five sales in different, increasing years."""
+        parcel_ids = create_sample_parcels(count=30)
+        created = create_sample_sales(parcel_ids)
+        db.session.commit()
+
+        self.assertEqual(Sale.query.count(), created)
+        years = defaultdict(list)
+        for sale in Sale.query.order_by(Sale.id):
+            years[sale.parcel_id].append(sale.sale_date.year)
+        self.assertEqual(set(years), set(parcel_ids))
+        for parcel_years in years.values():
+            self.assertTrue(1 <= len(parcel_years) <= 5)
+            self.assertEqual(parcel_years, sorted(set(parcel_years)))
+            self.assertTrue(all(2010 <= year <= 2024 for year in parcel_years))
+
+
+class TestSeedDatabase(SeedTestCase):
+    """Unit tests for seed_database."""
+
+    def setUp(self):
+        """Seed the test database instead of the application's."""
+        super().setUp()
+        patcher = patch.object(seed_database, "app", self.app)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_seeds_and_commits(self):
+        """Test that a seed writes parcels with their properties and sales."""
+        seed()
+        db.session.remove()
+        self.assertEqual(Parcel.query.count(), 50)
+        self.assertGreaterEqual(Property.query.count(), 50)
+        self.assertGreaterEqual(Sale.query.count(), 50)
+
+    def test_skips_seeded_database(self):
+        """Test that a second seed leaves the existing data alone."""
+        seed()
+        sale_count = Sale.query.count()
+        seed()
+        self.assertEqual(Parcel.query.count(), 50)
+        self.assertEqual(Sale.query.count(), sale_count)
+
+    def test_failure_leaves_no_data(self):
+        """Test that a failing step rolls back the rows written before it."""
+        with patch.object(seed_database, "create_sample_sales", side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                seed()
+        self.assertEqual(Parcel.query.count(), 0)
+        self.assertEqual(Property.query.count(), 0)
+
+
+class TestInsertBatches(SeedTestCase):
+    """Unit tests for insert_batches."""
+
+    def test_splits_rows(self):
+        """Test that rows are split into full batches and a remainder."""
+        with patch.object(seed_database, "INSERT_BATCH_SIZE", 3):
+            batches = list(insert_batches({"id": i} for i in range(7)))
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        self.assertEqual([row["id"] for batch in batches for row in batch], list(range(7)))
+
+    def test_no_rows(self):
+        """Test that no rows give no batches."""
+        self.assertEqual(list(insert_batches([])), [])
+
+    def test_consumes_one_batch_at_a_time(self):
+        """Test that a generator is only read as far as the batch being taken."""
+        produced = []
+
+        def rows():
+            for i in range(10):
+                produced.append(i)
+                yield {"id": i}
+
+        with patch.object(seed_database, "INSERT_BATCH_SIZE", 4):
+            batches = insert_batches(rows())
+            next(batches)
+            self.assertEqual(len(produced), 4)
+
+    def test_seed_writes_every_batch(self):
+        """Test that seeding with small batches still writes every row."""
+        with patch.object(seed_database, "INSERT_BATCH_SIZE", 7):
+            parcel_ids = create_sample_parcels(count=20)
+            created = create_sample_sales(parcel_ids)
+        db.session.commit()
+        self.assertEqual(Parcel.query.count(), 20)
+        self.assertEqual(Sale.query.count(), created)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,6 @@ property analytics and visualization.
 
 import random
 import logging
-from decimal import Decimal
 from app_setup import app, db
 from models import Account
 
@@ -81,8 +80,9 @@ def update_assessed_values():
                 # Round to nearest 100
                 assessed_value = round(assessed_value / 100) * 100
                 
-                # Update account
-                account.assessed_value = Decimal(str(assessed_value))
+                # Update account; the Numeric column converts the float on bind,
+                # so no Decimal is built per row
+                account.assessed_value = assessed_value
                 
                 # Calculate tax amount (roughly 1% of assessed value)
                 tax_rate = random.uniform(0.009, 0.011)  # 0.9% to 1.1%
@@ -90,7 +90,7 @@ def update_assessed_values():
                 
                 # Round to nearest 10
                 tax_amount = round(tax_amount / 10) * 10
-                account.tax_amount = Decimal(str(tax_amount))
+                account.tax_amount = tax_amount
                 
                 # Set tax status
                 account.tax_status = 'Current'
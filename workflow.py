@@ -1,17 +1,19 @@
 """
 This script is the main entry point for the workflow.
 It starts both the FastAPI service and Flask documentation.
+
+WORKFLOW_MODE selects the launch profile: "dev" runs FastAPI with
+auto-reload and the access log, "prod" (the default) runs a uvicorn worker
+per core without them. FASTAPI_APP names the ASGI application to serve.
 """
 
 import os
 import sys
 import subprocess
 import signal
-import time
-import threading
 import logging
-import requests
 from dotenv import load_dotenv
+from process_utils import FASTAPI_APP, WORKFLOW_MODE, wait_for_child_exit, wait_for_http_ready
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The services inherit this process's stdout and stderr, so their logs go
+# straight to the console instead of being relayed line by line through Python
+
 # Global variables to store processes
 fastapi_process = None
 flask_process = None
@@ -36,15 +41,6 @@ FASTAPI_URL = os.environ.get("FASTAPI_URL", "http://localhost:8000")
 os.environ["FASTAPI_URL"] = FASTAPI_URL
 logger.info(f"FastAPI URL set to: {FASTAPI_URL}")
 
-def log_output(process, service_name):
-    """Monitor and log process output."""
-    for line in iter(process.stdout.readline, b''):
-        try:
-            decoded_line = line.decode('utf-8').rstrip()
-            logger.info(f"[{service_name}] {decoded_line}")
-        except Exception as e:
-            logger.error(f"Error logging output from {service_name}: {str(e)}")
-
 def start_fastapi():
     """Start the FastAPI application."""
     global fastapi_process
@@ -88,34 +84,16 @@ def start_fastapi():
         
         fastapi_process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False,
             env=env
         )
         
-        # Start a thread to monitor and log FastAPI output
-        threading.Thread(
-            target=log_output,
-            args=(fastapi_process, "FastAPI"),
-            daemon=True
-        ).start()
-        
         # Wait for FastAPI to initialize
         logger.info("FastAPI service starting. Waiting for initialization...")
         
         # Wait up to 60 seconds for FastAPI to start up - increased timeout for more reliability
-        for attempt in range(60):
-            try:
-                response = requests.get(f"{FASTAPI_URL}/health", timeout=1)
-                if response.status_code == 200:
-                    logger.info(f"FastAPI is running and healthy after {attempt+1} attempts: {response.text}")
-                    return True
-            except requests.exceptions.RequestException:
-                if attempt % 10 == 0:  # Log only occasionally to avoid cluttering logs
-                    logger.info(f"Waiting for FastAPI (attempt {attempt+1}/60)...")
-            time.sleep(1)
+        if wait_for_http_ready(f"{FASTAPI_URL}/health", timeout=60, process=fastapi_process):
+            logger.info("FastAPI is running and healthy")
+            return True
             
         # Check if the process is still running
         if fastapi_process and fastapi_process.poll() is None:
@@ -147,7 +125,7 @@ def start_flask():
             pass
         
         # Start Flask service using gunicorn
-        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "--reload", "main:app"]
+        cmd = ["gunicorn", "--bind", "0.0.0.0:5000", "--reuse-port", "main:app"]
         logger.info(f"Starting Flask service: {' '.join(cmd)}")
         
         # Set environment variables
@@ -156,32 +134,15 @@ def start_flask():
         
         flask_process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            bufsize=1,
-            universal_newlines=False,
             env=env
         )
         
-        # Start a thread to monitor and log Flask output
-        threading.Thread(
-            target=log_output,
-            args=(flask_process, "Flask"),
-            daemon=True
-        ).start()
-        
         logger.info("Flask service starting. Waiting for initialization...")
         
         # Wait up to 30 seconds for Flask to start up
-        for _ in range(30):
-            try:
-                response = requests.get("http://localhost:5000/", timeout=1)
-                if response.status_code == 200:
-                    logger.info("Flask is running and healthy")
-                    return True
-            except requests.exceptions.RequestException:
-                pass
-            time.sleep(1)
+        if wait_for_http_ready("http://localhost:5000/", timeout=30, process=flask_process):
+            logger.info("Flask is running and healthy")
+            return True
             
         # Check if the process is still running
         if flask_process and flask_process.poll() is None:
@@ -230,6 +191,7 @@ def main():
     logger.info("=" * 80)
     logger.info("Starting MCP Assessor Agent API services")
     logger.info("=" * 80)
+    logger.info(f"Workflow mode: {WORKFLOW_MODE}, FastAPI app: {FASTAPI_APP}")
     
     # Start FastAPI service first
     logger.info("Starting services separately")
@@ -264,8 +226,8 @@ def main():
                 cleanup()
                 return 1
             
-            # Sleep briefly before checking again
-            time.sleep(1)
+            # Sleep until a service exits instead of polling
+            wait_for_child_exit([fastapi_process, flask_process])
     
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")